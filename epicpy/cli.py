@@ -19,7 +19,11 @@ along with this program.  If not, see <https://www.gnu.org/licenses/>.
 """
 
 import argparse
+import json
+import os
 import platform
+from dataclasses import fields
+from pathlib import Path
 
 from rich.console import Console
 
@@ -70,6 +74,356 @@ def do_cleanup(app_name: str) -> int:
         return 1
 
 
+def _device_config_defaults(device_file: Path) -> dict:
+    """
+    Read the saved per-device config json (if any) without touching the global config module,
+    so that headless runs pick up the same output, trace, and run settings as the GUI would.
+    """
+    device_name = device_file.stem.strip().replace(" ", "_")
+    config_file = Path(device_file.parent, f"{device_name}_config.json")
+    try:
+        return json.loads(config_file.read_text())
+    except (OSError, ValueError):
+        return {}
+
+
+def _result_cache_dir(cache_dir: str = "") -> Path:
+    if cache_dir:
+        return Path(cache_dir).expanduser().resolve()
+    from epicpy.epic.result_cache import CACHE_DIR_NAME
+    from epicpy.utils.config import get_config_dir
+
+    return get_config_dir() / CACHE_DIR_NAME
+
+
+def do_cache(args: argparse.Namespace) -> int:
+    """Show or invalidate the parallel run result cache. Return 0 on success."""
+    from epicpy.epic.result_cache import ResultCache
+
+    try:
+        cache = ResultCache(_result_cache_dir(args.cache_dir))
+        if args.cache_command == "clear":
+            removed = cache.clear(device_file=args.device)
+            _console.print(f"[green]Removed {removed} cached result(s) from {cache.cache_dir}.[/green]")
+        else:
+            _console.print(f"Result cache at {cache.cache_dir}: {cache.size_bytes() / 1024**2:.1f} MB")
+        return 0
+    except OSError as e:
+        _console.print(f"[red]Unable to access the result cache:[/red] {e}")
+        return 1
+
+
+def do_run(args: argparse.Namespace) -> int:
+    """
+    Run a device + ruleset(s) to completion without Qt. Return 0 if every run succeeded.
+    """
+    # Imported here so that other subcommands (and the GUI) don't pay for loading epiclibcpp
+    from epicpy.epic.parallel_simulation import BranchPoint, create_sim_configs_from_run_infos
+    from epicpy.epic.run_info import RunInfo
+    from epicpy.epic.sweep_manifest import SWEEP_DIR_NAME, sweep_base_seed
+
+    device_file = Path(args.device).expanduser().resolve()
+    if not device_file.is_file():
+        _console.print(f"[red]Device file not found:[/red] {device_file}")
+        return 2
+
+    rule_files = [Path(rule).expanduser().resolve() for rule in args.rules]
+    missing = [str(rule) for rule in rule_files if not rule.is_file()]
+    if missing:
+        _console.print(f"[red]Rule file(s) not found:[/red] {', '.join(missing)}")
+        return 2
+
+    # Start from the device's saved settings, then apply any command-line overrides
+    device_cfg = _device_config_defaults(device_file)
+    output_settings = _output_settings(device_cfg, args)
+
+    param_string = args.params if args.params is not None else device_cfg.get("device_params", "")
+    run_command = args.run_command or device_cfg.get("run_command", "run_until_done")
+    run_command_value = args.run_value if args.run_value is not None else int(device_cfg.get("run_command_value", 0))
+    visual_encoder = args.visual_encoder if args.visual_encoder is not None else device_cfg.get("visual_encoder", "")
+    auditory_encoder = args.auditory_encoder if args.auditory_encoder is not None else device_cfg.get("auditory_encoder", "")
+
+    branch_point = None
+    if args.branch_at_ms or args.branch_state:
+        branch_point = BranchPoint(
+            parameter_string=args.warmup_params if args.warmup_params is not None else param_string,
+            at_time_ms=args.branch_at_ms,
+            at_state=args.branch_state,
+        )
+
+    # Without --seed, replications reuse the sweep's stored base seed, so --resume and --cache find the runs it already did
+    base_seed = args.seed
+    if base_seed is None and args.replications > 1:
+        base_seed = sweep_base_seed(_sweep_dir(args, device_file.parent / SWEEP_DIR_NAME))
+        _console.print(f"Replications use the sweep's base seed {base_seed} (set another with --seed).")
+
+    # Every rule file x permutation is one job set, so a parallel run spreads all of them over the workers
+    sim_configs = create_sim_configs_from_run_infos(
+        run_infos=[RunInfo(rule_file=str(rule_file)) for rule_file in rule_files],
+        device_file=str(device_file),
+        base_param_string=param_string,
+        output_settings=output_settings,
+        run_command=run_command,
+        run_command_value=run_command_value,
+        visual_encoder_file=visual_encoder,
+        auditory_encoder_file=auditory_encoder,
+        branch_point=branch_point,
+        replications=args.replications,
+        base_seed=base_seed,
+        **_run_options(args),
+    )
+
+    _console.print(f"[bold]Running {len(sim_configs)} simulation(s) of {device_file.name}...[/bold]")
+    workers = max(1, args.workers)
+    parallel = (workers > 1 and len(sim_configs) > 1) or args.cache or args.resume or args.data_format != "csv"
+    return _run_sim_configs(args, sim_configs, parallel, device_folder=device_file.parent)
+
+
+def do_script(args: argparse.Namespace) -> int:
+    """
+    Run a simulation script (see epicpy.epic.simulation_script) as one parallel job set without Qt.
+    Return 0 if every run succeeded.
+    """
+    from epicpy.epic.simulation_script import (
+        SimulationScriptError,
+        create_sim_configs_from_script,
+        load_simulation_script,
+        script_sweep_dir,
+    )
+
+    try:
+        script = load_simulation_script(args.script)
+    except SimulationScriptError as e:
+        _console.print(f"[red]Invalid simulation script:[/red] {e}")
+        return 2
+
+    # Each device's runs use that device's saved output and trace settings
+    output_settings = {device: _output_settings(_device_config_defaults(Path(device)), args) for device in script.device_files()}
+    sweep_dir = _sweep_dir(args, script_sweep_dir(script))
+    sim_configs = create_sim_configs_from_script(
+        script, output_settings[script.jobs[0].device_file], sweep_dir=sweep_dir, **_run_options(args)
+    )
+    for cfg in sim_configs:
+        cfg.output_settings = output_settings[cfg.device_file]
+
+    n_jobs = len(script.jobs)
+    _console.print(f"[bold]Running {len(sim_configs)} simulation(s) of {n_jobs} job(s) from {script.path.name}...[/bold]")
+    return _run_sim_configs(args, sim_configs, parallel=True, sweep_dir=sweep_dir if args.resume else None, merge_by_device=True)
+
+
+def _sweep_dir(args: argparse.Namespace, default: Path) -> Path:
+    """Where a sweep keeps its manifest and base seed: --sweep-dir if given, else default."""
+    return Path(args.sweep_dir).expanduser().resolve() if args.sweep_dir else default
+
+
+def _output_settings(device_cfg: dict, args: argparse.Namespace):
+    """A device's saved output and trace settings, with --no-trace applied."""
+    from epicpy.epic.parallel_simulation import OutputSettings
+
+    output_settings = OutputSettings(**{f.name: device_cfg[f.name] for f in fields(OutputSettings) if f.name in device_cfg})
+    if args.no_trace:
+        for f in fields(OutputSettings):
+            if f.name.startswith("trace_"):
+                setattr(output_settings, f.name, False)
+    return output_settings
+
+
+def _run_options(args: argparse.Namespace) -> dict:
+    """Per-run settings shared by every run of `epicpy run` and `epicpy script` (output capture and limits)."""
+    from epicpy.epic.parallel_simulation import CapturePolicy, JobLimits
+
+    return dict(
+        spill_outputs=not args.in_memory_outputs,
+        compress_outputs=args.compress_outputs,
+        output_capture={
+            name: CapturePolicy(mode=mode, tail_lines=args.tail_lines)
+            for name, mode in (("Normal_out", args.normal_capture), ("Trace_out", args.trace_capture))
+        },
+        limits=JobLimits(wall_seconds=args.max_wall_seconds, simulated_ms=args.max_sim_ms, rss_mb=args.max_rss_mb),
+    )
+
+
+def _report_result(result) -> None:
+    cfg = result.sim_config
+    label = f"{Path(cfg.rule_file).name}: {cfg.parameter_string or '(device default parameters)'}"
+    if cfg.seed is not None:
+        label += f" [replication {cfg.replication + 1}, seed {cfg.seed}]"
+    if result.resumed:
+        _console.print(f"  [cyan]RESUMED[/cyan] {label} (completed by an earlier run)")
+    elif result.cached:
+        _console.print(f"  [cyan]CACHED[/cyan] {label} -> simulated time: {result.simulated_time_ms}ms")
+    elif result.success:
+        _console.print(
+            f"  [green]SUCCESS[/green] {label} -> simulated time: {result.simulated_time_ms}ms, "
+            f"wall time: {result.run_time_seconds:.2f}s"
+        )
+    else:
+        _console.print(f"  [red]FAILED[/red] {label} -> {result.error_message}")
+        for line in result.output_tail:
+            _console.print(f"      {line}", style="dim", markup=False, highlight=False)
+
+
+def _run_sim_configs(
+    args: argparse.Namespace,
+    sim_configs: list,
+    parallel: bool,
+    device_folder: Path | None = None,
+    sweep_dir: Path | None = None,
+    merge_by_device: bool = False,
+) -> int:
+    """Run sim_configs (in parallel, or one by one in this process) and report the results. Return 0 if all succeeded."""
+    from epicpy.epic.parallel_simulation import run_parallel_simulations, run_single_simulation
+
+    result_cache = None
+    if args.cache:
+        from epicpy.epic.result_cache import ResultCache
+
+        result_cache = ResultCache(_result_cache_dir(args.cache_dir), max_bytes=args.cache_max_mb * 1024**2)
+
+    runtime_history = None
+    if not args.keep_order:
+        import sqlite3
+
+        from epicpy.epic.runtime_history import HISTORY_FILE_NAME, RuntimeHistory
+        from epicpy.utils.config import get_config_dir
+
+        try:
+            runtime_history = RuntimeHistory(get_config_dir() / HISTORY_FILE_NAME)
+        except sqlite3.Error as e:
+            _console.print(f"[yellow]Unable to open the run time history, runs will start in permutation order:[/yellow] {e}")
+
+    if parallel:
+        if args.sweep_dir:
+            sweep_dir = _sweep_dir(args, sweep_dir)
+        results = run_parallel_simulations(
+            sim_configs=sim_configs,
+            max_workers=max(1, min(args.workers, len(sim_configs))),
+            on_complete=_report_result,
+            device_folder=device_folder,
+            warm_workers=not args.cold_workers,
+            resume=args.resume,
+            sweep_dir=sweep_dir,
+            result_cache=result_cache,
+            runtime_history=runtime_history,
+            data_format=args.data_format,
+            legacy_csv=not args.no_csv,
+            staging=args.staging,
+            merge_by_device=merge_by_device,
+            batch_size=args.batch_size,
+        )
+    else:
+        # Serial runs happen in this process; each run resets the Coordinator and
+        # writes its data to the device folder just like a normal GUI run would.
+        results = []
+        for cfg in sim_configs:
+            result = run_single_simulation(cfg)
+            _report_result(result)
+            results.append(result)
+
+    for stream_name, out_file in (("Normal_out", args.normal_out), ("Trace_out", args.trace_out)):
+        if out_file:
+            with open(out_file, "w", encoding="utf-8") as f:
+                for result in results:
+                    f.writelines(f"{line}\n" for line in result.iter_output(stream_name))
+            _console.print(f"Saved {stream_name} to {out_file}")
+
+    failures = sum(1 for result in results if not result.success)
+    if failures:
+        _console.print(f"[red]{failures} of {len(results)} run(s) failed.[/red]")
+        return 1
+    _console.print(f"[green]All {len(results)} run(s) finished successfully.[/green]")
+    return 0
+
+
+def _add_run_options(parser: argparse.ArgumentParser):
+    """Options shared by `epicpy run` and `epicpy script`: parallel execution, output capture, limits and caching."""
+    parser.add_argument(
+        "--workers",
+        type=int,
+        default=1,
+        help="Number of worker processes for runs with multiple permutations/rule files (default: %(default)s).",
+    )
+    parser.add_argument(
+        "--max-wall-seconds", type=float, default=0, help="Stop and fail any run taking longer than this (default: no limit)."
+    )
+    parser.add_argument(
+        "--max-sim-ms", type=int, default=0, help="Stop and fail any run going past this simulated time (default: no limit)."
+    )
+    parser.add_argument(
+        "--max-rss-mb", type=int, default=0, help="Stop and fail any run using more memory than this (default: no limit)."
+    )
+    parser.add_argument(
+        "--keep-order",
+        action="store_true",
+        help="Start parallel runs in permutation order instead of slowest-first based on earlier run times.",
+    )
+    parser.add_argument(
+        "--batch-size",
+        type=int,
+        default=0,
+        help="Parallel runs sent to a worker at a time; 0 picks a size from earlier run times (default: %(default)s).",
+    )
+    parser.add_argument(
+        "--cold-workers",
+        action="store_true",
+        help="Rebuild the device, encoders and model for every parallel run instead of reusing them.",
+    )
+    parser.add_argument(
+        "--in-memory-outputs",
+        action="store_true",
+        help="Send parallel run output back to this process in memory instead of spilling it to temp files.",
+    )
+    parser.add_argument("--compress-outputs", action="store_true", help="gzip spilled parallel run output files.")
+    parser.add_argument(
+        "--data-format",
+        choices=["csv", "parquet", "arrow"],
+        default="csv",
+        help="Format of the merged data file of parallel runs: data_output.csv, .parquet or .arrow (default: %(default)s).",
+    )
+    parser.add_argument(
+        "--staging",
+        choices=["symlink", "hardlink", "copy"],
+        default="symlink",
+        help="How device subfolders are made available to parallel runs; 'hardlink' and 'copy' stage read-only files, "
+        "linking only files that are already read-only (default: %(default)s).",
+    )
+    parser.add_argument(
+        "--no-csv", action="store_true", help="With --data-format parquet or arrow, don't also write data_output.csv."
+    )
+    for stream_name in ("normal", "trace"):
+        parser.add_argument(
+            f"--{stream_name}-capture",
+            choices=["drop", "count", "tail", "full"],
+            default="full",
+            help=f"How much {stream_name.title()} output to keep from each run (default: full).",
+        )
+    parser.add_argument("--tail-lines", type=int, default=1000, help="Lines kept per run by 'tail' capture.")
+    parser.add_argument(
+        "--resume",
+        action="store_true",
+        help="Keep a manifest of the parallel sweep so it can be resumed: runs that an interrupted --resume sweep already "
+        "completed are skipped and their data merged with the new runs.",
+    )
+    parser.add_argument(
+        "--sweep-dir",
+        default="",
+        help="Folder for the parallel sweep manifest, which is kept whenever this is given "
+        "(default: .epicpy_sweep in the device folder, with --resume).",
+    )
+    parser.add_argument(
+        "--cache",
+        action="store_true",
+        help="Reuse cached results of runs whose device, rules, encoders and settings are unchanged, and cache new ones.",
+    )
+    parser.add_argument(
+        "--cache-dir", default="", help="Result cache folder (default: result_cache in the EPICpy config folder)."
+    )
+    parser.add_argument("--cache-max-mb", type=int, default=2048, help="Result cache size cap in MB (default: %(default)s).")
+    parser.add_argument("--no-trace", action="store_true", help="Disable all trace output regardless of device config.")
+    parser.add_argument("--normal-out", default="", help="Save Normal output of all runs to this file.")
+    parser.add_argument("--trace-out", default="", help="Save Trace output of all runs to this file.")
+
+
 def build_parser(__version__: str | None = None) -> argparse.ArgumentParser:
     parser = argparse.ArgumentParser(prog="epicpy", description="EPICpy command-line interface")
     if __version__ is not None:
@@ -91,4 +445,66 @@ def build_parser(__version__: str | None = None) -> argparse.ArgumentParser:
         help="Application name used by the launcher/shortcut (default: %(default)s).",
     )
 
+    # run subcommand
+    p_run = subparsers.add_parser("run", help="Run a device and ruleset(s) headless (no GUI).")
+    p_run.add_argument("device", help="Path to the EPICpy device (.py) file.")
+    p_run.add_argument("rules", nargs="+", help="One or more EPIC ruleset (.prs) files, run in the order given.")
+    p_run.add_argument(
+        "--params",
+        default=None,
+        help="Device parameter string; [a|b] permutations are expanded (default: value saved in device config).",
+    )
+    p_run.add_argument("--visual-encoder", default=None, help="Visual encoder (.py) file (default: device config).")
+    p_run.add_argument("--auditory-encoder", default=None, help="Auditory encoder (.py) file (default: device config).")
+    p_run.add_argument(
+        "--run-command",
+        choices=("run_until_done", "run_for", "run_until", "run_for_cycles"),
+        default=None,
+        help="How long to run each simulation (default: device config, or run_until_done).",
+    )
+    p_run.add_argument("--run-value", type=int, default=None, help="Value used by run_for/run_until/run_for_cycles.")
+    p_run.add_argument(
+        "--branch-at-ms",
+        type=int,
+        default=0,
+        help="Run a shared warm-up until this simulated time, then apply each permutation's parameters.",
+    )
+    p_run.add_argument(
+        "--branch-state",
+        default="",
+        help="Name of a device state constant that ends the shared warm-up (alternative to --branch-at-ms).",
+    )
+    p_run.add_argument(
+        "--warmup-params",
+        default=None,
+        help="Parameter string used during the shared warm-up (default: the --params value).",
+    )
+    p_run.add_argument(
+        "--replications", type=int, default=1, help="Seeded runs of each parameter permutation (default: %(default)s)."
+    )
+    p_run.add_argument(
+        "--seed",
+        type=int,
+        default=None,
+        help=(
+            "Base seed from which every run's seed is derived (default with --replications > 1: "
+            "the seed stored in the sweep folder, picked at random by its first replicated sweep)."
+        ),
+    )
+    _add_run_options(p_run)
+
+    # script subcommand
+    p_script = subparsers.add_parser("script", help="Run a simulation script (TOML or JSON batch of jobs) headless.")
+    p_script.add_argument("script", help="Path to the simulation script (.toml or .json).")
+    _add_run_options(p_script)
+    p_script.set_defaults(workers=max(1, (os.cpu_count() or 2) - 1))
+
+    # cache subcommand
+    p_cache = subparsers.add_parser("cache", help="Show or clear the parallel run result cache.")
+    p_cache.add_argument("cache_command", nargs="?", choices=["info", "clear"], default="info")
+    p_cache.add_argument("--device", default="", help="Only clear cached results of this device file.")
+    p_cache.add_argument(
+        "--cache-dir", default="", help="Result cache folder (default: result_cache in the EPICpy config folder)."
+    )
+
     return parser
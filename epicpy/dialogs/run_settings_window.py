@@ -81,6 +81,7 @@ class RunSettingsWin(QDialog):
         self.ui.pushButtonOK.clicked.connect(self.clicked_ok_button)
         self.ui.pushButtonRunContinuously.clicked.connect(self.clicked_continuous_button)
         self.ui.pushButtonDeleteData.clicked.connect(self.delete_device_data)
+        self.ui.spinBoxTimeDelay.valueChanged.connect(self.step_delay_changed)
 
         self.ui.pushButtonDeleteData.setVisible(self.data_delete_func is not None)
 
@@ -152,6 +153,9 @@ class RunSettingsWin(QDialog):
         self.ui.spinBoxTextRefreshSteps.setValue(int(config.device_cfg.text_refresh_value))
 
         self.ui.spinBoxTimeDelay.setValue(int(config.device_cfg.step_time_delay))
+        self.ui.spinBoxStepBudget.setValue(int(config.device_cfg.step_time_budget))
+        self.step_delay_changed(self.ui.spinBoxTimeDelay.value())
+        self.ui.spinBoxReplications.setValue(max(1, int(config.device_cfg.parallel_replications)))
 
         if config.device_cfg.device_params.strip():
             self.ui.lineEditDeviceParameters.setText(config.device_cfg.device_params.strip())
@@ -227,6 +231,8 @@ class RunSettingsWin(QDialog):
         config.device_cfg.text_refresh_value = self.ui.spinBoxTextRefreshSteps.value()
 
         config.device_cfg.step_time_delay = self.ui.spinBoxTimeDelay.value()
+        config.device_cfg.step_time_budget = self.ui.spinBoxStepBudget.value()
+        config.device_cfg.parallel_replications = self.ui.spinBoxReplications.value()
 
         # ====== helpful stuff
 
@@ -238,6 +244,10 @@ class RunSettingsWin(QDialog):
 
         self.hide()
 
+    def step_delay_changed(self, value: int):
+        # The run budget only applies without a per-step delay; with one, each refresh runs a single step
+        self.ui.spinBoxStepBudget.setEnabled(value == 0)
+
     def clicked_continuous_button(self):
         self.ui.radioButtonRunUntilDone.setChecked(True)
         self.ui.radioButtonRefreshNone.setChecked(True)
@@ -134,11 +134,11 @@ class Simulation(QObject):
             and not hasattr(self.auditory_encoder, "is_null_encoder")
         )
 
-    def call_for_display_refresh(self):
+    def call_for_display_refresh(self, steps: int = 1):
         current_time = self.instance.get_time()
         if config.device_cfg.display_refresh == "after_each_step":
             step_interval = int(config.device_cfg.display_refresh_value)
-            self.steps_since_last_display += 1
+            self.steps_since_last_display += steps
             if self.steps_since_last_display >= step_interval:
                 self.main_win.force_view_display(current_time)
                 self.steps_since_last_display = 0
@@ -804,17 +804,51 @@ class Simulation(QObject):
         self.run_start_time = timeit.default_timer()
         self.run_timer.singleShot(config.device_cfg.step_time_delay, self.run_next_cycle)
 
+    def keep_running(self, run_result: bool) -> bool:
+        return run_result and (
+            (config.device_cfg.run_command in ("run_for", "run_until") and self.run_time < self.run_time_limit)
+            or (config.device_cfg.run_command == "run_until_done")
+            or config.device_cfg.run_command == "run_for_cycles"
+            and self.steps_run < config.device_cfg.run_command_value
+        )
+
     def run_next_cycle(self):
+        """
+        Run the simulation for one timer tick, then schedule the next tick after step_time_delay msec.
+
+        With step_time_delay at 0, a tick keeps running 50 msec steps until step_time_budget msec of
+        wall-clock time are used up. With any delay set, the budget is not used and each tick runs a
+        single step, so the delay paces every step the way it always has.
+        """
         if self.main_win.run_state != RUNNING or self.stop_model_now:
             return
 
-        try:
-            self.instance.run_for(50)
-            self.call_for_display_refresh()
+        # With no per-step delay, keep running 50ms steps until the wall-clock budget for this
+        # timer tick is used up, then yield to the event loop. A budget of 0 means one step per tick.
+        if config.device_cfg.step_time_delay == 0:
+            budget = max(0, int(config.device_cfg.step_time_budget)) / 1000
+        else:
+            budget = 0.0
+        tick_start = timeit.default_timer()
+        steps_this_tick = 0
 
-            run_result = self.device.state != self.device.SHUTDOWN
-            self.run_time = self.model.get_time()
-            self.steps_run += 1
+        try:
+            while True:
+                self.instance.run_for(50)
+
+                run_result = self.device.state != self.device.SHUTDOWN
+                self.run_time = self.model.get_time()
+                self.steps_run += 1
+                steps_this_tick += 1
+
+                if (
+                    not self.keep_running(run_result)
+                    or self.instance.is_paused()
+                    or timeit.default_timer() - tick_start >= budget
+                ):
+                    break
+
+            self.call_for_display_refresh(steps_this_tick)
         except Exception as e:
             run_result = False
             msg = f"\nERROR: Run of {self.device.rule_filename} Stopped With Error:\n{e}"
@@ -831,12 +865,7 @@ class Simulation(QObject):
             Normal_out(f"\nRun of {self.device.rule_filename} Paused.\n")
             Info_out(f"Run of {self.device.rule_filename} Paused.\n")
 
-        if run_result and (
-            (config.device_cfg.run_command in ("run_for", "run_until") and self.run_time < self.run_time_limit)
-            or (config.device_cfg.run_command == "run_until_done")
-            or config.device_cfg.run_command == "run_for_cycles"
-            and self.steps_run < config.device_cfg.run_command_value
-        ):
+        if self.keep_running(run_result):
             # *** Still running, keep going
             self.run_timer.singleShot(config.device_cfg.step_time_delay, self.run_next_cycle)
         else:
@@ -25,9 +25,19 @@ Each simulation runs in a separate process with its own epiclibcpp globals,
 ensuring complete isolation of the Coordinator singleton and output streams.
 """
 
+import gzip
+import itertools
+import json
 import multiprocessing
 import os
+import platform
+import queue
+import signal
+import sqlite3
 import tempfile
+import time
+import traceback
+import warnings
 from typing import Literal
 
 # Set to True to force 'spawn' start method on Linux (matching Windows/macOS behavior).
@@ -40,11 +50,12 @@ if CHECK_MAC_WIN_MP:
         multiprocessing.set_start_method("spawn", force=False)
     except RuntimeError:
         pass  # Already set
+import threading
 from collections import deque
-from concurrent.futures import ProcessPoolExecutor, as_completed
-from dataclasses import dataclass, field
+from concurrent.futures import FIRST_COMPLETED, ProcessPoolExecutor, wait
+from dataclasses import astuple, dataclass, field, replace
 from pathlib import Path
-from typing import Callable
+from typing import TYPE_CHECKING, Any, Callable, Iterator
 
 import psutil
 
@@ -53,8 +64,17 @@ _DEFAULT_MAX_WORKERS = max(2, (psutil.cpu_count(logical=False) or 4) - 1)
 
 from epiclibcpp.epiclib import Model
 
+from epicpy.epic.result_cache import CachedResult, ResultCache
+from epicpy.epic.runtime_history import RuntimeHistory
+from epicpy.epic.sweep_manifest import SWEEP_DIR_NAME, SweepManifest, sweep_job_hash
 from epicpy.utils.param_utils import unpack_param_string
 
+if TYPE_CHECKING:
+    from epicpy.epic.run_info import RunInfo
+
+# Lines of output kept with a failed run's result to help diagnose it
+DIAGNOSTIC_TAIL_LINES = 40
+
 # Module-level temp directory
 _session_temp_dir: tempfile.TemporaryDirectory | None = None
 
@@ -108,6 +128,21 @@ class OutputSettings:
             trace_device=device_cfg.trace_device,
         )
 
+    @classmethod
+    def from_saved_device_config(cls, device_file: str | Path) -> "OutputSettings":
+        """The settings saved with device_file (in its <name>_config.json), with defaults for any not saved."""
+        from dataclasses import fields
+
+        device_file = Path(device_file)
+        config_file = device_file.with_name(f"{device_file.stem.strip().replace(' ', '_')}_config.json")
+        try:
+            saved = json.loads(config_file.read_text())
+        except (OSError, ValueError):
+            saved = {}
+        if not isinstance(saved, dict):
+            saved = {}
+        return cls(**{f.name: saved[f.name] for f in fields(cls) if f.name in saved})
+
 
 def _update_model_output_settings(model: Model, settings: OutputSettings):
     # set some output and tracing options
@@ -127,6 +162,25 @@ def _update_model_output_settings(model: Model, settings: OutputSettings):
     model.set_trace_device(settings.trace_device)
 
 
+def _split_lines(text: str) -> tuple[list[str], str]:
+    """
+    The complete lines of text (without their line endings) and the partial line after them, which
+    the next write continues. Every capture stream splits lines this way, so their line counts agree:
+    lines end at "\n", "\r" or "\r\n", while the other breaks of str.splitlines() stay part of the line.
+    A trailing "\r" is held back in case the next write starts with the "\n" of a "\r\n".
+    """
+    lines = []
+    pending = ""
+    for piece in text.splitlines(keepends=True):
+        pending += piece
+        if piece.endswith(("\n", "\r")):
+            lines.append(pending.rstrip("\r\n"))
+            pending = ""
+    if not pending and text.endswith("\r") and lines:
+        pending = lines.pop() + "\r"
+    return lines, pending
+
+
 class DequeStream:
     """A stream-like object that appends to a deque for capturing output.
 
@@ -134,41 +188,157 @@ class DequeStream:
     are added to the deque. Call flush() to push any remaining partial text.
     """
 
-    def __init__(self):
-        self.deque: deque[str] = deque()
+    def __init__(self, maxlen: int | None = None):
+        self.deque: deque[str] = deque(maxlen=maxlen)  # maxlen keeps only the last N lines
         self._partial_text: str = ""  # Buffer for text without trailing newline
+        self._appended: int = 0
 
     def write(self, text: str):
         """Append text to the deque, buffering partial lines until newline received."""
         if not text:
             return
 
-        # Prepend any buffered partial text
+        # Prepend any buffered partial text, and buffer the partial line at the end
+        lines, self._partial_text = _split_lines(self._partial_text + text)
+        self.deque.extend(lines)
+        self._appended += len(lines)
+
+    def flush(self):
+        """Flush any partial text to the deque."""
         if self._partial_text:
-            text = self._partial_text + text
+            self.deque.append(self._partial_text.rstrip("\r"))
+            self._appended += 1
             self._partial_text = ""
 
-        # Split keeping line endings to identify partial lines
-        lines = text.splitlines(keepends=True)
+    def close(self):
+        pass
+
+    @property
+    def line_count(self) -> int:
+        """Total lines written, including any that fell off the end of a bounded deque."""
+        return self._appended
+
 
-        for line in lines:
-            if line.endswith(("\n", "\r")):
-                # Complete line - strip the line ending and add to deque
-                self.deque.append(line.rstrip("\r\n"))
-            else:
-                # Partial line (no newline at end) - buffer it
-                self._partial_text = line
+class CountStream:
+    """A stream-like object that only counts the lines written to it, keeping none of the text but the current partial line."""
+
+    def __init__(self):
+        self.line_count: int = 0
+        self._partial_text: str = ""  # Buffer for text without trailing newline
+
+    def write(self, text: str):
+        if not text:
+            return
+        lines, self._partial_text = _split_lines(self._partial_text + text)
+        self.line_count += len(lines)
 
     def flush(self):
-        """Flush any partial text to the deque."""
         if self._partial_text:
-            self.deque.append(self._partial_text)
+            self.line_count += 1
             self._partial_text = ""
 
     def close(self):
         pass
 
 
+class FileStream:
+    """A stream-like object that writes complete lines straight to a (optionally gzipped) file.
+
+    Used instead of DequeStream when worker output is spilled to disk, so large outputs never
+    have to be held in memory or pickled back to the parent process.
+    """
+
+    SYNC_INTERVAL = 1.0  # secs between flushes to disk, so a killed worker still leaves most of its output behind
+
+    def __init__(self, path: Path, compress: bool = False):
+        self.path = path
+        self._file = gzip.open(path, "wt", encoding="utf-8") if compress else open(path, "w", encoding="utf-8")
+        self._partial_text: str = ""  # Buffer for text without trailing newline
+        self.line_count: int = 0
+        self._last_sync = time.monotonic()
+
+    def write(self, text: str):
+        """Write complete lines to the file, buffering partial lines until newline received."""
+        if not text:
+            return
+
+        # Prepend any buffered partial text, and buffer the partial line at the end
+        lines, self._partial_text = _split_lines(self._partial_text + text)
+        if lines:
+            self._file.write("\n".join(lines) + "\n")
+            self.line_count += len(lines)
+
+        now = time.monotonic()
+        if now - self._last_sync >= self.SYNC_INTERVAL:
+            self._file.flush()
+            self._last_sync = now
+
+    def flush(self):
+        """Flush any partial text to the file."""
+        if self._partial_text:
+            self._file.write(self._partial_text.rstrip("\r") + "\n")
+            self.line_count += 1
+            self._partial_text = ""
+
+    def close(self):
+        if not self._file.closed:
+            self.flush()
+            self._file.close()
+
+
+CaptureMode = Literal["drop", "count", "tail", "full"]
+
+
+@dataclass
+class CapturePolicy:
+    """
+    How a worker captures one output stream:
+      drop  - no Python stream is attached to the tee at all (cheapest, nothing is kept)
+      count - only the number of lines is recorded (in SimulationResult.output_line_counts)
+      tail  - only the last tail_lines lines are kept in memory
+      full  - every line is kept (in memory, or in a file if the config spills output)
+    """
+
+    mode: CaptureMode = "full"
+    tail_lines: int = 1000
+
+
+@dataclass
+class JobLimits:
+    """
+    Per-run limits (0 means no limit). A run that exceeds one is stopped and reported as failed,
+    with the tail of its output. Workers check the limits between 50ms chunks; if a worker stops
+    responding (e.g., stuck in a rule loop inside a single chunk), the sweep kills it once its
+    wall time or memory use is well past the limit.
+    """
+
+    wall_seconds: float = 0
+    simulated_ms: int = 0
+    rss_mb: int = 0
+
+    @property
+    def enabled(self) -> bool:
+        return bool(self.wall_seconds or self.simulated_ms or self.rss_mb)
+
+
+class SimulationLimitExceeded(Exception):
+    """Raised inside a worker when a run exceeds one of its JobLimits."""
+
+
+@dataclass
+class BranchPoint:
+    """
+    A warm-up phase shared by several configs. The warm-up runs with parameter_string until
+    the simulated time reaches at_time_ms or the device enters the state named by at_state
+    (e.g., a device state constant), and only then is each config's own parameter string
+    applied. On Linux the warm-up runs once and every variant is forked from it.
+    """
+
+    parameter_string: str = ""
+    at_time_ms: int = 0
+    at_state: str = ""
+
+
 @dataclass
 class SimulationConfig:
     """Configuration for a single parallel simulation run."""
@@ -182,6 +352,30 @@ class SimulationConfig:
     visual_encoder_file: str = ""
     auditory_encoder_file: str = ""
     temp_data_dir: str = ""  # Temp directory for isolated data output
+    spill_outputs: bool = False  # Write captured output to files in output_dir instead of returning it in memory
+    compress_outputs: bool = False  # gzip spilled output files
+    output_dir: str = ""  # Directory for spilled output files (run_parallel_simulations fills this in)
+    branch_point: BranchPoint | None = None  # Shared warm-up to run before this config's parameters apply
+    output_capture: dict[str, CapturePolicy] = field(default_factory=dict)  # By output name; missing means "full"
+    condition: int = 0  # Index of this config's parameter permutation within its sweep
+    replication: int = 0  # Index of this run among the replications of its permutation
+    seed: int | None = None  # Random number generator seed for this run (None leaves the generators alone)
+    limits: JobLimits = field(default_factory=JobLimits)  # Wall time, simulated time and memory limits of this run
+    job: int = 0  # Index of this config's RunInfo entry when several rule files run as one job set
+    keep_data: bool = True  # False if a later job of the set clears the data (RunInfo.clear_data), so it isn't merged
+    reload_device: bool = False  # Load a fresh device instead of reusing a warm worker's (RunInfo.reload_device)
+    after: tuple[int, ...] = ()  # Jobs (see job) whose runs must all finish successfully before this run starts
+
+    def capture_policy(self, name: str) -> CapturePolicy:
+        return self.output_capture.get(name) or CapturePolicy()
+
+    @property
+    def run_key(self) -> str:
+        """Identifies this run's temp files; the rule file keeps rulesets run with the same parameters apart."""
+        key = f"{self.rule_file}|{self.parameter_string}"
+        if self.job:
+            key = f"job{self.job}|{key}"
+        return f"{key}|rep{self.replication}" if self.replication else key
 
 
 @dataclass
@@ -195,13 +389,118 @@ class SimulationResult:
     run_time_seconds: float = 0.0
     simulated_time_ms: int = 0
     data_file: str = ""  # Path to the temp data file produced by this run
+    output_files: dict[str, str] = field(default_factory=dict)  # Spilled output files, by output name
+    output_line_counts: dict[str, int] = field(default_factory=dict)
+    resumed: bool = False  # True if this run was completed by an earlier, interrupted sweep
+    cached: bool = False  # True if this result came from the result cache instead of a new run
+    output_tail: list[str] = field(default_factory=list)  # Last lines of output of a failed run, for diagnosis
+
+    def iter_output(self, name: str) -> Iterator[str]:
+        """Yield the captured lines of output `name`, reading spilled output files lazily."""
+        if name in self.outputs:
+            yield from self.outputs[name]
+            return
+
+        file = self.output_files.get(name, "")
+        if not file or not Path(file).is_file():
+            return
+        opener = gzip.open if file.endswith(".gz") else open
+        with opener(file, "rt", encoding="utf-8") as f:
+            for line in f:
+                yield line.rstrip("\n")
+
 
+OutputStream = DequeStream | FileStream | CountStream
 
-def _setup_output_routing() -> dict[str, DequeStream]:
+
+def _output_file_path(sim_config: SimulationConfig, name: str) -> Path:
+    """Where a spilling run writes output `name`."""
+    import hashlib
+
+    run_hash = hashlib.md5(sim_config.run_key.encode()).hexdigest()[:12]
+    suffix = ".txt.gz" if sim_config.compress_outputs else ".txt"
+    return Path(sim_config.output_dir) / f"{run_hash}_{name}{suffix}"
+
+
+def _make_output_streams(sim_config: SimulationConfig | None = None) -> dict[str, OutputStream]:
+    """
+    Create the capture streams for one run according to the config's capture policies.
+    Streams whose policy is "drop" are left out entirely, so nothing gets attached to their tees.
+    Fully captured streams go to files when the config spills output, otherwise to deques.
+    """
+    names = ("Normal_out", "Trace_out", "Debug_out", "Stats_out", "Info_out")
+    if sim_config is None:
+        return {name: DequeStream() for name in names}
+
+    spill = sim_config.spill_outputs and sim_config.output_dir
+    if spill:
+        Path(sim_config.output_dir).mkdir(parents=True, exist_ok=True)
+
+    streams = {}
+    for name in names:
+        policy = sim_config.capture_policy(name)
+        if policy.mode == "drop":
+            continue
+        elif policy.mode == "count":
+            streams[name] = CountStream()
+        elif policy.mode == "tail":
+            streams[name] = DequeStream(maxlen=max(0, policy.tail_lines))
+        elif spill:
+            streams[name] = FileStream(_output_file_path(sim_config, name), sim_config.compress_outputs)
+        else:
+            streams[name] = DequeStream()
+    return streams
+
+
+def _new_result(sim_config: SimulationConfig, streams: dict[str, OutputStream]) -> SimulationResult:
+    """Create a (not yet successful) result whose outputs refer to the given capture streams."""
+    return SimulationResult(
+        sim_config=sim_config,
+        success=False,
+        outputs={name: stream.deque for name, stream in streams.items() if isinstance(stream, DequeStream)},
+        output_files={name: str(stream.path) for name, stream in streams.items() if isinstance(stream, FileStream)},
+    )
+
+
+def _close_output_streams(streams: dict[str, OutputStream], result: SimulationResult):
+    """Flush and close the capture streams and record how many lines each one received."""
+    for name, stream in streams.items():
+        try:
+            stream.flush()
+            stream.close()
+        except Exception:
+            pass
+        result.output_line_counts[name] = stream.line_count
+
+    if not result.success:
+        result.output_tail = _output_tail(result)
+
+
+def _output_tail(result: SimulationResult, lines: int = DIAGNOSTIC_TAIL_LINES) -> list[str]:
+    """The last lines of a run's Normal output (or Trace output if it has none), for diagnosing failures."""
+    for name in ("Normal_out", "Trace_out"):
+        tail: deque[str] = deque(maxlen=lines)
+        try:
+            for line in result.iter_output(name):
+                tail.append(line)
+        except (EOFError, OSError):
+            pass  # e.g., a compressed file cut short when its worker was killed
+        if tail:
+            return list(tail)
+    return []
+
+
+def _failure_message(e: Exception) -> str:
+    if isinstance(e, SimulationLimitExceeded):
+        return str(e)
+    return f"{e}\n{traceback.format_exc()}"
+
+
+def _setup_output_routing(sim_config: SimulationConfig | None = None) -> dict[str, OutputStream]:
     """
     Set up output routing for a worker process.
 
-    Returns a dict mapping output names to their DequeStream instances.
+    Returns a dict mapping output names to their capture streams (see _make_output_streams).
     """
     # import epiclibcpp.epiclib.output_tee_globals as outputs
     from epiclibcpp.epiclib.output_tee_globals import (
@@ -215,33 +514,50 @@ def _setup_output_routing() -> dict[str, DequeStream]:
     )
     from epiclibcpp.epiclib.pps_globals import PPS_out
 
-    streams = {
-        "Normal_out": DequeStream(),
-        "Trace_out": DequeStream(),
-        "Debug_out": DequeStream(),
-        "Stats_out": DequeStream(),
-        "Info_out": DequeStream(),
-    }
+    streams = _make_output_streams(sim_config)
 
-    # Route Normal_out, Debug_out, Device_out, Exception_out, and PPS_out to the same Normal_out stream
-    normal_stream = streams["Normal_out"]
-    for tee in [Normal_out, Debug_out, Device_out, Exception_out, PPS_out]:
+    # Route Normal_out, Debug_out, Device_out, Exception_out, and PPS_out to the same Normal_out stream,
+    # and Trace_out, Stats_out and Info_out separately. Dropped outputs get no Python stream at all.
+    routes = [(tee, "Normal_out") for tee in (Normal_out, Debug_out, Device_out, Exception_out, PPS_out)]
+    routes += [(Trace_out, "Trace_out"), (Stats_out, "Stats_out"), (Info_out, "Info_out")]
+    for tee, name in routes:
         tee.clear_py_streams()
-        tee.add_py_stream(normal_stream)
+        if name in streams:
+            tee.add_py_stream(streams[name])
 
-    # Route Trace_out separately
-    Trace_out.clear_py_streams()
-    Trace_out.add_py_stream(streams["Trace_out"])
+    return streams
 
-    # Route Stats_out separately
-    Stats_out.clear_py_streams()
-    Stats_out.add_py_stream(streams["Stats_out"])
 
-    # Route Info_out separately
-    Info_out.clear_py_streams()
-    Info_out.add_py_stream(streams["Info_out"])
+# Encoder modules already executed by this process: resolved path -> ((mtime_ns, size), module)
+_encoder_modules: dict[Path, tuple[tuple[int, int], Any]] = {}
 
-    return streams
+
+def _encoder_module(encoder_path: Path):
+    """
+    The module of an encoder file, executed once per process and reused until the file changes,
+    so each run of a sweep only has to construct fresh encoder instances.
+    """
+    import sys
+
+    from epicpy.utils.module_reloader import load_module, unload_module
+
+    path = encoder_path.resolve()
+    st = path.stat()
+    signature = (st.st_mtime_ns, st.st_size)
+    cached = _encoder_modules.get(path)
+    if cached is not None and cached[0] == signature:
+        return cached[1]
+    if cached is not None:
+        unload_module(cached[1].__name__)
+
+    # load_module gives each version of the file its own module name, but the encoder may import
+    # helper modules that sit next to it
+    encoder_dir = str(path.parent)
+    if encoder_dir not in sys.path:
+        sys.path.insert(0, encoder_dir)
+    mod = load_module(path)
+    _encoder_modules[path] = (signature, mod)
+    return mod
 
 
 def _load_encoder(encoder_file: str, kind: Literal["Visual", "Auditory"], output_stream) -> tuple:
@@ -249,9 +565,6 @@ def _load_encoder(encoder_file: str, kind: Literal["Visual", "Auditory"], output
     Load an encoder from a file, or return a null encoder if no file is provided.
     Returns tuple of (encoder_instance, status_message)
     """
-    import importlib
-    import sys
-
     from epicpy.epic.encoder_passthru import NullAuditoryEncoder, NullVisualEncoder
 
     if not encoder_file:
@@ -264,20 +577,14 @@ def _load_encoder(encoder_file: str, kind: Literal["Visual", "Auditory"], output
     encoder_path = Path(encoder_file)
     if not encoder_path.is_file():
         # File doesn't exist, fall back to null encoder
+        warnings.warn(f"{kind} encoder file not found: {encoder_file}; using the null encoder instead.")
         if kind == "Visual":
             return NullVisualEncoder("NullVisualEncoder", None), f"{kind}: File not found: {encoder_file}"
         else:
             return NullAuditoryEncoder("NullAuditoryEncoder", None), f"{kind}: File not found: {encoder_file}"
 
-    # Add encoder directory to path
-    encoder_dir = str(encoder_path.parent)
-    if encoder_dir not in sys.path:
-        sys.path.insert(0, encoder_dir)
-
     try:
-        # Import the encoder module
-        mod = importlib.import_module(encoder_path.stem)
-        mod = importlib.reload(mod)
+        mod = _encoder_module(encoder_path)
 
         # Create encoder instance
         encoder_name = encoder_path.stem.replace("_", " ").title()
@@ -292,211 +599,490 @@ def _load_encoder(encoder_file: str, kind: Literal["Visual", "Auditory"], output
         return encoder, f"{kind}: Loaded {encoder_path.name} successfully"
     except Exception as e:
         # Fall back to null encoder on any error
+        warnings.warn(f"Unable to load {kind.lower()} encoder {encoder_file} ({e}); using the null encoder instead.")
         if kind == "Visual":
             return NullVisualEncoder("NullVisualEncoder", None), f"{kind}: FAILED to load {encoder_file}: {e}"
         else:
             return NullAuditoryEncoder("NullAuditoryEncoder", None), f"{kind}: FAILED to load {encoder_file}: {e}"
 
 
-def run_single_simulation(sim_config: SimulationConfig) -> SimulationResult:
-    """
-    Run a single simulation in an isolated process.
+@dataclass
+class _LoadedSimulation:
+    """A device, model and encoders that have been built and compiled, ready to be (re)run."""
+
+    key: tuple
+    instance: Any
+    device: Any
+    model: Any
+    visual_encoder: Any
+    auditory_encoder: Any
+    encoder_status: str
+
+
+def _simulation_key(sim_config: SimulationConfig) -> tuple:
+    """Everything that determines how a simulation is built (but not how it is run)."""
+    return (
+        sim_config.device_file,
+        sim_config.rule_file,
+        sim_config.visual_encoder_file,
+        sim_config.auditory_encoder_file,
+        sim_config.temp_data_dir,
+        astuple(sim_config.output_settings),
+        astuple(sim_config.branch_point) if sim_config.branch_point is not None else None,
+    )
 
-    This function is designed to be called via ProcessPoolExecutor.
-    Each worker process gets its own copy of epiclibcpp with independent
-    global state (Coordinator singleton, output streams, etc.).
-    """
-    import sys
-    import timeit
 
+def _use_non_gui_backend():
     # Set matplotlib to non-GUI backend BEFORE any imports that might pull it in.
     # This prevents Qt initialization in worker processes (epicpydevicelib imports matplotlib).
     import matplotlib
 
     matplotlib.use("Agg")
 
-    # Set up output capture first
-    streams = _setup_output_routing()
 
-    result = SimulationResult(
-        sim_config=sim_config,
-        success=False,
-        outputs={name: stream.deque for name, stream in streams.items()},
-    )
+# How device subfolders are made available to parallel runs (see stage_device_folders)
+StagingMode = Literal["symlink", "hardlink", "copy"]
 
-    try:
-        # Import here so each process loads its own epiclibcpp
-        from epiclibcpp.epiclib import Coordinator, Model, set_auditory_encoder_ptr, set_visual_encoder_ptr
-        from epiclibcpp.epiclib.output_tee_globals import Normal_out
-
-        from epicpy.utils.module_reloader import make_device
-
-        # Load the device
-        device_path = Path(sim_config.device_file)
-        if not device_path.is_file():
-            result.error_message = f"Device file not found: {sim_config.device_file}"
-            return result
-
-        # Add device directory to path
-        device_dir = str(device_path.parent)
-        if device_dir not in sys.path:
-            sys.path.insert(0, device_dir)
-
-        # Reset coordinator BEFORE creating device (Device registers Device_processor on creation)
-        instance = Coordinator.get_instance()
-        instance.reset()
-
-        # Create device (make_device returns tuple of (device, module_name))
-        # Device constructor creates Device_processor and registers it with Coordinator
-        device, _modname = make_device(
-            device_path,
-            ot=Normal_out,
-            device_folder=device_path.parent,
-        )
-        if device is None:
-            result.error_message = f"Failed to create device from: {sim_config.device_file}"
-            return result
+# Device subfolders that are never staged, besides hidden folders (e.g., the sweep manifest's) and the
+# data_output.parts folders of merges in progress
+_UNSTAGED_FOLDERS = {"__pycache__"}
 
-        # Redirect device data output to temp directory if specified
-        if sim_config.temp_data_dir:
-            import hashlib
-
-            param_hash = hashlib.md5(sim_config.parameter_string.encode()).hexdigest()[:12]
-            temp_data_filename = f"data_output_{param_hash}.csv"
-            device.data_filename = temp_data_filename
-            device.data_filepath = Path(sim_config.temp_data_dir) / temp_data_filename
-
-            # Symlink subdirectories from original device folder into temp dir
-            # This allows devices that use data_filepath.parent to find input files
-            for item in device_path.parent.iterdir():
-                if item.is_dir():
-                    link_path = Path(sim_config.temp_data_dir) / item.name
-                    if link_path.exists():
-                        continue  # Already created by another worker
-                    try:
-                        # target_is_directory=True is required for directory symlinks on Windows
-                        os.symlink(item, link_path, target_is_directory=True)
-                    except FileExistsError:
-                        pass  # Another worker already created this symlink
-                    except OSError:
-                        # Symlink failed (e.g., Windows without Developer Mode or admin rights)
-                        # Fall back to copying the directory
-                        import shutil
-
-                        try:
-                            shutil.copytree(item, link_path)
-                        except FileExistsError:
-                            pass  # Another worker already copied this
-
-            device.init_data_output()
-            result.data_file = str(device.data_filepath)
-
-        # Create model (this registers Human_processor with the Coordinator)
-        model = Model(device)
-
-        # Set up encoders - these connect device output to the model
-        visual_encoder, visual_status = _load_encoder(sim_config.visual_encoder_file, "Visual", Normal_out)
-        auditory_encoder, auditory_status = _load_encoder(sim_config.auditory_encoder_file, "Auditory", Normal_out)
-        encoder_status = f"{visual_status}; {auditory_status}"
-        set_visual_encoder_ptr(model, visual_encoder)
-        set_auditory_encoder_ptr(model, auditory_encoder)
-
-        # Connect device and human processors for event communication
-        model.interconnect_device_and_human()
-
-        # Setup what model output is needed
-        _update_model_output_settings(model, sim_config.output_settings)
-
-        # Compile rules
-        rule_path = Path(sim_config.rule_file)
-        if not rule_path.is_file():
-            result.error_message = f"Rule file not found: {sim_config.rule_file}"
-            return result
-
-        model.set_prs_filename(str(rule_path))
-        if not model.compile():
-            result.error_message = f"Rule compilation failed: {sim_config.rule_file}"
-            return result
-
-        # Set rule_filename on device (for data output)
-        if hasattr(device, "rule_filename"):
-            device.rule_filename = rule_path.name
-
-        # Initialize (order matters: instance first, then encoders, then model)
-        instance.initialize()
-
-        # Initialize encoders (required for device to receive events)
-        if hasattr(visual_encoder, "initialize"):
-            visual_encoder.initialize()
-        if hasattr(auditory_encoder, "initialize"):
-            auditory_encoder.initialize()
-
-        model.initialize()
-
-        # Set parameter string AFTER model.initialize() - this matches the main simulation
-        device.set_parameter_string(sim_config.parameter_string)
-
-        run_start = timeit.default_timer()
-
-        # Determine run duration limit
-        if sim_config.run_command == "run_until_done":
-            run_time_limit = sys.maxsize
-        elif sim_config.run_command == "run_for":
-            run_time_limit = sim_config.run_command_value
-        elif sim_config.run_command == "run_until":
-            run_time_limit = sim_config.run_command_value
-        elif sim_config.run_command == "run_for_cycles":
-            run_time_limit = sim_config.run_command_value * 50
-        else:
-            run_time_limit = sys.maxsize
+# Folders staged into the session temp dir: target -> (source, requested mode, content signature or None)
+_staged_folders: dict[Path, tuple[Path, str, int | None]] = {}
 
-        # Run the simulation in chunks (like the main simulation does)
-        # This allows the device to process events between chunks
-        CHUNK_SIZE = 50  # 50ms per chunk, same as main simulation
-        chunk_count = 0
-        while True:
+
+def device_temp_dir(temp_dir: Path, device_folder: str | Path) -> Path:
+    """
+    The folder in temp_dir where runs of the device in device_folder write their data and find its
+    staged subfolders. Each device folder gets its own, so same-named subfolders (stimuli, etc.) of
+    different devices don't collide.
+    """
+    import hashlib
+
+    key = hashlib.md5(str(Path(device_folder).expanduser().resolve()).encode()).hexdigest()[:12]
+    return temp_dir / f"device_{key}"
+
+
+def _folder_signature(folder: Path) -> int:
+    """Cheap fingerprint of a folder tree (file paths, sizes and modification times)."""
+    entries = []
+    for root, _dirs, files in os.walk(folder):
+        for name in files:
+            st = os.stat(os.path.join(root, name))
+            entries.append((os.path.relpath(os.path.join(root, name), folder), st.st_size, st.st_mtime_ns))
+    return hash(tuple(sorted(entries)))
+
+
+def _read_only(path: str):
+    import stat
+
+    os.chmod(path, stat.S_IREAD | stat.S_IRGRP | stat.S_IROTH)
+
+
+def _stage_folder(source: Path, target: Path, mode: StagingMode) -> StagingMode:
+    """Stage one folder at target, returning the mode actually used."""
+    import shutil
+    import stat
+
+    if mode == "symlink":
+        try:
+            # target_is_directory=True is required for directory symlinks on Windows
+            os.symlink(source, target, target_is_directory=True)
+            return "symlink"
+        except OSError:
+            mode = "hardlink"  # e.g., Windows without Developer Mode or admin rights
+
+    if mode == "hardlink":
+
+        def link_or_copy(src, dst):
+            # A hard link is the source file itself, permissions included, so only files that are already
+            # read-only are linked. Writable files are copied and the copies marked read-only.
+            if not os.stat(src).st_mode & (stat.S_IWUSR | stat.S_IWGRP | stat.S_IWOTH):
+                try:
+                    os.link(src, dst)
+                    return dst
+                except OSError:
+                    pass  # e.g., the temp dir is on another drive
+            shutil.copy2(src, dst)
+            _read_only(dst)
+            return dst
+
+        shutil.copytree(source, target, copy_function=link_or_copy)
+    else:
+        shutil.copytree(source, target)
+        for root, _dirs, files in os.walk(target):
+            for name in files:
+                _read_only(os.path.join(root, name))
+    return mode
+
+
+def _unstage_folder(target: Path, source: Path):
+    import shutil
+    import stat
+
+    def remove_read_only(func, path, _exc_info):
+        # Windows won't remove read-only files. Clearing the flag of a hard link clears it on the
+        # file in source as well, so it is put back once the link is gone.
+        linked = os.stat(path).st_nlink > 1
+        os.chmod(path, stat.S_IREAD | stat.S_IWRITE)
+        func(path)
+        if linked:
+            _read_only(str(source / os.path.relpath(path, target)))
+
+    if target.is_symlink() or target.is_file():
+        target.unlink()
+    elif target.is_dir():
+        shutil.rmtree(target, onerror=remove_read_only)
+
+
+def stage_device_folders(sim_configs: list[SimulationConfig], temp_dir: Path, mode: StagingMode = "symlink"):
+    """
+    Make the subfolders of each device's folder available in its temp data dir (see device_temp_dir),
+    so that devices which find their input files relative to data_filepath.parent still find them in
+    parallel runs.
+
+    This happens once per sweep, in the parent process, before any run starts. "symlink" links
+    each subfolder (falling back to "hardlink" where symlinks aren't allowed), so runs see, and can
+    change, the device's own files. "hardlink" and "copy" stage read-only files, so a run can't change
+    the device's files. "hardlink" rebuilds each subfolder's tree from hard links to its read-only
+    files. Writable files are copied instead, since a link to one would be writable too, and so are
+    files that can't be linked (e.g., across drives). To have a large stimulus folder linked rather
+    than copied, make its files read-only. "copy" copies every file. Hardlinked and copied folders
+    are kept for later sweeps of the session until their source folder changes.
+    """
+    for device_folder in dict.fromkeys(Path(cfg.device_file).parent for cfg in sim_configs):
+        if not device_folder.is_dir():
+            continue
+        device_dir = device_temp_dir(temp_dir, device_folder)
+        device_dir.mkdir(parents=True, exist_ok=True)
+        for source in device_folder.iterdir():
+            if not source.is_dir() or source.name.startswith((".", "data_output.parts")) or source.name in _UNSTAGED_FOLDERS:
+                continue
+            target = device_dir / source.name
             try:
-                instance.run_for(CHUNK_SIZE)
-            except RuntimeError as e:
-                # Capture the error with more context
-                current_time = model.get_time()
-                raise RuntimeError(
-                    f"{e}\n[Debug: chunk={chunk_count}, sim_time={current_time}ms, "
-                    f"device_state={device.state}, param='{sim_config.parameter_string}']\n"
-                    f"[Encoders: {encoder_status}]"
-                ) from None
+                staged = _staged_folders.get(target)
+                if staged and staged[:2] == (source, mode) and os.path.lexists(target):
+                    if staged[2] is None or staged[2] == _folder_signature(source):
+                        continue
+                if os.path.lexists(target):
+                    _unstage_folder(target, source)
+                used = _stage_folder(source, target, mode)
+                _staged_folders[target] = (source, mode, None if used == "symlink" else _folder_signature(source))
+            except OSError as e:
+                _staged_folders.pop(target, None)
+                warnings.warn(f"Unable to stage {source} for parallel runs: {e}")
+
+
+def _load_simulation(sim_config: SimulationConfig, result: SimulationResult) -> _LoadedSimulation | None:
+    """
+    Create the device, model and encoders for sim_config and compile its rules.
+    On failure, sets result.error_message and returns None.
+    """
+    import sys
+
+    # Import here so each process loads its own epiclibcpp
+    from epiclibcpp.epiclib import Coordinator, set_auditory_encoder_ptr, set_visual_encoder_ptr
+    from epiclibcpp.epiclib.output_tee_globals import Normal_out
+
+    from epicpy.utils.module_reloader import make_device
+
+    # Load the device
+    device_path = Path(sim_config.device_file)
+    if not device_path.is_file():
+        result.error_message = f"Device file not found: {sim_config.device_file}"
+        return None
+
+    # Add device directory to path
+    device_dir = str(device_path.parent)
+    if device_dir not in sys.path:
+        sys.path.insert(0, device_dir)
+
+    # Reset coordinator BEFORE creating device (Device registers Device_processor on creation)
+    instance = Coordinator.get_instance()
+    instance.reset()
+
+    # Create device (make_device returns tuple of (device, module_name))
+    # Device constructor creates Device_processor and registers it with Coordinator
+    device, _modname = make_device(
+        device_path,
+        ot=Normal_out,
+        device_folder=device_path.parent,
+    )
+    if device is None:
+        result.error_message = f"Failed to create device from: {sim_config.device_file}"
+        return None
+
+    # Create model (this registers Human_processor with the Coordinator)
+    model = Model(device)
+
+    # Set up encoders - these connect device output to the model
+    visual_encoder, visual_status = _load_encoder(sim_config.visual_encoder_file, "Visual", Normal_out)
+    auditory_encoder, auditory_status = _load_encoder(sim_config.auditory_encoder_file, "Auditory", Normal_out)
+    encoder_status = f"{visual_status}; {auditory_status}"
+    set_visual_encoder_ptr(model, visual_encoder)
+    set_auditory_encoder_ptr(model, auditory_encoder)
+
+    # Connect device and human processors for event communication
+    model.interconnect_device_and_human()
+
+    # Setup what model output is needed
+    _update_model_output_settings(model, sim_config.output_settings)
+
+    # Compile rules
+    rule_path = Path(sim_config.rule_file)
+    if not rule_path.is_file():
+        result.error_message = f"Rule file not found: {sim_config.rule_file}"
+        return None
+
+    model.set_prs_filename(str(rule_path))
+    if not model.compile():
+        result.error_message = f"Rule compilation failed: {sim_config.rule_file}"
+        return None
+
+    # Set rule_filename on device (for data output)
+    if hasattr(device, "rule_filename"):
+        device.rule_filename = rule_path.name
+
+    return _LoadedSimulation(
+        key=_simulation_key(sim_config),
+        instance=instance,
+        device=device,
+        model=model,
+        visual_encoder=visual_encoder,
+        auditory_encoder=auditory_encoder,
+        encoder_status=encoder_status,
+    )
+
+
+def _redirect_data_output(device, sim_config: SimulationConfig, name_key: str, prefix: str = "") -> str:
+    """Point the device's data output at a file in sim_config.temp_data_dir named after name_key."""
+    import hashlib
+
+    name_hash = hashlib.md5(name_key.encode()).hexdigest()[:12]
+    temp_data_filename = f"data_output_{prefix}{name_hash}.csv"
+    device.data_filename = temp_data_filename
+    device.data_filepath = Path(sim_config.temp_data_dir) / temp_data_filename
+    device.init_data_output()
+    return str(device.data_filepath)
+
+
+def _finalize_data_output(device):
+    """Flush and close the device's data file so its contents are complete on disk."""
+    if hasattr(device, "finalize_data_output"):
+        device.finalize_data_output()
+    elif getattr(device, "data_file", None) is not None:
+        device.data_file.close()
+
+
+def _run_time_limit(model, sim_config: SimulationConfig) -> int:
+    """Simulated time (ms) at which the run should stop, given the current model time."""
+    import sys
+
+    if sim_config.run_command == "run_until_done":
+        return sys.maxsize
+    elif sim_config.run_command == "run_for":
+        return model.get_time() + sim_config.run_command_value
+    elif sim_config.run_command == "run_until":
+        return sim_config.run_command_value
+    elif sim_config.run_command == "run_for_cycles":
+        return model.get_time() + sim_config.run_command_value * 50
+    else:
+        return sys.maxsize
+
+
+def _seed_random_generators(seed: int | None):
+    """Seed EPIC's random number generator and Python's (which devices and encoders use)."""
+    if seed is None:
+        return
+    import random
 
+    from epiclibcpp.epiclib.random_utilities import set_random_number_generator_seed
+
+    set_random_number_generator_seed(seed)
+    random.seed(seed)
+
+
+def _initialize_loaded_simulation(loaded: _LoadedSimulation, sim_config: SimulationConfig, result: SimulationResult):
+    """Initialize an already loaded simulation and apply its (first) parameter string."""
+    instance, device, model = loaded.instance, loaded.device, loaded.model
+    branch = sim_config.branch_point
+
+    # Redirect device data output to temp directory if specified
+    if sim_config.temp_data_dir:
+        if branch is None:
+            result.data_file = _redirect_data_output(device, sim_config, sim_config.run_key)
+        else:
+            # Warm-up data goes to its own file, which is not merged with the variants' data
+            _redirect_data_output(device, sim_config, f"{sim_config.rule_file}|{branch.parameter_string}", prefix="prefix_")
+
+    # Replications are seeded before anything gets a chance to draw random numbers.
+    # Branched configs share an unseeded warm-up and are seeded at the branch point instead.
+    if branch is None:
+        _seed_random_generators(sim_config.seed)
+
+    # Initialize (order matters: instance first, then encoders, then model)
+    instance.initialize()
+
+    # Initialize encoders (required for device to receive events)
+    if hasattr(loaded.visual_encoder, "initialize"):
+        loaded.visual_encoder.initialize()
+    if hasattr(loaded.auditory_encoder, "initialize"):
+        loaded.auditory_encoder.initialize()
+
+    model.initialize()
+
+    # Set parameter string AFTER model.initialize() - this matches the main simulation.
+    # An empty string means "use the device's own default parameters".
+    parameter_string = branch.parameter_string if branch is not None else sim_config.parameter_string
+    if parameter_string:
+        device.set_parameter_string(parameter_string)
+
+
+class _JobWatch:
+    """Checks a run against its JobLimits between chunks, raising SimulationLimitExceeded when one is exceeded."""
+
+    RSS_CHECK_INTERVAL = 20  # chunks between memory checks
+
+    def __init__(self, limits: JobLimits):
+        self.limits = limits
+        self.started = time.monotonic()
+        self._checks = 0
+
+    def check(self, model):
+        limits = self.limits
+        if limits.simulated_ms and model.get_time() > limits.simulated_ms:
+            raise SimulationLimitExceeded(f"Exceeded the simulated time limit of {limits.simulated_ms}ms")
+        if limits.wall_seconds and time.monotonic() - self.started > limits.wall_seconds:
+            raise SimulationLimitExceeded(
+                f"Exceeded the wall time limit of {limits.wall_seconds}s (at {model.get_time()}ms simulated time)"
+            )
+        self._checks += 1
+        if limits.rss_mb and self._checks % self.RSS_CHECK_INTERVAL == 0:
+            rss_mb = psutil.Process().memory_info().rss / 1024**2
+            if rss_mb > limits.rss_mb:
+                raise SimulationLimitExceeded(f"Exceeded the memory limit of {limits.rss_mb}MB ({rss_mb:.0f}MB in use)")
+
+
+def _advance_loaded_simulation(
+    loaded: _LoadedSimulation,
+    sim_config: SimulationConfig,
+    run_time_limit: int,
+    until_state: str = "",
+    watch: _JobWatch | None = None,
+):
+    """
+    Run the simulation in chunks until the device shuts down, run_time_limit is reached, the
+    coordinator finishes, or (if until_state is given) the device enters that named state.
+    If a watch is given, its limits are checked after every chunk.
+    """
+    instance, device, model = loaded.instance, loaded.device, loaded.model
+    target_state = getattr(device, until_state) if until_state else None
+
+    # Run the simulation in chunks (like the main simulation does)
+    # This allows the device to process events between chunks
+    CHUNK_SIZE = 50  # 50ms per chunk, same as main simulation
+    chunk_count = 0
+    while True:
+        try:
+            instance.run_for(CHUNK_SIZE)
+        except RuntimeError as e:
+            # Capture the error with more context
             current_time = model.get_time()
-            chunk_count += 1
+            raise RuntimeError(
+                f"{e}\n[Debug: chunk={chunk_count}, sim_time={current_time}ms, "
+                f"device_state={device.state}, param='{sim_config.parameter_string}']\n"
+                f"[Encoders: {loaded.encoder_status}]"
+            ) from None
 
-            # Check if device has shut down (task complete)
-            if device.state == device.SHUTDOWN:
-                break
+        current_time = model.get_time()
+        chunk_count += 1
 
-            # Check if we've reached the time limit
-            if current_time >= run_time_limit:
-                break
+        if watch is not None:
+            watch.check(model)
 
-            # Safety check - if coordinator is finished, stop
-            if instance.is_finished():
-                break
+        # Check if device has shut down (task complete)
+        if device.state == device.SHUTDOWN:
+            break
 
-        result.run_time_seconds = timeit.default_timer() - run_start
-        result.simulated_time_ms = model.get_time()
-        result.success = True
+        # Check if we've reached the time limit
+        if current_time >= run_time_limit:
+            break
 
-        # Clean up simulation
-        model.stop()
-        instance.stop()
+        # Check if the device reached the requested state
+        if target_state is not None and device.state == target_state:
+            break
 
-    except Exception as e:
-        import traceback
+        # Safety check - if coordinator is finished, stop
+        if instance.is_finished():
+            break
+
+
+def _run_branch_prefix(loaded: _LoadedSimulation, sim_config: SimulationConfig, watch: _JobWatch | None = None):
+    """Run the shared warm-up of a branched config up to its branch point, checking watch's limits (if given) as it goes."""
+    import sys
+
+    branch = sim_config.branch_point
+    _advance_loaded_simulation(loaded, sim_config, branch.at_time_ms or sys.maxsize, branch.at_state, watch=watch)
+    if loaded.device.state == loaded.device.SHUTDOWN:
+        raise RuntimeError(f"Device shut down during the warm-up, before reaching the branch point ({branch})")
+
+    # Close the warm-up data file so each variant can open its own
+    if sim_config.temp_data_dir:
+        _finalize_data_output(loaded.device)
+
+
+def _run_loaded_simulation(
+    loaded: _LoadedSimulation,
+    sim_config: SimulationConfig,
+    result: SimulationResult,
+    at_branch_point: bool = False,
+):
+    """
+    Initialize an already loaded simulation, apply sim_config's parameters, and run it to the end.
+
+    For a branched config, the shared warm-up is run first (unless at_branch_point says it
+    already has been, e.g. in a process forked from a template), then the config's own
+    parameter string is applied and the run continues from there.
+    """
+    import timeit
+
+    instance, device, model = loaded.instance, loaded.device, loaded.model
+
+    run_start = timeit.default_timer()
+    watch = _JobWatch(sim_config.limits) if sim_config.limits.enabled else None
+
+    if not at_branch_point:
+        _initialize_loaded_simulation(loaded, sim_config, result)
+        if sim_config.branch_point is not None:
+            _run_branch_prefix(loaded, sim_config, watch)
 
-        result.error_message = f"{e}\n{traceback.format_exc()}"
+    if sim_config.branch_point is not None:
+        if sim_config.temp_data_dir:
+            result.data_file = _redirect_data_output(device, sim_config, sim_config.run_key)
+        _seed_random_generators(sim_config.seed)
+        if sim_config.parameter_string:
+            device.set_parameter_string(sim_config.parameter_string)
+
+    _advance_loaded_simulation(loaded, sim_config, _run_time_limit(model, sim_config), watch=watch)
+
+    result.run_time_seconds = timeit.default_timer() - run_start
+    result.simulated_time_ms = model.get_time()
+    result.success = True
+
+    # Clean up simulation
+    model.stop()
+    instance.stop()
 
-    # Clear Python streams from C++ output tees to prevent GIL issues during
-    # process finalization. This must happen outside the try block to ensure
-    # cleanup even on error.
+    # Make sure this run's data reaches disk before the parent merges it (and before a warm
+    # worker points the device at the next run's data file)
+    _finalize_data_output(device)
+
+
+def _clear_output_routing():
+    """
+    Clear Python streams from C++ output tees to prevent GIL issues during
+    process finalization.
+    """
     try:
         from epiclibcpp.epiclib.output_tee_globals import (
             Debug_out,
@@ -514,6 +1100,65 @@ def run_single_simulation(sim_config: SimulationConfig) -> SimulationResult:
     except Exception:
         pass
 
+
+def run_single_simulation(sim_config: SimulationConfig) -> SimulationResult:
+    """
+    Run a single simulation in an isolated process.
+
+    This function is designed to be called via ProcessPoolExecutor.
+    Each worker process gets its own copy of epiclibcpp with independent
+    global state (Coordinator singleton, output streams, etc.).
+    """
+    _use_non_gui_backend()
+
+    # Set up output capture first
+    streams = _setup_output_routing(sim_config)
+    result = _new_result(sim_config, streams)
+
+    try:
+        loaded = _load_simulation(sim_config, result)
+        if loaded is not None:
+            _run_loaded_simulation(loaded, sim_config, result)
+    except Exception as e:
+        result.error_message = _failure_message(e)
+
+    # This must happen outside the try block to ensure cleanup even on error.
+    _clear_output_routing()
+    _close_output_streams(streams, result)
+
+    return result
+
+
+# Per-process simulation kept alive between jobs by run_warm_simulation()
+_warm_simulation: _LoadedSimulation | None = None
+
+
+def run_warm_simulation(sim_config: SimulationConfig) -> SimulationResult:
+    """
+    Like run_single_simulation(), but keeps the loaded device module, encoders and compiled
+    model resident in the worker process. When the next job uses the same device, rules,
+    encoders and output settings, only the Coordinator/encoders/model are re-initialized and
+    the new parameter string applied -- the same thing the GUI does between serial runs.
+    """
+    global _warm_simulation
+
+    streams = _setup_output_routing(sim_config)
+    result = _new_result(sim_config, streams)
+
+    try:
+        if _warm_simulation is None or _warm_simulation.key != _simulation_key(sim_config) or sim_config.reload_device:
+            _warm_simulation = None
+            _warm_simulation = _load_simulation(sim_config, result)
+        if _warm_simulation is not None:
+            _run_loaded_simulation(_warm_simulation, sim_config, result)
+    except Exception as e:
+        result.error_message = _failure_message(e)
+        # Don't trust a simulation that failed mid-run for the next job
+        _warm_simulation = None
+
+    _clear_output_routing()
+    _close_output_streams(streams, result)
+
     return result
 
 
@@ -529,82 +1174,1098 @@ def expand_permutations(param_string: str) -> list[str]:
     return unpack_param_string(param_string)
 
 
+def _csv_fields(values: list, delimiter: str) -> str:
+    """Format values as one delimited row (quoted where needed), without the line ending."""
+    import csv
+    import io
+
+    buffer = io.StringIO()
+    csv.writer(buffer, delimiter=delimiter, lineterminator="").writerow(values)
+    return buffer.getvalue()
+
+
+def _data_delimiter(header: str) -> str:
+    """Best guess at the delimiter of a device's data file, from its header line."""
+    counts = {delimiter: header.count(delimiter) for delimiter in (",", "\t", ";")}
+    delimiter = max(counts, key=counts.get)
+    return delimiter if counts[delimiter] else ","
+
+
+# Format of the merged data file of a parallel run; parquet and arrow (IPC) are written with polars
+DataFormat = Literal["csv", "parquet", "arrow"]
+MERGED_DATA_SUFFIXES: dict[str, str] = {"csv": ".csv", "parquet": ".parquet", "arrow": ".arrow"}
+
+# Names, in the device folder, of the partial data files an IncrementalDataMerge is writing there
+PARTIAL_MERGE_MARKER = ".epicpy_partial_merge.json"
+
+
+def _first_line(path: str) -> str:
+    with open(path, "r", newline="") as f:
+        return f.readline().rstrip("\r\n")
+
+
+def _data_tag_columns(sim_configs: list[SimulationConfig]) -> list[str]:
+    """
+    Columns added to each row of merged data, in every format: the device and rule file names when
+    the runs used more than one, and parameter_string, condition (the permutation's index),
+    replication and seed when any run is a replication (or seeded).
+    """
+    columns = []
+    if len({cfg.device_file for cfg in sim_configs}) > 1:
+        columns.append("device_file")
+    if len({cfg.rule_file for cfg in sim_configs}) > 1:
+        columns.append("rule_file")
+    if any(cfg.replication or cfg.seed is not None for cfg in sim_configs):
+        columns += ["parameter_string", "condition", "replication", "seed"]
+    return columns
+
+
+def _data_tag_values(sim_config: SimulationConfig, columns: list[str]) -> list:
+    """The values of sim_config's tag columns (see _data_tag_columns), with None for no seed."""
+    values = {
+        "device_file": Path(sim_config.device_file).name,
+        "rule_file": Path(sim_config.rule_file).name,
+        "parameter_string": sim_config.parameter_string,
+        "condition": sim_config.condition,
+        "replication": sim_config.replication,
+        "seed": sim_config.seed,
+    }
+    return [values[column] for column in columns]
+
+
+def _csv_tag_values(sim_config: SimulationConfig, columns: list[str]) -> list:
+    return ["" if value is None else value for value in _data_tag_values(sim_config, columns)]
+
+
+def _append_data_rows(outfile, data_file: str, suffix: str = "") -> int:
+    """Stream a data file's non-blank rows (not its header) into outfile, each followed by suffix."""
+    eol = "\r\n"
+    rows_written = 0
+    with open(data_file, "r", newline="") as infile:
+        next(infile, None)  # header
+        for line in infile:
+            if line.strip():
+                outfile.write(f"{line.rstrip(eol)}{suffix}\n")
+                rows_written += 1
+    return rows_written
+
+
 def merge_data_files(results: list[SimulationResult], output_path: Path) -> int:
     """
     Merge all temp data files from parallel simulations into a single output file.
+
+    If any run is a replication (or was seeded), parameter_string, condition, replication and seed
+    columns are appended to every row, so downstream analyses don't have to work out which run a row
+    came from; likewise rule_file (and device_file) columns when the runs used several (see _data_tag_columns).
+    Runs whose data a later job cleared (keep_data=False) are left out. Files are streamed a line
+    at a time. If the runs' headers differ, the merged file gets the union of their columns (in
+    order of first appearance), with blanks where a run lacks a column.
     """
-    data_files = [Path(r.data_file) for r in results if r.data_file and Path(r.data_file).is_file()]
-    if not data_files:
+    runs = [r for r in results if r.sim_config.keep_data and r.data_file and Path(r.data_file).is_file()]
+    headers = [_first_line(r.data_file) for r in runs]
+    runs, headers = [r for r, h in zip(runs, headers) if h], [h for h in headers if h]
+    if not runs:
         return 0
 
+    tag_names = _data_tag_columns([r.sim_config for r in runs])
+    delimiter = _data_delimiter(headers[0])
+
+    if len(set(headers)) > 1:
+        return _merge_mismatched_data_files(runs, output_path, delimiter, tag_names)
+
     rows_written = 0
-    header_written = False
+    with open(output_path, "w", newline="") as outfile:
+        header_tags = f"{delimiter}{_csv_fields(tag_names, delimiter)}" if tag_names else ""
+        outfile.write(f"{headers[0]}{header_tags}\n")
+        for run in runs:
+            suffix = f"{delimiter}{_csv_fields(_csv_tag_values(run.sim_config, tag_names), delimiter)}" if tag_names else ""
+            rows_written += _append_data_rows(outfile, run.data_file, suffix)
+
+    return rows_written
 
+
+def _merge_mismatched_data_files(runs: list[SimulationResult], output_path: Path, delimiter: str, tag_names: list[str]) -> int:
+    """Merge data files whose columns differ, writing the union of their columns."""
+    import csv
+
+    columns: dict[str, None] = {}
+    for run in runs:
+        with open(run.data_file, "r", newline="") as f:
+            columns.update(dict.fromkeys(next(csv.reader(f, delimiter=delimiter))))
+    columns.update(dict.fromkeys(tag_names))
+    warnings.warn(f"Parallel runs wrote data files with different columns; merging the union of {len(columns)} columns.")
+
+    rows_written = 0
     with open(output_path, "w", newline="") as outfile:
-        for data_file in data_files:
-            with open(data_file, "r", newline="") as infile:
-                lines = infile.readlines()
-                if not lines:
-                    continue
-
-                # Write header only once (from the first file)
-                if not header_written:
-                    outfile.write(lines[0])
-                    header_written = True
-
-                # Write data rows (skip header in subsequent files)
-                for line in lines[1:]:
-                    outfile.write(line)
-                    rows_written += 1
+        writer = csv.DictWriter(outfile, fieldnames=list(columns), delimiter=delimiter, restval="", lineterminator="\n")
+        writer.writeheader()
+        for run in runs:
+            tags = dict(zip(tag_names, _csv_tag_values(run.sim_config, tag_names)))
+            with open(run.data_file, "r", newline="") as infile:
+                for row in csv.DictReader(infile, delimiter=delimiter):
+                    if any(row.values()):
+                        row.pop(None, None)  # cells beyond the run's own header
+                        writer.writerow({**row, **tags})
+                        rows_written += 1
 
     return rows_written
 
 
+def _scan_run_data(result: SimulationResult, tag_columns: list[str]):
+    """
+    A polars LazyFrame of one run's data file, with the same tag columns (see _data_tag_columns) that a
+    merged CSV gets, except where the device's data already has a column of that name.
+    """
+    import polars as pl
+
+    dtypes = {"condition": pl.Int32, "replication": pl.Int32, "seed": pl.Int64}
+    frame = pl.scan_csv(result.data_file, separator=_data_delimiter(_first_line(result.data_file)), infer_schema_length=None)
+    names = frame.collect_schema().names()
+    tags = {
+        name: pl.lit(value, dtype=dtypes.get(name, pl.String))
+        for name, value in zip(tag_columns, _data_tag_values(result.sim_config, tag_columns))
+        if name not in names
+    }
+    return frame.with_columns(**tags)
+
+
+def _sink_columnar(frames: list, output_path: Path, data_format: DataFormat) -> int:
+    """
+    Concatenate LazyFrames by column name (null where a frame lacks a column, widening columns whose
+    types differ) and stream them into a Parquet or Arrow IPC file. Returns the number of rows written.
+    """
+    import polars as pl
+
+    layouts = {tuple(frame.collect_schema().names()) for frame in frames}
+    if len(layouts) > 1:
+        n_columns = len(set().union(*layouts))
+        warnings.warn(f"Parallel runs wrote data files with different columns; merging the union of {n_columns} columns.")
+
+    merged = pl.concat(frames, how="diagonal_relaxed")
+    if data_format == "parquet":
+        merged.sink_parquet(output_path)
+        return pl.scan_parquet(output_path).select(pl.len()).collect().item()
+    merged.sink_ipc(output_path)
+    return pl.scan_ipc(output_path).select(pl.len()).collect().item()
+
+
+def merge_data_files_columnar(results: list[SimulationResult], output_path: Path, data_format: DataFormat = "parquet") -> int:
+    """
+    Stream all temp data files from parallel simulations into a single Parquet or Arrow IPC file.
+
+    Rows get the same tag columns as in merge_data_files (see _data_tag_columns).
+    Runs with different columns are unioned by name, and columns whose types differ between runs
+    are widened to a common type. Returns the number of rows written.
+    """
+    runs = [r for r in results if r.sim_config.keep_data and r.data_file and Path(r.data_file).is_file()]
+    runs = [r for r in runs if _first_line(r.data_file)]
+    if not runs:
+        return 0
+    tag_columns = _data_tag_columns([r.sim_config for r in runs])
+    return _sink_columnar([_scan_run_data(run, tag_columns) for run in runs], output_path, data_format)
+
+
+class IncrementalDataMerge:
+    """
+    Merges each parallel run's data into the device folder as soon as the run finishes.
+
+    Rows are appended to data_output.partial.csv, and for columnar formats each run is also written
+    as its own file in data_output.parts/, so a sweep's data can be inspected while it is running
+    and finished rows survive a crash. finish() moves the merged data into place with an atomic
+    rename, leaving any earlier data_output file untouched until then.
+
+    The names of these partial files are kept in PARTIAL_MERGE_MARKER until they are gone, so the
+    next merge into the folder only clears leftovers of a crashed sweep. A file or folder of the
+    same name that no marker lists is left alone, and a numbered name is used instead
+    (e.g., data_output.partial1.csv).
+    """
+
+    def __init__(
+        self, device_folder: Path, data_format: DataFormat = "csv", legacy_csv: bool = True, tag_columns: list[str] | None = None
+    ):
+        self.folder = Path(device_folder)
+        self.data_format = data_format
+        self.suffix = MERGED_DATA_SUFFIXES[data_format]
+        self.write_csv = data_format == "csv" or legacy_csv
+        self.tag_columns = tag_columns or []  # see _data_tag_columns
+        self.runs: list[SimulationResult] = []
+
+        self.marker = self.folder / PARTIAL_MERGE_MARKER
+        self._clear_partial_leftovers()
+        self.partial_csv, self.parts_dir = self._free_partial_names()
+        self._csv_file = None
+        self._header = ""
+        self._delimiter = ","
+        self._rebuild_csv = False  # set when a run's columns differ, so the CSV is re-merged by finish()
+        self._columnar = data_format != "csv"
+
+        try:
+            self.marker.write_text(json.dumps({"csv": self.partial_csv.name, "parts": self.parts_dir.name}), encoding="utf-8")
+        except OSError as e:
+            warnings.warn(f"Unable to write {self.marker}; leftovers of an interrupted sweep will not be cleared: {e}")
+
+    def _clear_partial_leftovers(self):
+        """Delete the partial files of a sweep that crashed (resumed runs are merged again from their stored data)."""
+        import shutil
+
+        try:
+            names = json.loads(self.marker.read_text(encoding="utf-8"))
+        except (OSError, ValueError):
+            return
+        if isinstance(names, dict):
+            for name in (names.get("csv"), names.get("parts")):
+                # Only plain names of partial files, never anything outside the folder
+                if isinstance(name, str) and name.startswith("data_output.part") and name == Path(name).name:
+                    path = self.folder / name
+                    if path.is_dir():
+                        shutil.rmtree(path, ignore_errors=True)
+                    else:
+                        path.unlink(missing_ok=True)
+        self.marker.unlink(missing_ok=True)
+
+    def _free_partial_names(self) -> tuple[Path, Path]:
+        for n in itertools.count():
+            number = str(n) if n else ""
+            partial_csv = self.folder / f"data_output.partial{number}.csv"
+            parts_dir = self.folder / f"data_output.parts{number}"
+            if not os.path.lexists(partial_csv) and not os.path.lexists(parts_dir):
+                if n:
+                    warnings.warn(
+                        f"Leaving the existing data_output.partial.csv or data_output.parts in {self.folder} alone; "
+                        f"this sweep's partial data goes to {partial_csv.name} instead."
+                    )
+                return partial_csv, parts_dir
+
+    def add(self, result: SimulationResult):
+        """Merge one finished run's data."""
+        if not (result.sim_config.keep_data and result.data_file and Path(result.data_file).is_file()):
+            return
+        header = _first_line(result.data_file)
+        if not header:
+            return
+        self.runs.append(result)
+
+        if self.write_csv and not self._rebuild_csv:
+            try:
+                self._append_csv(result, header)
+            except OSError as e:
+                warnings.warn(f"Unable to add {result.sim_config.parameter_string!r} to {self.partial_csv.name}: {e}")
+                self._rebuild_csv = True
+
+        if self._columnar:
+            try:
+                self.parts_dir.mkdir(exist_ok=True)
+                part = self.parts_dir / f"{len(self.runs):06d}_{sweep_job_hash(result.sim_config)}{self.suffix}"
+                frame = _scan_run_data(result, self.tag_columns)
+                if self.data_format == "parquet":
+                    frame.sink_parquet(part)
+                else:
+                    frame.sink_ipc(part)
+            except Exception as e:
+                self._columnar_failed(e)
+
+    def _append_csv(self, result: SimulationResult, header: str):
+        if self._csv_file is None:
+            self._header = header
+            self._delimiter = _data_delimiter(header)
+            self._csv_file = open(self.partial_csv, "w", newline="")
+            header_tags = f"{self._delimiter}{_csv_fields(self.tag_columns, self._delimiter)}" if self.tag_columns else ""
+            self._csv_file.write(f"{header}{header_tags}\n")
+        elif header != self._header:
+            self._rebuild_csv = True
+            return
+        tags = _csv_tag_values(result.sim_config, self.tag_columns)
+        suffix = f"{self._delimiter}{_csv_fields(tags, self._delimiter)}" if self.tag_columns else ""
+        _append_data_rows(self._csv_file, result.data_file, suffix)
+        self._csv_file.flush()
+
+    def _columnar_failed(self, error: Exception):
+        output_name = f"data_output{self.suffix}"
+        warnings.warn(f"Unable to write {output_name} ({error}); writing data_output.csv instead.")
+        self._columnar = False
+        if not self.write_csv:
+            self.write_csv = True
+            self._rebuild_csv = True
+
+    def finish(self):
+        """Move the merged data into place as data_output.csv (and .parquet/.arrow)."""
+        import shutil
+
+        if self._columnar:
+            parts = sorted(self.parts_dir.glob(f"*{self.suffix}"))
+            if parts:
+                import polars as pl
+
+                output_path = self.folder / f"data_output{self.suffix}"
+                tmp_path = self.folder / f"data_output.tmp{self.suffix}"
+                scan = pl.scan_parquet if self.data_format == "parquet" else pl.scan_ipc
+                try:
+                    _sink_columnar([scan(part) for part in parts], tmp_path, self.data_format)
+                    os.replace(tmp_path, output_path)
+                    shutil.rmtree(self.parts_dir, ignore_errors=True)
+                except Exception as e:
+                    tmp_path.unlink(missing_ok=True)
+                    self._columnar_failed(e)
+
+        if self._csv_file is not None:
+            self._csv_file.close()
+            self._csv_file = None
+        if self.write_csv and self.runs:
+            if self._rebuild_csv:
+                merge_data_files(self.runs, self.partial_csv)
+            os.replace(self.partial_csv, self.folder / "data_output.csv")
+        if not os.path.lexists(self.partial_csv) and not os.path.lexists(self.parts_dir):
+            self.marker.unlink(missing_ok=True)
+
+
+def _terminate_workers(executor: ProcessPoolExecutor):
+    """Kill the executor's worker processes so that in-flight simulations stop immediately."""
+    executor.shutdown(wait=False, cancel_futures=True)
+    for process in list((getattr(executor, "_processes", None) or {}).values()):
+        try:
+            process.terminate()
+        except Exception:
+            pass
+
+
+def _fork_available() -> bool:
+    """True where worker processes can be forked from an already-loaded template (Linux only)."""
+    return platform.system() == "Linux" and not CHECK_MAC_WIN_MP and "forkserver" in multiprocessing.get_all_start_methods()
+
+
+def _can_fork_from_template(sim_configs: list[SimulationConfig]) -> bool:
+    """Fork mode needs one template, so every config must build the same simulation."""
+    return _fork_available() and len({_simulation_key(cfg) for cfg in sim_configs}) == 1
+
+
+def _hard_limit_violation(limits: JobLimits, pid: int, started_at: float) -> str:
+    """
+    Why the worker running a job should be killed, or "" if it shouldn't. Workers stop themselves
+    at their limits between chunks, so this only fires well past a limit, for unresponsive workers.
+    """
+    if limits.wall_seconds:
+        elapsed = time.time() - started_at
+        if elapsed > limits.wall_seconds + max(5.0, 0.1 * limits.wall_seconds):
+            return f"Killed after {elapsed:.0f}s: exceeded the wall time limit of {limits.wall_seconds}s without responding"
+    if limits.rss_mb:
+        try:
+            rss_mb = psutil.Process(pid).memory_info().rss / 1024**2
+        except psutil.Error:
+            return ""
+        if rss_mb > 1.25 * limits.rss_mb:
+            return f"Killed using {rss_mb:.0f}MB: exceeded the memory limit of {limits.rss_mb}MB without responding"
+    return ""
+
+
+def _killed_result(sim_config: SimulationConfig, message: str) -> SimulationResult:
+    """Failure result for a job whose worker was killed, with whatever output it had already spilled to disk."""
+    result = SimulationResult(sim_config=sim_config, success=False, error_message=message)
+    if sim_config.spill_outputs and sim_config.output_dir:
+        for name in ("Normal_out", "Trace_out"):
+            if sim_config.capture_policy(name).mode == "full" and _output_file_path(sim_config, name).is_file():
+                result.output_files[name] = str(_output_file_path(sim_config, name))
+    result.output_tail = _output_tail(result)
+    return result
+
+
+def _run_forked_child(
+    loaded: _LoadedSimulation,
+    index: int,
+    sim_config: SimulationConfig,
+    result_queue,
+    at_branch_point: bool = False,
+):
+    """Body of a process forked from the template: run one job, report it, and exit without cleanup."""
+    exit_code = 0
+    try:
+        streams = _setup_output_routing(sim_config)
+        result = _new_result(sim_config, streams)
+        try:
+            _run_loaded_simulation(loaded, sim_config, result, at_branch_point)
+        except Exception as e:
+            result.error_message = _failure_message(e)
+        _clear_output_routing()
+        _close_output_streams(streams, result)
+
+        result_queue.put((index, result))
+        # Make sure the result is fully written to the pipe before we exit
+        result_queue.close()
+        result_queue.join_thread()
+    except BaseException:
+        exit_code = 1
+    finally:
+        # Skip interpreter shutdown: this process shares (copy-on-write) state with the template
+        os._exit(exit_code)
+
+
+def _reap_forked_child(
+    running: dict[int, tuple[int, float]], sim_configs: list[SimulationConfig], template_queue, block: bool = True
+) -> bool:
+    """
+    Wait for one forked child to exit; report a failure for it (on template_queue) if it died without a result.
+    With block=False, returns False right away if no child has exited yet.
+    """
+    pid, status = os.waitpid(-1, 0 if block else os.WNOHANG)
+    if pid == 0:
+        return False
+    index, _ = running.pop(pid, (None, 0.0))
+    if index is None:
+        return True
+    exit_code = os.waitstatus_to_exitcode(status)
+    if exit_code != 0:
+        # If the child did manage to report a result, the parent ignores this duplicate
+        template_queue.put(
+            (
+                index,
+                SimulationResult(
+                    sim_config=sim_configs[index],
+                    success=False,
+                    error_message=f"Simulation process exited with code {exit_code}",
+                ),
+            )
+        )
+    return True
+
+
+def _kill_runaway_children(running: dict[int, tuple[int, float]], sim_configs: list[SimulationConfig], template_queue):
+    """Kill (and reap) forked children that are well past their JobLimits, reporting them as failed on template_queue."""
+    for pid, (index, started_at) in list(running.items()):
+        message = _hard_limit_violation(sim_configs[index].limits, pid, started_at)
+        if not message:
+            continue
+        try:
+            os.kill(pid, signal.SIGKILL)
+            os.waitpid(pid, 0)
+        except (ProcessLookupError, ChildProcessError):
+            continue  # it exited on its own in the meantime and will be (or was) reaped normally
+        running.pop(pid, None)
+        template_queue.put((index, _killed_result(sim_configs[index], message)))
+
+
+# Indices of the template's own reports on template_queue (the others are config indices)
+_TEMPLATE_FAILED = -1  # payload: why the simulation could not be loaded or warmed up
+_TEMPLATE_READY = -2  # the simulation is loaded (and warmed up), so the template starts forking runs
+
+
+def _fork_template_main(sim_configs: list[SimulationConfig], result_queue, template_queue, max_workers: int):
+    """
+    Entry point of the template process (started by the forkserver, see _run_forked_simulations):
+    load the simulation once, then fork one child per config from that warm state, keeping at most
+    max_workers children running at a time. The template starts no threads, so it is safe to fork.
+
+    Children report on result_queue, which the template itself must never write to: a put()
+    would start the queue's feeder thread here, and every child forked afterwards (os.fork runs
+    none of multiprocessing's after-fork hooks) would inherit it as already running, leaving its
+    own result unsent in a buffer that os._exit() throws away. The template reports on
+    template_queue, a SimpleQueue, which writes straight to its pipe without a feeder thread.
+    """
+    # Own process group, so the parent can kill the template and all of its children at once
+    os.setpgrp()
+    _use_non_gui_backend()
+    _setup_output_routing()
+
+    template_result = SimulationResult(sim_config=sim_configs[0], success=False)
+    try:
+        loaded = _load_simulation(sim_configs[0], template_result)
+    except Exception as e:
+        loaded = None
+        template_result.error_message = f"{e}\n{traceback.format_exc()}"
+
+    # Branched sweeps: run the shared warm-up once here, so every child starts at the branch point
+    at_branch_point = loaded is not None and sim_configs[0].branch_point is not None
+    if at_branch_point:
+        try:
+            _initialize_loaded_simulation(loaded, sim_configs[0], template_result)
+            # A warm-up that hangs or runs away fails every variant, rather than blocking the sweep
+            limits = sim_configs[0].limits
+            _run_branch_prefix(loaded, sim_configs[0], _JobWatch(limits) if limits.enabled else None)
+        except Exception as e:
+            loaded = None
+            template_result.error_message = f"Warm-up failed: {e}\n{traceback.format_exc()}"
+
+    if loaded is None:
+        template_queue.put((_TEMPLATE_FAILED, template_result.error_message))
+        _clear_output_routing()
+        return
+    template_queue.put((_TEMPLATE_READY, None))
+
+    running: dict[int, tuple[int, float]] = {}  # child pid -> (config index, start time)
+    watched = any(cfg.limits.enabled for cfg in sim_configs)
+
+    def wait_for_a_child():
+        if not watched:
+            _reap_forked_child(running, sim_configs, template_queue)
+            return
+        # Poll instead of blocking, so runaway children can be killed while we wait
+        while running and not _reap_forked_child(running, sim_configs, template_queue, block=False):
+            _kill_runaway_children(running, sim_configs, template_queue)
+            time.sleep(0.1)
+
+    for index, cfg in enumerate(sim_configs):
+        while len(running) >= max_workers:
+            wait_for_a_child()
+        pid = os.fork()
+        if pid == 0:
+            _run_forked_child(loaded, index, cfg, result_queue, at_branch_point)
+        running[pid] = (index, time.time())
+
+    while running:
+        wait_for_a_child()
+
+    _clear_output_routing()
+
+
+def _forked_reports(result_queue, template_queue, timeout: float) -> list[tuple[int, Any]]:
+    """
+    The (index, payload) reports waiting from the forked children and from the template, waiting up to
+    timeout for one. The template reports a child's failure only after the child has exited, by which
+    time anything the child sent is already in result_queue, so reading that afterwards puts a child's
+    own result ahead of the template's report about it.
+    """
+    template_reports = []
+    while not template_queue.empty():
+        template_reports.append(template_queue.get())
+    reports = []
+    try:
+        reports.append(result_queue.get(timeout=0 if template_reports else timeout))
+        while True:
+            reports.append(result_queue.get_nowait())
+    except queue.Empty:
+        pass
+    return reports + template_reports
+
+
+def _kill_fork_template(template):
+    """Kill the template process along with any children it has forked."""
+    try:
+        os.killpg(template.pid, signal.SIGKILL)
+    except (ProcessLookupError, PermissionError):
+        # Template may not have made its own process group yet
+        template.kill()
+
+
+def _run_forked_simulations(
+    sim_configs: list[SimulationConfig],
+    max_workers: int,
+    on_complete: Callable[[SimulationResult], None] | None,
+    cancel_event: threading.Event | None,
+) -> list[SimulationResult]:
+    """
+    Run sim_configs by loading the device, encoders and rules once in a template process and
+    forking every job from it. Children start from the already-imported epiclibcpp/device
+    state (copy-on-write), so per-job startup is a fork rather than a cold import.
+
+    This process may be the multi-threaded GUI, which is never forked: the template is started
+    by the forkserver, a single-threaded process of its own, and only the template forks.
+    """
+    ctx = multiprocessing.get_context("forkserver")
+    result_queue = ctx.Queue()  # written only by the forked children
+    template_queue = ctx.SimpleQueue()  # written only by the template (see _fork_template_main)
+    template = ctx.Process(
+        target=_fork_template_main, args=(sim_configs, result_queue, template_queue, max_workers), daemon=True
+    )
+    template.start()
+
+    results: list[SimulationResult] = []
+    reported: set[int] = set()
+
+    def report(index: int, result: SimulationResult):
+        reported.add(index)
+        results.append(result)
+        if on_complete:
+            on_complete(result)
+
+    try:
+        # Until it is ready, the template is loading the simulation and running any shared warm-up,
+        # which is held to the same JobLimits as the runs (it stops itself there too, see _run_branch_prefix)
+        ready = False
+        limits = sim_configs[0].limits
+        started_at = time.time()
+        template_failure = ""
+        while len(reported) < len(sim_configs) and not template_failure:
+            if cancel_event is not None and cancel_event.is_set():
+                break
+            if not ready and limits.enabled:
+                message = _hard_limit_violation(limits, template.pid, started_at)
+                if message:
+                    _kill_fork_template(template)
+                    template_failure = f"Warm-up failed: {message}"
+                    break
+            reports = _forked_reports(result_queue, template_queue, timeout=0.25)
+            if not reports:
+                if not template.is_alive() and result_queue.empty() and template_queue.empty():
+                    break
+                continue
+
+            for index, payload in reports:
+                if index == _TEMPLATE_READY:
+                    ready = True
+                elif index == _TEMPLATE_FAILED:
+                    template_failure = payload
+                    break
+                elif index not in reported:
+                    report(index, payload)
+
+        if template_failure:
+            # The template could not load or warm up the simulation, so none of the jobs can run
+            for i, cfg in enumerate(sim_configs):
+                if i not in reported:
+                    report(i, SimulationResult(sim_config=cfg, success=False, error_message=template_failure))
+
+        if cancel_event is None or not cancel_event.is_set():
+            for i, cfg in enumerate(sim_configs):
+                if i not in reported:
+                    message = "Simulation process ended without a result"
+                    report(i, SimulationResult(sim_config=cfg, success=False, error_message=message))
+    finally:
+        template.join(timeout=0 if cancel_event is not None and cancel_event.is_set() else 5)
+        if template.is_alive():
+            _kill_fork_template(template)
+            template.join()
+        result_queue.close()
+        template_queue.close()
+
+    return results
+
+
+# Where pool workers announce the jobs they start, so the parent can enforce JobLimits (see _run_pooled_simulations)
+_job_start_queue = None
+
+# Where pool workers send the result of each run of a batch as soon as it finishes (see _run_pooled_simulations)
+_job_result_queue = None
+
+
+def _init_pool_worker(start_queue, result_queue=None):
+    """ProcessPoolExecutor initializer."""
+    global _job_start_queue, _job_result_queue
+    _job_start_queue = start_queue
+    _job_result_queue = result_queue
+    _use_non_gui_backend()
+
+
+def _run_pooled_jobs(
+    round_id: int, indices: list[int], sim_configs: list[SimulationConfig], warm: bool
+) -> list[SimulationResult]:
+    """
+    Pool task: run a batch of jobs one after the other in this worker, announcing each job's start
+    (if the parent is watching limits). With a result queue, each result is sent through it as soon
+    as its run finishes, and nothing is returned; otherwise the results are returned together.
+    """
+    results = []
+    for index, sim_config in zip(indices, sim_configs):
+        if _job_start_queue is not None:
+            _job_start_queue.put((round_id, index, os.getpid(), time.time()))
+        result = run_warm_simulation(sim_config) if warm else run_single_simulation(sim_config)
+        if _job_result_queue is not None:
+            _job_result_queue.put((round_id, index, result))  # SimpleQueue.put is written before it returns
+        else:
+            results.append(result)
+    return results
+
+
+def _run_pooled_simulations(
+    sim_configs: list[SimulationConfig],
+    max_workers: int,
+    on_complete: Callable[[SimulationResult], None] | None,
+    cancel_event: threading.Event | None,
+    warm_workers: bool,
+    batch_size: int = 1,
+) -> list[SimulationResult]:
+    """
+    Run sim_configs on a ProcessPoolExecutor, batch_size configs per pool task.
+
+    If any config has JobLimits, workers announce each job as they start it, so that the parent
+    can kill workers that stop responding past a limit. Killing a worker breaks the pool, so the
+    jobs that were still unfinished are then resubmitted to a fresh pool.
+
+    Configs with an after list are only submitted once every config of those jobs has finished,
+    and are reported as failed without running if any of them failed. Everything else is
+    submitted right away.
+
+    Batches send many short runs to a worker in one message instead of paying the IPC and
+    pickling of a task per run. Workers still send back the result of each run of a batch as soon as
+    it finishes (through a SimpleQueue read by a thread here), so progress and the sweep manifest
+    keep up run by run, and a crash only loses the runs that hadn't finished.
+    """
+    from collections import Counter
+
+    results: list[SimulationResult] = []
+    finished: set[int] = set()
+    unfinished_runs = Counter(cfg.job for cfg in sim_configs)  # by job
+    failed_jobs: set[int] = set()
+
+    def report(index: int, result: SimulationResult):
+        finished.add(index)
+        results.append(result)
+        unfinished_runs[sim_configs[index].job] -= 1
+        if not result.success:
+            failed_jobs.add(sim_configs[index].job)
+        if on_complete:
+            on_complete(result)
+
+    def cancelled() -> bool:
+        return cancel_event is not None and cancel_event.is_set()
+
+    watched = any(cfg.limits.enabled for cfg in sim_configs)
+    start_queue = multiprocessing.Queue() if watched else None
+
+    # Results of batched runs, read off the workers' SimpleQueue as they arrive so a worker never waits on a full pipe.
+    # Only workers write to it (a worker killed mid-write would leave its lock held), so the reader is stopped by an event.
+    result_queue = multiprocessing.SimpleQueue() if batch_size > 1 else None
+    arrived: queue.Queue = queue.Queue()
+    stop_reading = threading.Event()
+    reader = None
+    if result_queue is not None:
+
+        def read_results():
+            while not stop_reading.is_set():
+                if result_queue.empty():
+                    stop_reading.wait(0.02)
+                else:
+                    arrived.put(result_queue.get())
+
+        reader = threading.Thread(target=read_results, name="batch-results", daemon=True)
+        reader.start()
+
+    def report_arrived(round_id: int, wait_for: list[int] | None = None, timeout: float = 10.0):
+        """Report the batched results that have arrived, waiting (up to timeout) for those of wait_for."""
+        missing = set(wait_for or ())
+        deadline = time.monotonic() + timeout
+        while True:
+            try:
+                if missing:
+                    item = arrived.get(timeout=max(0.0, deadline - time.monotonic()))
+                else:
+                    item = arrived.get_nowait()
+            except queue.Empty:
+                return
+            job_round, index, result = item
+            missing.discard(index)
+            if job_round == round_id and index not in finished:
+                report(index, result)
+
+    # Without a cancel_event, limits to watch or batched results there is nothing to poll for, so just block
+    # until something finishes
+    poll_timeout = 0.25 if cancel_event is not None or watched or result_queue is not None else None
+
+    to_run = list(range(len(sim_configs)))
+    round_id = 0
+    while to_run and not cancelled():
+        round_id += 1
+        killed_any = False
+        started: dict[int, tuple[int, float]] = {}  # config index -> (worker pid, start time)
+
+        with ProcessPoolExecutor(
+            max_workers=max_workers, initializer=_init_pool_worker, initargs=(start_queue, result_queue)
+        ) as executor:
+            futures = {}
+            pending = set()
+            waiting = list(to_run)
+
+            def submit_ready():
+                # Skipping a run fails its job, which can make further runs skippable, so repeat until nothing changes
+                ready = []
+                changed = True
+                while changed:
+                    changed = False
+                    for index in list(waiting):
+                        after = sim_configs[index].after
+                        if any(job in failed_jobs for job in after):
+                            message = "Skipped: a job this run comes after did not finish successfully"
+                            report(index, SimulationResult(sim_config=sim_configs[index], success=False, error_message=message))
+                        elif all(unfinished_runs[job] == 0 for job in after):
+                            ready.append(index)
+                        else:
+                            continue
+                        waiting.remove(index)
+                        changed = True
+
+                for start in range(0, len(ready), batch_size):
+                    batch = ready[start : start + batch_size]
+                    batch_configs = [sim_configs[index] for index in batch]
+                    future = executor.submit(_run_pooled_jobs, round_id, batch, batch_configs, warm_workers)
+                    futures[future] = batch
+                    pending.add(future)
+
+            submit_ready()
+            while pending:
+                done, pending = wait(pending, timeout=poll_timeout, return_when=FIRST_COMPLETED)
+                if result_queue is not None:
+                    report_arrived(round_id)
+                for future in done:
+                    message = "Worker process ended without a result"
+                    wait_seconds = 10.0
+                    try:
+                        batch_results = dict(zip(futures[future], future.result()))
+                    except Exception as e:
+                        # Create failure results for unexpected errors
+                        message = f"Worker process error: {e}"
+                        batch_results = {}
+                        wait_seconds = 0.5  # only results sent before the worker died are coming
+                    if result_queue is not None:
+                        # The worker sent its results before its task ended, so they are on their way
+                        report_arrived(round_id, [index for index in futures[future] if index not in finished], wait_seconds)
+                    for index in futures[future]:
+                        if index not in finished:
+                            result = batch_results.get(index)
+                            if result is None:
+                                result = SimulationResult(sim_config=sim_configs[index], success=False, error_message=message)
+                            report(index, result)
+
+                if start_queue is not None:
+                    _drain_job_starts(start_queue, round_id, started)
+                    for index, (pid, started_at) in list(started.items()):
+                        if index in finished:
+                            continue
+                        message = _hard_limit_violation(sim_configs[index].limits, pid, started_at)
+                        if message:
+                            _kill_process(pid)
+                            report(index, _killed_result(sim_configs[index], message))
+                            killed_any = True
+
+                if killed_any or (pending and cancelled()):
+                    _terminate_workers(executor)
+                    break
+                if done and waiting:
+                    submit_ready()
+
+        to_run = [index for index in to_run if index not in finished]
+        if not killed_any:
+            break
+
+    if start_queue is not None:
+        start_queue.close()
+    if result_queue is not None:
+        stop_reading.set()
+        reader.join()
+        result_queue.close()
+
+    return results
+
+
+def _drain_job_starts(start_queue, round_id: int, started: dict[int, tuple[int, float]]):
+    """Collect the job start announcements of the current pool (older pools' are stale)."""
+    while True:
+        try:
+            job_round, index, pid, started_at = start_queue.get_nowait()
+        except queue.Empty:
+            return
+        if job_round == round_id:
+            started[index] = (pid, started_at)
+
+
+def _kill_process(pid: int):
+    try:
+        psutil.Process(pid).kill()
+    except psutil.Error:
+        pass
+
+
+def _result_from_cache(sim_config: SimulationConfig, hit: CachedResult, temp_dir: Path) -> SimulationResult:
+    """Build the result of a cache hit, copying its files out of the cache so eviction can't pull them away."""
+    import shutil
+
+    data_file = ""
+    if hit.data_file:
+        data_file = str(temp_dir / f"data_output_cached_{hit.key[:12]}.csv")
+        shutil.copyfile(hit.data_file, data_file)
+
+    output_files = {}
+    if hit.output_files:
+        output_dir = temp_dir / "outputs"
+        output_dir.mkdir(parents=True, exist_ok=True)
+        for name, cached_file in hit.output_files.items():
+            output_files[name] = str(output_dir / f"cached_{hit.key[:12]}_{name}.txt.gz")
+            shutil.copyfile(cached_file, output_files[name])
+
+    return SimulationResult(
+        sim_config=sim_config,
+        success=True,
+        run_time_seconds=hit.entry.get("run_time_seconds", 0.0),
+        simulated_time_ms=hit.entry.get("simulated_time_ms", 0),
+        data_file=data_file,
+        output_files=output_files,
+        output_line_counts=hit.entry.get("output_line_counts", {}),
+        cached=True,
+    )
+
+
 def run_parallel_simulations(
     sim_configs: list[SimulationConfig],
     max_workers: int = _DEFAULT_MAX_WORKERS,
     on_complete: Callable[[SimulationResult], None] | None = None,
     device_folder: Path | None = None,
+    cancel_event: threading.Event | None = None,
+    warm_workers: bool = False,
+    resume: bool = False,
+    sweep_dir: Path | None = None,
+    result_cache: ResultCache | None = None,
+    runtime_history: RuntimeHistory | None = None,
+    data_format: DataFormat = "csv",
+    legacy_csv: bool = True,
+    staging: StagingMode = "symlink",
+    merge_by_device: bool = False,
+    batch_size: int = 0,
 ) -> list[SimulationResult]:
     """
     Run multiple simulations in parallel using ProcessPoolExecutor.
+
+    With warm_workers=True, each worker process loads the device, encoders and rules once and
+    reuses them for every job that shares them (see run_warm_simulation), which removes most of
+    the per-job setup cost for sweeps of many short runs. On Linux, when every config uses the
+    same device/rules/encoders, warm mode instead loads them once in a template process and
+    forks each job from it (see _run_forked_simulations). Configs sharing a BranchPoint also use
+    the template, which runs their common warm-up once before forking the variants.
+
+    If cancel_event is given and gets set (e.g., from another thread), pending runs are
+    cancelled, running workers are terminated, and only the completed results are returned.
+
+    With resume=True, or an explicit sweep_dir, each finished run is recorded in a SweepManifest
+    in sweep_dir (default: a hidden folder in device_folder) as soon as it completes. With
+    resume=True, runs the manifest lists as successful are not run again; their stored results
+    are reported (marked resumed) and their data is merged with that of the new runs. Other
+    sweeps leave nothing behind in device_folder but the merged data.
+
+    If result_cache is given, runs it already holds are answered from the cache (marked cached)
+    instead of being simulated, and every newly successful run is added to it.
+
+    If runtime_history is given, runs are submitted longest-expected-first based on the wall
+    times of earlier sweeps, and the wall time of every new run is added to the history.
+
+    Pool workers are given batch_size runs per task. The default of 0 picks a batch size from
+    runtime_history (see RuntimeHistory.batch_size), or 1 (no batching) without one.
+
+    Each run's data is merged into device_folder as soon as the run finishes (see IncrementalDataMerge)
+    and renamed into place at the end: data_output.csv, or with data_format "parquet" or "arrow"
+    data_output.parquet/.arrow, in which case the CSV is only written as well if legacy_csv is True
+    (or if the columnar merge fails).
+
+    staging selects how the device's subfolders are made available to the runs (see stage_device_folders).
+
+    With merge_by_device=True (e.g., for simulation scripts that run several devices), each run's
+    data is merged into its own device's folder instead of device_folder.
     """
     # Set up temp directory for data files, clearing any stale data from prior runs.
-    # Temp filenames are deterministic (md5 of parameter string), so without cleanup
+    # Temp filenames are deterministic (md5 of rule file + parameter string), so without cleanup
     # the workers would append to leftover files and accumulate duplicate rows.
+    # Each device gets its own temp data dir, which is also where its subfolders are staged.
     temp_dir = _get_session_temp_dir()
     for old_file in temp_dir.glob("data_output_*.csv"):
         old_file.unlink()
     for cfg in sim_configs:
-        cfg.temp_data_dir = str(temp_dir)
-
-    results: list[SimulationResult] = []
-
-    with ProcessPoolExecutor(max_workers=max_workers) as executor:
-        futures = {executor.submit(run_single_simulation, cfg): cfg for cfg in sim_configs}
-
-        for future in as_completed(futures):
-            cfg = futures[future]
+        cfg.temp_data_dir = str(device_temp_dir(temp_dir, Path(cfg.device_file).parent))
+    for data_dir in dict.fromkeys(Path(cfg.temp_data_dir) for cfg in sim_configs):
+        data_dir.mkdir(parents=True, exist_ok=True)
+        for old_file in data_dir.glob("data_output_*.csv"):
+            old_file.unlink()
+
+    # Spilled outputs from prior runs are stale too
+    output_dir = temp_dir / "outputs"
+    if output_dir.is_dir():
+        for old_file in output_dir.glob("*_out.txt*"):
+            old_file.unlink()
+    for cfg in sim_configs:
+        if cfg.spill_outputs and not cfg.output_dir:
+            cfg.output_dir = str(output_dir)
+
+    # Data merges, by destination folder
+    merges: dict[Path, IncrementalDataMerge] = {}
+    merge_folders = [Path(cfg.device_file).parent if merge_by_device else device_folder for cfg in sim_configs]
+    for folder in dict.fromkeys(merge_folders):
+        if folder:
+            folder_configs = [cfg for cfg, cfg_folder in zip(sim_configs, merge_folders) if cfg_folder == folder]
+            merges[Path(folder)] = IncrementalDataMerge(folder, data_format, legacy_csv, _data_tag_columns(folder_configs))
+
+    def merge_data(result: SimulationResult):
+        folder = Path(result.sim_config.device_file).parent if merge_by_device else device_folder
+        if folder:
+            merges[Path(folder)].add(result)
+
+    if sweep_dir is None and resume and device_folder:
+        sweep_dir = Path(device_folder) / SWEEP_DIR_NAME
+    manifest = SweepManifest(sweep_dir, resume=resume) if sweep_dir else None
+
+    def record_and_report(result: SimulationResult):
+        if runtime_history and result.success and not result.cached:
             try:
-                result = future.result()
-                results.append(result)
-                if on_complete:
-                    on_complete(result)
-            except Exception as e:
-                # Create a failure result for unexpected errors
-                error_result = SimulationResult(
-                    sim_config=cfg,
-                    success=False,
-                    error_message=f"Worker process error: {e}",
-                )
-                results.append(error_result)
-                if on_complete:
-                    on_complete(error_result)
-
-    # Merge data files into device folder
-    if device_folder:
-        output_path = device_folder / "data_output.csv"
-        merge_data_files(results, output_path)
+                runtime_history.record(result)
+            except sqlite3.Error as e:
+                warnings.warn(f"Unable to record the run time of {result.sim_config.parameter_string!r}: {e}")
+        if result_cache and result.success and not result.cached:
+            try:
+                result_cache.store(result)
+            except OSError as e:
+                warnings.warn(f"Unable to cache the result of {result.sim_config.parameter_string!r}: {e}")
+        if manifest:
+            try:
+                manifest.record(result)
+            except OSError as e:
+                warnings.warn(f"Unable to record {result.sim_config.parameter_string!r} in the sweep manifest: {e}")
+        merge_data(result)
+        if on_complete:
+            on_complete(result)
+
+    # Runs finished by an interrupted sweep, or found in the result cache, don't need to run again
+    finished_results: list[SimulationResult] = []
+    pending_configs: list[SimulationConfig] = []
+    for cfg in sim_configs:
+        entry = manifest.completed(cfg) if manifest and resume else None
+        if entry is not None:
+            result = SimulationResult(
+                sim_config=cfg,
+                success=True,
+                run_time_seconds=entry.get("run_time_seconds", 0.0),
+                simulated_time_ms=entry.get("simulated_time_ms", 0),
+                data_file=entry.get("data_file", ""),
+                resumed=True,
+            )
+            finished_results.append(result)
+            merge_data(result)
+            if on_complete:
+                on_complete(result)
+            continue
+
+        hit = result_cache.lookup(cfg) if result_cache else None
+        if hit is not None:
+            result = _result_from_cache(cfg, hit, temp_dir)
+            finished_results.append(result)
+            record_and_report(result)
+            continue
+
+        pending_configs.append(cfg)
+
+    sim_configs = pending_configs
+
+    # Device subfolders (stimuli, etc.) are put in the temp data dir once, rather than by every run
+    if sim_configs:
+        stage_device_folders(sim_configs, temp_dir, staging)
+
+    # Start the slowest runs first so the pool isn't left waiting on a few long ones at the end,
+    # and send very short runs to the workers in batches
+    if runtime_history and len(sim_configs) > 1:
+        try:
+            sim_configs = runtime_history.longest_first(sim_configs)
+            if batch_size < 1:
+                batch_size = runtime_history.batch_size(sim_configs, max_workers)
+        except sqlite3.Error as e:
+            warnings.warn(f"Unable to read the run time history: {e}")
+    batch_size = max(1, batch_size)
+
+    # Branched sweeps only save work when the warm-up can be shared, so they always prefer forking
+    branched = any(cfg.branch_point is not None for cfg in sim_configs)
+    # The fork template starts every run right away, so runs that wait for others need the pool
+    ordered = any(cfg.after for cfg in sim_configs)
+    if not sim_configs:
+        results = []
+    elif (warm_workers or branched) and not ordered and _can_fork_from_template(sim_configs):
+        results = _run_forked_simulations(sim_configs, max_workers, record_and_report, cancel_event)
+    else:
+        results = _run_pooled_simulations(sim_configs, max_workers, record_and_report, cancel_event, warm_workers, batch_size)
+    results = finished_results + results
+
+    # Each run's data was merged into the device folder as it finished; put the merged files in place
+    for merge in merges.values():
+        merge.finish()
 
     return results
 
@@ -618,12 +2279,36 @@ def create_sim_configs_from_permutations(
     run_command_value: int = 0,  # only for run_for/run_until/run_for_cycles commands
     visual_encoder_file: str = "",
     auditory_encoder_file: str = "",
+    branch_point: BranchPoint | None = None,
+    spill_outputs: bool = False,
+    compress_outputs: bool = False,
+    output_capture: dict[str, CapturePolicy] | None = None,
+    replications: int = 1,
+    base_seed: int | None = None,
+    limits: JobLimits | None = None,
 ) -> list[SimulationConfig]:
     """
     Create a list of SimulationConfig objects from a parameter string with permutations.
+    If branch_point is given, every permutation continues from that shared warm-up.
+    If spill_outputs is True, workers write their output to (optionally gzipped) files
+    instead of returning it in memory. output_capture sets the capture policy of each output
+    (see CapturePolicy).
+
+    With replications > 1 (or a base_seed), each permutation is run that many times, each run
+    with its own seed derived from base_seed (picked at random if not given). Configs are
+    ordered replication by replication, so every condition is spread across the whole sweep
+    rather than all of one condition's runs landing together.
+
+    limits (see JobLimits) applies to every run.
     """
     param_variations = expand_permutations(base_param_string)
 
+    replications = max(1, replications)
+    if base_seed is None and replications > 1:
+        import random
+
+        base_seed = random.SystemRandom().randrange(2**31)
+
     return [
         SimulationConfig(
             device_file=device_file,
@@ -634,6 +2319,79 @@ def create_sim_configs_from_permutations(
             run_command_value=run_command_value,
             visual_encoder_file=visual_encoder_file,
             auditory_encoder_file=auditory_encoder_file,
+            branch_point=branch_point,
+            spill_outputs=spill_outputs,
+            compress_outputs=compress_outputs,
+            output_capture=dict(output_capture or {}),
+            condition=condition,
+            replication=replication,
+            seed=None if base_seed is None else replication_seed(base_seed, param, replication),
+            limits=replace(limits) if limits else JobLimits(),
         )
-        for param in param_variations
+        for replication in range(replications)
+        for condition, param in enumerate(param_variations)
     ]
+
+
+def create_sim_configs_from_run_infos(
+    run_infos: list["RunInfo"],
+    device_file: str,
+    base_param_string: str,
+    output_settings: OutputSettings,
+    replications: int = 1,
+    base_seed: int | None = None,
+    **kwargs,
+) -> list[SimulationConfig]:
+    """
+    Create one job set from a list of RunInfo entries (e.g., several rule files, or a simulation
+    script): every entry's parameter permutations, as create_sim_configs_from_permutations would
+    make them, so the whole rule file x permutation product can run in one parallel sweep.
+
+    Entries without a device_file or parameter_string use device_file and base_param_string, and
+    entries with their own encoders use them instead of the visual_encoder_file/auditory_encoder_file
+    arguments. Since the runs no longer happen one after another, an entry's clear_data means the
+    data of the earlier entries of the same device is not merged, and reload_device means its runs
+    never reuse a device already loaded by a warm worker. An entry's runs wait for those of the
+    entries listed in its after. Every entry shares one base seed, so replication n of a condition
+    uses the same seed under every rule file. Other keyword arguments are passed on to
+    create_sim_configs_from_permutations.
+    """
+    replications = max(1, replications)
+    if base_seed is None and replications > 1:
+        import random
+
+        base_seed = random.SystemRandom().randrange(2**31)
+
+    devices = [info.device_file or device_file for info in run_infos]
+    cleared_before = {device: i for i, device in enumerate(devices) if run_infos[i].clear_data}
+
+    sim_configs = []
+    for job, info in enumerate(run_infos):
+        encoders = {}
+        if info.visual_encoder:
+            encoders["visual_encoder_file"] = info.visual_encoder
+        if info.auditory_encoder:
+            encoders["auditory_encoder_file"] = info.auditory_encoder
+        for cfg in create_sim_configs_from_permutations(
+            device_file=devices[job],
+            rule_file=info.rule_file,
+            base_param_string=info.parameter_string or base_param_string,
+            output_settings=output_settings,
+            replications=replications,
+            base_seed=base_seed,
+            **{**kwargs, **encoders},
+        ):
+            cfg.job = job
+            cfg.keep_data = job >= cleared_before.get(devices[job], 0)
+            cfg.reload_device = info.reload_device
+            cfg.after = tuple(info.after)
+            sim_configs.append(cfg)
+    return sim_configs
+
+
+def replication_seed(base_seed: int, parameter_string: str, replication: int) -> int:
+    """Seed of one replication, stable for a given base seed no matter how the sweep is ordered."""
+    import hashlib
+
+    digest = hashlib.sha256(f"{base_seed}|{parameter_string}|{replication}".encode()).digest()
+    return int.from_bytes(digest[:4], "little") & 0x7FFFFFFF
@@ -0,0 +1,114 @@
+"""
+This file is part of the EPICpy source code. EPICpy is a tool for simulating
+human performance tasks using the EPIC computational cognitive architecture
+(David Kieras and David Meyer 1997a) using the Python programming language.
+Copyright (C) 2022-2026 Travis L. Seymour, PhD
+
+This program is free software: you can redistribute it and/or modify
+it under the terms of the GNU General Public License as published by
+the Free Software Foundation, either version 3 of the License, or
+(at your option) any later version.
+
+This program is distributed in the hope that it will be useful,
+but WITHOUT ANY WARRANTY; without even the implied warranty of
+MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+GNU General Public License for more details.
+
+You should have received a copy of the GNU General Public License
+along with this program.  If not, see <https://www.gnu.org/licenses/>.
+"""
+
+"""
+Runs a parallel parameter sweep off the GUI thread.
+
+The process pool itself lives in parallel_simulation.py (which must stay Qt-free so worker
+processes never touch Qt); this thread just drives it and relays results back as signals.
+"""
+
+import threading
+from pathlib import Path
+
+from qtpy.QtCore import QThread, Signal
+
+from epicpy.epic.parallel_simulation import (
+    DataFormat,
+    SimulationConfig,
+    SimulationResult,
+    StagingMode,
+    run_parallel_simulations,
+)
+from epicpy.epic.result_cache import ResultCache
+from epicpy.epic.runtime_history import RuntimeHistory
+
+
+class ParallelSimulationThread(QThread):
+    """Background thread that runs run_parallel_simulations() and streams results as Qt signals."""
+
+    result_ready = Signal(object)  # SimulationResult, emitted as each permutation completes
+    sweep_finished = Signal(object, bool, str)  # (list of SimulationResult, cancelled, error message)
+
+    def __init__(
+        self,
+        sim_configs: list[SimulationConfig],
+        max_workers: int,
+        device_folder: Path | None = None,
+        warm_workers: bool = False,
+        resume: bool = False,
+        result_cache: ResultCache | None = None,
+        runtime_history: RuntimeHistory | None = None,
+        data_format: DataFormat = "csv",
+        legacy_csv: bool = True,
+        staging: StagingMode = "symlink",
+        merge_by_device: bool = False,
+        sweep_dir: Path | None = None,
+        parent=None,
+    ):
+        super().__init__(parent)
+        self.sim_configs = sim_configs
+        self.max_workers = max_workers
+        self.device_folder = device_folder
+        self.warm_workers = warm_workers
+        self.resume = resume
+        self.result_cache = result_cache
+        self.runtime_history = runtime_history
+        self.data_format = data_format
+        self.legacy_csv = legacy_csv
+        self.staging = staging
+        self.merge_by_device = merge_by_device
+        self.sweep_dir = sweep_dir
+        self._cancel_event = threading.Event()
+
+    def cancel(self):
+        """Ask the sweep to stop; running workers are terminated and pending runs are dropped."""
+        self._cancel_event.set()
+
+    def is_cancelled(self) -> bool:
+        return self._cancel_event.is_set()
+
+    def _on_complete(self, result: SimulationResult):
+        # Called on this thread; the signal is delivered to GUI-thread slots via a queued connection
+        self.result_ready.emit(result)
+
+    def run(self):
+        results: list[SimulationResult] = []
+        error_message = ""
+        try:
+            results = run_parallel_simulations(
+                sim_configs=self.sim_configs,
+                max_workers=self.max_workers,
+                on_complete=self._on_complete,
+                device_folder=self.device_folder,
+                cancel_event=self._cancel_event,
+                warm_workers=self.warm_workers,
+                resume=self.resume,
+                result_cache=self.result_cache,
+                runtime_history=self.runtime_history,
+                data_format=self.data_format,
+                legacy_csv=self.legacy_csv,
+                staging=self.staging,
+                merge_by_device=self.merge_by_device,
+                sweep_dir=self.sweep_dir,
+            )
+        except Exception as e:
+            error_message = str(e)
+        self.sweep_finished.emit(results, self.is_cancelled(), error_message)
@@ -0,0 +1,229 @@
+"""
+This file is part of the EPICpy source code. EPICpy is a tool for simulating
+human performance tasks using the EPIC computational cognitive architecture
+(David Kieras and David Meyer 1997a) using the Python programming language.
+Copyright (C) 2022-2026 Travis L. Seymour, PhD
+
+This program is free software: you can redistribute it and/or modify
+it under the terms of the GNU General Public License as published by
+the Free Software Foundation, either version 3 of the License, or
+(at your option) any later version.
+
+This program is distributed in the hope that it will be useful,
+but WITHOUT ANY WARRANTY; without even the implied warranty of
+MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+GNU General Public License for more details.
+
+You should have received a copy of the GNU General Public License
+along with this program.  If not, see <https://www.gnu.org/licenses/>.
+"""
+
+"""
+Content-addressed cache of finished simulation runs.
+
+A run's cache key hashes the *contents* of everything that determines its outcome (device
+source, rule file, encoders), its parameter string, run command, output settings and the
+installed epiclibcpp/epicpydevicelib versions. Rerunning an unchanged configuration then just
+returns the stored result, data file and output instead of simulating it again. Entries are
+evicted least-recently-used first once the cache grows past its size cap.
+"""
+
+import gzip
+import hashlib
+import json
+import os
+import shutil
+import time
+from dataclasses import astuple, dataclass, field
+from pathlib import Path
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from epicpy.epic.parallel_simulation import CapturePolicy, SimulationConfig, SimulationResult
+
+CACHE_DIR_NAME = "result_cache"
+DEFAULT_MAX_BYTES = 2 * 1024**3
+RESULT_FILE = "result.json"
+CACHED_OUTPUTS = ("Normal_out", "Trace_out", "Stats_out", "Info_out")
+
+
+def _package_version(name: str) -> str:
+    from importlib.metadata import PackageNotFoundError, version
+
+    try:
+        return version(name)
+    except PackageNotFoundError:
+        return "unknown"
+
+
+def _capture_rank(policy: "CapturePolicy") -> tuple[int, int]:
+    """Order capture policies by how much output they keep."""
+    ranks = {"drop": 0, "count": 1, "tail": 2, "full": 3}
+    return ranks.get(policy.mode, 3), policy.tail_lines if policy.mode == "tail" else 0
+
+
+@dataclass
+class CachedResult:
+    """A cache hit: the stored result fields plus the paths of its cached files."""
+
+    key: str
+    entry: dict
+    data_file: str = ""
+    output_files: dict[str, str] = field(default_factory=dict)
+
+
+class ResultCache:
+    """Content-addressed store of successful SimulationResults, capped at max_bytes (LRU eviction)."""
+
+    def __init__(self, cache_dir: Path, max_bytes: int = DEFAULT_MAX_BYTES):
+        self.cache_dir = Path(cache_dir)
+        self.cache_dir.mkdir(parents=True, exist_ok=True)
+        self.max_bytes = max_bytes
+        self._file_hashes: dict[tuple[str, int, int], str] = {}
+        self._versions = f"epiclibcpp={_package_version('epiclibcpp')}|epicpydevicelib={_package_version('epicpydevicelib')}"
+
+    def _file_hash(self, path: str | Path) -> str:
+        """Content hash of one file, memoized by (path, mtime, size) so sweeps only read each file once."""
+        p = Path(path).expanduser().resolve()
+        try:
+            st = p.stat()
+        except OSError:
+            return "missing"
+        memo_key = (str(p), st.st_mtime_ns, st.st_size)
+        if memo_key not in self._file_hashes:
+            h = hashlib.blake2b(digest_size=16)
+            with open(p, "rb") as f:
+                for block in iter(lambda: f.read(1 << 20), b""):
+                    h.update(block)
+            self._file_hashes[memo_key] = h.hexdigest()
+        return self._file_hashes[memo_key]
+
+    def _device_hash(self, device_file: str) -> str:
+        """The device file plus the python modules beside it, since devices often import their neighbours."""
+        device = Path(device_file).expanduser().resolve()
+        sources = sorted(p for p in device.parent.glob("*.py") if p.is_file())
+        return "|".join(f"{p.name}:{self._file_hash(p)}" for p in sources) or self._file_hash(device)
+
+    def key(self, sim_config: "SimulationConfig") -> str:
+        parts = [
+            self._device_hash(sim_config.device_file),
+            self._file_hash(sim_config.rule_file),
+            self._file_hash(sim_config.visual_encoder_file) if sim_config.visual_encoder_file else "",
+            self._file_hash(sim_config.auditory_encoder_file) if sim_config.auditory_encoder_file else "",
+            sim_config.parameter_string,
+            sim_config.run_command,
+            str(sim_config.run_command_value),
+            repr(astuple(sim_config.output_settings)),
+            repr(astuple(sim_config.branch_point)) if sim_config.branch_point else "",
+            f"rep{sim_config.replication}|seed{sim_config.seed}",
+            self._versions,
+        ]
+        return hashlib.sha256("\0".join(parts).encode()).hexdigest()
+
+    def lookup(self, sim_config: "SimulationConfig") -> CachedResult | None:
+        """Return the cached run for sim_config, provided it kept at least as much output as it asks for."""
+        key = self.key(sim_config)
+        entry_dir = self.cache_dir / key
+        result_file = entry_dir / RESULT_FILE
+        try:
+            entry = json.loads(result_file.read_text())
+        except (OSError, json.JSONDecodeError):
+            return None
+
+        for name, stored in entry.get("capture", {}).items():
+            wanted = sim_config.capture_policy(name)
+            if _capture_rank(wanted) > (stored[0], stored[1]):
+                return None
+
+        os.utime(result_file)  # mark as recently used
+        data_file = entry_dir / "data.csv"
+        return CachedResult(
+            key=key,
+            entry=entry,
+            data_file=str(data_file) if data_file.is_file() else "",
+            output_files={p.name.split(".")[0]: str(p) for p in entry_dir.glob("*_out.txt.gz")},
+        )
+
+    def store(self, result: "SimulationResult") -> bool:
+        """Add a successful result (with its data file and captured output) to the cache."""
+        if not result.success:
+            return False
+        sim_config = result.sim_config
+        key = self.key(sim_config)
+        entry_dir = self.cache_dir / key
+        if entry_dir.is_dir():
+            return True
+
+        # Build the entry beside its final location and rename it into place, so readers never see half an entry
+        tmp_dir = self.cache_dir / f"{key}.tmp-{os.getpid()}"
+        shutil.rmtree(tmp_dir, ignore_errors=True)
+        tmp_dir.mkdir()
+        try:
+            if result.data_file and Path(result.data_file).is_file():
+                shutil.copyfile(result.data_file, tmp_dir / "data.csv")
+            for name in CACHED_OUTPUTS:
+                if name in result.outputs or name in result.output_files:
+                    with gzip.open(tmp_dir / f"{name}.txt.gz", "wt", encoding="utf-8") as f:
+                        f.writelines(f"{line}\n" for line in result.iter_output(name))
+            entry = {
+                "device_file": str(Path(sim_config.device_file).expanduser().resolve()),
+                "rule_file": sim_config.rule_file,
+                "parameter_string": sim_config.parameter_string,
+                "run_time_seconds": result.run_time_seconds,
+                "simulated_time_ms": result.simulated_time_ms,
+                "output_line_counts": result.output_line_counts,
+                "capture": {name: _capture_rank(sim_config.capture_policy(name)) for name in CACHED_OUTPUTS},
+                "stored": time.time(),
+            }
+            (tmp_dir / RESULT_FILE).write_text(json.dumps(entry, indent=2))
+            os.replace(tmp_dir, entry_dir)
+        except OSError:
+            shutil.rmtree(tmp_dir, ignore_errors=True)
+            return False
+
+        self._evict()
+        return True
+
+    def _entries(self) -> list[tuple[float, int, Path]]:
+        """(last used, size in bytes, folder) of every complete entry."""
+        entries = []
+        for entry_dir in self.cache_dir.iterdir():
+            result_file = entry_dir / RESULT_FILE
+            if not result_file.is_file():
+                continue
+            size = sum(p.stat().st_size for p in entry_dir.iterdir() if p.is_file())
+            entries.append((result_file.stat().st_mtime, size, entry_dir))
+        return entries
+
+    def size_bytes(self) -> int:
+        return sum(size for _, size, _ in self._entries())
+
+    def _evict(self):
+        """Remove least-recently-used entries until the cache fits in max_bytes."""
+        entries = sorted(self._entries())
+        total = sum(size for _, size, _ in entries)
+        for _, size, entry_dir in entries:
+            if total <= self.max_bytes:
+                break
+            shutil.rmtree(entry_dir, ignore_errors=True)
+            total -= size
+
+    def clear(self, device_file: str = "") -> int:
+        """
+        Invalidate cached runs: all of them, or only those of device_file if given.
+        Returns the number of entries removed.
+        """
+        device = str(Path(device_file).expanduser().resolve()) if device_file else ""
+        removed = 0
+        for _, _, entry_dir in self._entries():
+            if device:
+                try:
+                    if json.loads((entry_dir / RESULT_FILE).read_text()).get("device_file") != device:
+                        continue
+                except (OSError, json.JSONDecodeError):
+                    pass
+            shutil.rmtree(entry_dir, ignore_errors=True)
+            removed += 1
+        for tmp_dir in self.cache_dir.glob("*.tmp-*"):
+            shutil.rmtree(tmp_dir, ignore_errors=True)
+        return removed
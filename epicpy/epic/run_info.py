@@ -29,3 +29,6 @@ class RunInfo:
     parameter_string: str = ""
     clear_data: bool = False
     reload_device: bool = False
+    visual_encoder: str = ""  # overrides the device's visual encoder when set (simulation scripts)
+    auditory_encoder: str = ""  # overrides the device's auditory encoder when set (simulation scripts)
+    after: tuple[int, ...] = ()  # indices of entries whose runs must finish before this one's start (simulation scripts)
@@ -0,0 +1,125 @@
+"""
+This file is part of the EPICpy source code. EPICpy is a tool for simulating
+human performance tasks using the EPIC computational cognitive architecture
+(David Kieras and David Meyer 1997a) using the Python programming language.
+Copyright (C) 2022-2026 Travis L. Seymour, PhD
+
+This program is free software: you can redistribute it and/or modify
+it under the terms of the GNU General Public License as published by
+the Free Software Foundation, either version 3 of the License, or
+(at your option) any later version.
+
+This program is distributed in the hope that it will be useful,
+but WITHOUT ANY WARRANTY; without even the implied warranty of
+MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+GNU General Public License for more details.
+
+You should have received a copy of the GNU General Public License
+along with this program.  If not, see <https://www.gnu.org/licenses/>.
+"""
+
+"""
+Wall-clock times of past parallel runs, used to schedule the slowest runs of a sweep first.
+
+Times are kept per (device file, rule file, parameter string) in a small sqlite database.
+Submitting the longest expected runs first keeps the pool busy until the end of the sweep
+instead of leaving most workers idle while a few slow permutations finish. The same times
+decide how many very short runs to send to a worker at once (see RuntimeHistory.batch_size).
+"""
+
+import math
+import sqlite3
+from contextlib import closing
+from pathlib import Path
+from statistics import median
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from epicpy.epic.parallel_simulation import SimulationConfig, SimulationResult
+
+HISTORY_FILE_NAME = "runtime_history.sqlite"
+BATCH_TARGET_SECONDS = 1.0  # aim for pool tasks of about this long when batching short runs
+MIN_TASKS_PER_WORKER = 4  # but never batch so much that workers get fewer tasks than this
+
+
+def _stable_path(path: str) -> str:
+    return str(Path(path).expanduser().resolve()) if path else ""
+
+
+class RuntimeHistory:
+    """Running mean wall time of each (device, rule, parameter string) seen in past sweeps."""
+
+    def __init__(self, db_path: Path):
+        self.db_path = Path(db_path)
+        self.db_path.parent.mkdir(parents=True, exist_ok=True)
+        with closing(self._connect()) as conn, conn:
+            conn.execute(
+                """
+                CREATE TABLE IF NOT EXISTS runtimes (
+                    device TEXT NOT NULL,
+                    rule TEXT NOT NULL,
+                    params TEXT NOT NULL,
+                    mean_seconds REAL NOT NULL,
+                    runs INTEGER NOT NULL,
+                    PRIMARY KEY (device, rule, params)
+                )
+                """
+            )
+
+    def _connect(self) -> sqlite3.Connection:
+        # A connection per call, since sweeps record results from a different thread than the one that made this object
+        return sqlite3.connect(self.db_path, timeout=10)
+
+    def expected_seconds(self, sim_configs: list["SimulationConfig"]) -> list[float | None]:
+        """Mean past wall time of each config, or None for configs that have never run."""
+        devices = {_stable_path(cfg.device_file) for cfg in sim_configs}
+        known: dict[tuple[str, str, str], float] = {}
+        with closing(self._connect()) as conn:
+            for device in devices:
+                rows = conn.execute("SELECT rule, params, mean_seconds FROM runtimes WHERE device = ?", (device,))
+                known.update({(device, rule, params): seconds for rule, params, seconds in rows})
+        return [
+            known.get((_stable_path(cfg.device_file), _stable_path(cfg.rule_file), cfg.parameter_string))
+            for cfg in sim_configs
+        ]
+
+    def longest_first(self, sim_configs: list["SimulationConfig"]) -> list["SimulationConfig"]:
+        """
+        Sort configs by expected wall time, longest first. Configs without history are assumed to
+        take the median known time; the sort is stable, so with no history the order is unchanged.
+        """
+        expected = self.expected_seconds(sim_configs)
+        known = [seconds for seconds in expected if seconds is not None]
+        if not known:
+            return list(sim_configs)
+        typical = median(known)
+        order = sorted(range(len(sim_configs)), key=lambda i: -(expected[i] if expected[i] is not None else typical))
+        return [sim_configs[i] for i in order]
+
+    def batch_size(self, sim_configs: list["SimulationConfig"], max_workers: int) -> int:
+        """
+        How many runs to give a pool worker per task: enough that a task takes about BATCH_TARGET_SECONDS,
+        so sweeps of very short runs aren't dominated by per-task overhead, but few enough that every
+        worker still gets MIN_TASKS_PER_WORKER tasks to balance the load. Without history, 1 (no batching).
+        """
+        known = [seconds for seconds in self.expected_seconds(sim_configs) if seconds is not None]
+        if not known:
+            return 1
+        by_time = int(BATCH_TARGET_SECONDS / max(median(known), 1e-3))
+        by_balance = math.ceil(len(sim_configs) / (max(1, max_workers) * MIN_TASKS_PER_WORKER))
+        return max(1, min(by_time, by_balance))
+
+    def record(self, result: "SimulationResult"):
+        """Fold a finished run's wall time into the running mean of its (device, rule, parameters)."""
+        cfg = result.sim_config
+        key = (_stable_path(cfg.device_file), _stable_path(cfg.rule_file), cfg.parameter_string)
+        with closing(self._connect()) as conn, conn:
+            conn.execute(
+                """
+                INSERT INTO runtimes (device, rule, params, mean_seconds, runs) VALUES (?, ?, ?, ?, 1)
+                ON CONFLICT (device, rule, params) DO UPDATE SET
+                    mean_seconds = mean_seconds + (excluded.mean_seconds - mean_seconds) / (runs + 1),
+                    runs = runs + 1
+                """,
+                (*key, result.run_time_seconds),
+            )
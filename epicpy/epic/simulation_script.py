@@ -0,0 +1,318 @@
+"""
+This file is part of the EPICpy source code. EPICpy is a tool for simulating
+human performance tasks using the EPIC computational cognitive architecture
+(David Kieras and David Meyer 1997a) using the Python programming language.
+Copyright (C) 2022-2026 Travis L. Seymour, PhD
+
+This program is free software: you can redistribute it and/or modify
+it under the terms of the GNU General Public License as published by
+the Free Software Foundation, either version 3 of the License, or
+(at your option) any later version.
+
+This program is distributed in the hope that it will be useful,
+but WITHOUT ANY WARRANTY; without even the implied warranty of
+MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+GNU General Public License for more details.
+
+You should have received a copy of the GNU General Public License
+along with this program.  If not, see <https://www.gnu.org/licenses/>.
+"""
+
+"""
+Simulation scripts: batches of device + rule file + parameter jobs, run as one parallel job set.
+
+A script is a TOML or JSON file with an optional "defaults" table and a list of "jobs":
+
+    [defaults]
+    device = "choice/choice_device.py"      # paths are relative to the script
+    params = "[Easy|Hard] 10"
+    replications = 1                        # also: seed, run_command, run_value
+                                            # and visual_encoder, auditory_encoder
+
+    [[jobs]]
+    name = "baseline"
+    rules = ["rules/choice_a.prs", "rules/choice_b.prs"]    # or rule = "..."
+
+    [[jobs]]
+    name = "followup"
+    device = "other/other_device.py"
+    rule = "rules/other.prs"
+    params = "Fast 20"
+    after = ["baseline"]                    # starts once every baseline run has succeeded
+    clear_data = false
+    reload_device = false
+
+Jobs without an "after" run concurrently; a job that comes after others only starts once all
+of their runs have finished, and is skipped if any of them failed.
+"""
+
+import json
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import TYPE_CHECKING
+
+from epicpy.epic.run_info import RunInfo
+
+if TYPE_CHECKING:
+    from epicpy.epic.parallel_simulation import OutputSettings, SimulationConfig
+
+SCRIPT_SUFFIXES = (".toml", ".json")
+
+_DEFAULT_KEYS = {
+    "device",
+    "params",
+    "visual_encoder",
+    "auditory_encoder",
+    "run_command",
+    "run_value",
+    "replications",
+    "seed",
+}
+_JOB_KEYS = {
+    "name",
+    "device",
+    "rule",
+    "rules",
+    "params",
+    "visual_encoder",
+    "auditory_encoder",
+    "after",
+    "clear_data",
+    "reload_device",
+}
+_RUN_COMMANDS = ("run_until_done", "run_for", "run_until", "run_for_cycles")
+
+
+class SimulationScriptError(ValueError):
+    """A simulation script that can't be read, or that describes jobs that can't be run."""
+
+
+@dataclass
+class ScriptJob:
+    name: str
+    device_file: str
+    rule_files: list[str]
+    parameter_string: str = ""
+    visual_encoder: str = ""
+    auditory_encoder: str = ""
+    after: list[str] = field(default_factory=list)
+    clear_data: bool = False
+    reload_device: bool = False
+
+
+@dataclass
+class SimulationScript:
+    path: Path
+    jobs: list[ScriptJob]
+    run_command: str = "run_until_done"
+    run_command_value: int = 0
+    replications: int = 1
+    seed: int | None = None
+
+    def run_infos(self) -> list[RunInfo]:
+        """
+        One RunInfo per job and rule file, with each job's after turned into RunInfo indices.
+        A job's clear_data is set on its first RunInfo only, so it clears the data of earlier jobs but not its own.
+        """
+        indices: dict[str, list[int]] = {}
+        run_infos = []
+        for job in self.jobs:
+            after = tuple(index for name in job.after for index in indices[name])
+            for i, rule_file in enumerate(job.rule_files):
+                indices.setdefault(job.name, []).append(len(run_infos))
+                run_infos.append(
+                    RunInfo(
+                        from_script=True,
+                        device_file=job.device_file,
+                        rule_file=rule_file,
+                        parameter_string=job.parameter_string,
+                        clear_data=job.clear_data and i == 0,
+                        reload_device=job.reload_device,
+                        visual_encoder=job.visual_encoder,
+                        auditory_encoder=job.auditory_encoder,
+                        after=after,
+                    )
+                )
+        return run_infos
+
+    def device_files(self) -> list[str]:
+        return list(dict.fromkeys(job.device_file for job in self.jobs))
+
+
+def _read_script_file(path: Path) -> dict:
+    text = path.read_text(encoding="utf-8")
+    if path.suffix.lower() == ".json":
+        return json.loads(text)
+
+    try:
+        import tomllib as toml  # Python 3.11+
+    except ModuleNotFoundError:  # Python 3.10
+        import tomli as toml  # pip install tomli
+
+    return toml.loads(text)
+
+
+def _resolve(base: Path, value, what: str) -> str:
+    if not isinstance(value, str):
+        raise SimulationScriptError(f"{what} must be a path string, not {value!r}")
+    if not value:
+        return ""
+    return str((base / Path(value).expanduser()).resolve())
+
+
+def _sort_jobs(jobs: list[ScriptJob]) -> list[ScriptJob]:
+    """Order jobs so that every job comes after the jobs it names in after, rejecting cycles."""
+    by_name = {job.name: job for job in jobs}
+    ordered: list[ScriptJob] = []
+    state: dict[str, str] = {}
+
+    def visit(job: ScriptJob, chain: list[str]):
+        if state.get(job.name) == "done":
+            return
+        if state.get(job.name) == "visiting":
+            raise SimulationScriptError(f"Jobs depend on each other in a cycle: {' -> '.join([*chain, job.name])}")
+        state[job.name] = "visiting"
+        for name in job.after:
+            visit(by_name[name], [*chain, job.name])
+        state[job.name] = "done"
+        ordered.append(job)
+
+    for job in jobs:
+        visit(job, [])
+    return ordered
+
+
+def load_simulation_script(path: str | Path) -> SimulationScript:
+    """Read and check a simulation script, raising SimulationScriptError on any problem."""
+    path = Path(path).expanduser().resolve()
+    try:
+        data = _read_script_file(path)
+    except OSError as e:
+        raise SimulationScriptError(f"Unable to read {path}: {e}") from e
+    except ValueError as e:  # json.JSONDecodeError and tomllib.TOMLDecodeError are both ValueErrors
+        raise SimulationScriptError(f"Unable to parse {path.name}: {e}") from e
+
+    if not isinstance(data, dict):
+        raise SimulationScriptError(f"{path.name} must contain a table/object with a list of jobs")
+    unknown = set(data) - {"defaults", "jobs"}
+    if unknown:
+        raise SimulationScriptError(f"Unknown top-level key(s) in {path.name}: {', '.join(sorted(unknown))}")
+
+    base = path.parent
+    defaults = data.get("defaults", {})
+    if not isinstance(defaults, dict):
+        raise SimulationScriptError("defaults must be a table/object")
+    unknown = set(defaults) - _DEFAULT_KEYS
+    if unknown:
+        raise SimulationScriptError(f"Unknown key(s) in defaults: {', '.join(sorted(unknown))}")
+
+    raw_jobs = data.get("jobs", [])
+    if not isinstance(raw_jobs, list) or not raw_jobs:
+        raise SimulationScriptError(f"{path.name} doesn't list any jobs")
+
+    jobs: list[ScriptJob] = []
+    for number, raw in enumerate(raw_jobs, 1):
+        if not isinstance(raw, dict):
+            raise SimulationScriptError(f"Job {number} must be a table/object")
+        name = str(raw.get("name", f"job{number}"))
+        unknown = set(raw) - _JOB_KEYS
+        if unknown:
+            raise SimulationScriptError(f"Unknown key(s) in job {name!r}: {', '.join(sorted(unknown))}")
+
+        rules = raw.get("rules", [raw["rule"]] if "rule" in raw else [])
+        if isinstance(rules, str):
+            rules = [rules]
+        if not rules:
+            raise SimulationScriptError(f"Job {name!r} has no rule or rules")
+        after = raw.get("after", [])
+        if isinstance(after, str):
+            after = [after]
+
+        job = ScriptJob(
+            name=name,
+            device_file=_resolve(base, raw.get("device", defaults.get("device", "")), f"device of job {name!r}"),
+            rule_files=[_resolve(base, rule, f"rule of job {name!r}") for rule in rules],
+            parameter_string=str(raw.get("params", defaults.get("params", ""))),
+            visual_encoder=_resolve(base, raw.get("visual_encoder", defaults.get("visual_encoder", "")), "visual_encoder"),
+            auditory_encoder=_resolve(
+                base, raw.get("auditory_encoder", defaults.get("auditory_encoder", "")), "auditory_encoder"
+            ),
+            after=[str(item) for item in after],
+            clear_data=bool(raw.get("clear_data", False)),
+            reload_device=bool(raw.get("reload_device", False)),
+        )
+        if not job.device_file:
+            raise SimulationScriptError(f"Job {name!r} has no device (and there is no default device)")
+        jobs.append(job)
+
+    names = [job.name for job in jobs]
+    duplicates = sorted({name for name in names if names.count(name) > 1})
+    if duplicates:
+        raise SimulationScriptError(f"Job names must be unique: {', '.join(duplicates)}")
+    for job in jobs:
+        unknown = [name for name in job.after if name not in names]
+        if unknown:
+            raise SimulationScriptError(f"Job {job.name!r} comes after unknown job(s): {', '.join(unknown)}")
+
+    missing = [
+        file
+        for job in jobs
+        for file in (job.device_file, *job.rule_files, job.visual_encoder, job.auditory_encoder)
+        if file and not Path(file).is_file()
+    ]
+    if missing:
+        raise SimulationScriptError("File(s) not found: " + ", ".join(dict.fromkeys(missing)))
+
+    run_command = defaults.get("run_command", "run_until_done")
+    if run_command not in _RUN_COMMANDS:
+        raise SimulationScriptError(f"run_command must be one of {', '.join(_RUN_COMMANDS)}, not {run_command!r}")
+    try:
+        run_command_value = int(defaults.get("run_value", 0))
+        replications = max(1, int(defaults.get("replications", 1)))
+        seed = None if defaults.get("seed") is None else int(defaults["seed"])
+    except (TypeError, ValueError) as e:
+        raise SimulationScriptError(f"run_value, replications and seed must be whole numbers: {e}") from e
+
+    return SimulationScript(
+        path=path,
+        jobs=_sort_jobs(jobs),
+        run_command=run_command,
+        run_command_value=run_command_value,
+        replications=replications,
+        seed=seed,
+    )
+
+
+def create_sim_configs_from_script(
+    script: SimulationScript, output_settings: "OutputSettings", sweep_dir: Path | None = None, **kwargs
+) -> list["SimulationConfig"]:
+    """
+    The job set of a simulation script (see create_sim_configs_from_run_infos). Other keyword
+    arguments (output capture, limits, etc.) are passed on and apply to every run.
+
+    Replicated scripts without a seed use the base seed stored in sweep_dir (default: script_sweep_dir),
+    so the same script makes the same runs every time (see sweep_base_seed).
+    """
+    from epicpy.epic.parallel_simulation import create_sim_configs_from_run_infos
+    from epicpy.epic.sweep_manifest import sweep_base_seed
+
+    base_seed = script.seed
+    if base_seed is None and script.replications > 1:
+        base_seed = sweep_base_seed(sweep_dir or script_sweep_dir(script))
+
+    return create_sim_configs_from_run_infos(
+        run_infos=script.run_infos(),
+        device_file="",
+        base_param_string="",
+        output_settings=output_settings,
+        run_command=script.run_command,
+        run_command_value=script.run_command_value,
+        replications=script.replications,
+        base_seed=base_seed,
+        **kwargs,
+    )
+
+
+def script_sweep_dir(script: SimulationScript) -> Path:
+    """Where a script's sweep manifest lives, so that interrupted scripts can be resumed."""
+    return script.path.with_name(f".{script.path.stem}_sweep")
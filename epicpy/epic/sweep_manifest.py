@@ -0,0 +1,177 @@
+"""
+This file is part of the EPICpy source code. EPICpy is a tool for simulating
+human performance tasks using the EPIC computational cognitive architecture
+(David Kieras and David Meyer 1997a) using the Python programming language.
+Copyright (C) 2022-2026 Travis L. Seymour, PhD
+
+This program is free software: you can redistribute it and/or modify
+it under the terms of the GNU General Public License as published by
+the Free Software Foundation, either version 3 of the License, or
+(at your option) any later version.
+
+This program is distributed in the hope that it will be useful,
+but WITHOUT ANY WARRANTY; without even the implied warranty of
+MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+GNU General Public License for more details.
+
+You should have received a copy of the GNU General Public License
+along with this program.  If not, see <https://www.gnu.org/licenses/>.
+"""
+
+"""
+Crash-safe record of the runs a parallel sweep has completed.
+
+Each finished run is appended to a JSON Lines manifest (and its data file copied next to it)
+as soon as its result reaches the parent process, so an interrupted sweep can later be resumed
+by skipping every run the manifest already lists as successful.
+
+The sweep folder also keeps the base seed of replicated sweeps that weren't given one (see
+sweep_base_seed), since every run's seed, and so its identity, is derived from it.
+"""
+
+import hashlib
+import json
+import os
+import shutil
+import warnings
+from dataclasses import astuple
+from pathlib import Path
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from epicpy.epic.parallel_simulation import SimulationConfig, SimulationResult
+
+SWEEP_DIR_NAME = ".epicpy_sweep"
+MANIFEST_NAME = "manifest.jsonl"
+BASE_SEED_NAME = "base_seed.txt"
+
+
+def _stable_path(path: str) -> str:
+    return str(Path(path).expanduser().resolve()) if path else ""
+
+
+def sweep_job_hash(sim_config: "SimulationConfig") -> str:
+    """
+    Stable identity of one sweep job: device, rule and encoder files plus the parameter string,
+    along with anything else that changes what the run does (run command, shared warm-up, replication).
+    """
+    parts = [
+        _stable_path(sim_config.device_file),
+        _stable_path(sim_config.rule_file),
+        _stable_path(sim_config.visual_encoder_file),
+        _stable_path(sim_config.auditory_encoder_file),
+        sim_config.parameter_string,
+        sim_config.run_command,
+        str(sim_config.run_command_value),
+        repr(astuple(sim_config.branch_point)) if sim_config.branch_point else "",
+        f"rep{sim_config.replication}|seed{sim_config.seed}",
+    ]
+    return hashlib.sha256("\0".join(parts).encode()).hexdigest()[:24]
+
+
+def sweep_base_seed(sweep_dir: Path) -> int:
+    """
+    The base seed for replicated sweeps recorded in sweep_dir that don't set their own: the one
+    stored there by an earlier sweep, or a new random one, stored for later sweeps. Without it,
+    every sweep would draw new seeds, so resuming it or looking its runs up in the result cache
+    would never find a run that already finished.
+    """
+    import random
+
+    path = Path(sweep_dir) / BASE_SEED_NAME
+    try:
+        return int(path.read_text(encoding="utf-8").strip())
+    except (OSError, ValueError):
+        pass
+    seed = random.SystemRandom().randrange(2**31)
+    try:
+        path.parent.mkdir(parents=True, exist_ok=True)
+        path.write_text(f"{seed}\n", encoding="utf-8")
+    except OSError as e:
+        warnings.warn(f"Unable to store the sweep's base seed in {path}, later sweeps will use another one: {e}")
+    return seed
+
+
+class SweepManifest:
+    """Append-only manifest of completed sweep jobs, stored in sweep_dir along with their data files."""
+
+    def __init__(self, sweep_dir: Path, resume: bool = False):
+        self.sweep_dir = Path(sweep_dir)
+        self.sweep_dir.mkdir(parents=True, exist_ok=True)
+        self.path = self.sweep_dir / MANIFEST_NAME
+        self.entries: dict[str, dict] = {}
+
+        if resume:
+            self.entries = self._load()
+        else:
+            self.reset()
+
+    def reset(self):
+        """Forget every recorded job and delete the stored data files."""
+        self.path.unlink(missing_ok=True)
+        for old_file in self.sweep_dir.glob("data_*.csv"):
+            old_file.unlink()
+        self.entries = {}
+
+    def _load(self) -> dict[str, dict]:
+        entries = {}
+        if not self.path.is_file():
+            return entries
+        with open(self.path, "r", encoding="utf-8") as f:
+            for line in f:
+                try:
+                    entry = json.loads(line)
+                except json.JSONDecodeError:
+                    continue  # e.g., a line cut short by a crash
+                if isinstance(entry, dict) and "job" in entry:
+                    entries[entry["job"]] = entry  # later entries win
+        return entries
+
+    def _ends_mid_line(self) -> bool:
+        if not self.path.is_file() or self.path.stat().st_size == 0:
+            return False
+        with open(self.path, "rb") as f:
+            f.seek(-1, os.SEEK_END)
+            return f.read(1) != b"\n"
+
+    def completed(self, sim_config: "SimulationConfig") -> dict | None:
+        """The manifest entry for sim_config if it already finished successfully, else None."""
+        entry = self.entries.get(sweep_job_hash(sim_config))
+        if not entry or not entry.get("success"):
+            return None
+        if entry.get("data_file") and not Path(entry["data_file"]).is_file():
+            return None  # its data is gone, so it has to run again
+        return entry
+
+    def record(self, result: "SimulationResult") -> dict:
+        """
+        Persist one finished job: copy its data file into the sweep folder, point the result at
+        that copy, and append an entry to the manifest (flushed to disk before returning).
+        """
+        job = sweep_job_hash(result.sim_config)
+
+        if result.data_file and Path(result.data_file).is_file():
+            stored = self.sweep_dir / f"data_{job}.csv"
+            shutil.copyfile(result.data_file, stored)
+            result.data_file = str(stored)
+
+        entry = {
+            "job": job,
+            "rule_file": result.sim_config.rule_file,
+            "parameter_string": result.sim_config.parameter_string,
+            "success": result.success,
+            "error_message": result.error_message,
+            "run_time_seconds": result.run_time_seconds,
+            "simulated_time_ms": result.simulated_time_ms,
+            "data_file": result.data_file,
+        }
+        line = json.dumps(entry) + "\n"
+        if self._ends_mid_line():
+            line = "\n" + line  # don't glue this entry onto a line cut short by a crash
+        with open(self.path, "a", encoding="utf-8") as f:
+            f.write(line)
+            f.flush()
+            os.fsync(f.fileno())
+
+        self.entries[job] = entry
+        return entry
@@ -33,7 +33,7 @@ from loguru import logger as log
 from qtpy.QtGui import QFontDatabase, QIcon
 from rich.console import Console
 
-from epicpy.cli import build_parser, do_cleanup
+from epicpy.cli import build_parser, do_cache, do_cleanup, do_run, do_script
 from epicpy.launcher.linux_launcher import (
     create_linux_desktop_entry,
     linux_desktop_entry_exists,
@@ -230,24 +230,12 @@ def main(argv: list[str] | None = None) -> int:
 
     _setup_crash_handler()
 
-    application = QApplication([])
-
-    app_icon = QIcon()
-    for size in [16, 24, 32, 48, 64, 128, 256, 512]:
-        try:
-            icon_path = get_resource("images", "appicon", f"icon_{size}.png")
-            app_icon.addFile(str(icon_path))
-        except FileNotFoundError:
-            log.warning("Problem setting app window icon!")
-    application.setWindowIcon(app_icon)
-
-    print("Loading EPICpy, please wait...")
-
     try:
         from epicpy import __version__
     except Exception:
         __version__ = "Unknown!"
 
+    # Parse arguments before any Qt objects exist so headless commands never touch the GUI
     parser = build_parser(__version__)
     args = parser.parse_args(argv)
 
@@ -259,6 +247,25 @@ def main(argv: list[str] | None = None) -> int:
     # Commands
     if args.command == "cleanup":
         return do_cleanup(args.name)
+    if args.command == "run":
+        return do_run(args)
+    if args.command == "cache":
+        return do_cache(args)
+    if args.command == "script":
+        return do_script(args)
+
+    application = QApplication([])
+
+    app_icon = QIcon()
+    for size in [16, 24, 32, 48, 64, 128, 256, 512]:
+        try:
+            icon_path = get_resource("images", "appicon", f"icon_{size}.png")
+            app_icon.addFile(str(icon_path))
+        except FileNotFoundError:
+            log.warning("Problem setting app window icon!")
+    application.setWindowIcon(app_icon)
+
+    print("Loading EPICpy, please wait...")
 
     # create launcher on first launch of epicpy
     print(f"{platform.system()=}")
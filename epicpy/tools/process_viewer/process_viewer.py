@@ -134,7 +134,7 @@ class ProcessViewerWindow(QMainWindow):
     def _process_trace_data(self) -> float:
         """Process all lines from the trace widget."""
         start = timeit.default_timer()
-        self.scheduler.process_lines(self.trace_widget.lines)
+        self.scheduler.process_lines(self.trace_widget.iter_lines())
         elapsed = timeit.default_timer() - start
         return elapsed
 
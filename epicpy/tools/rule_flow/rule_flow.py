@@ -186,7 +186,7 @@ class RuleFlowWindow(QMainWindow):
 
     def update_graph_edges(self):
         self.scheduler = RegexScheduler()
-        self.scheduler.process_lines(self.trace_widget.lines)
+        self.scheduler.process_lines(self.trace_widget.iter_lines())
 
     def center_me(self):
         center_point = QGuiApplication.screens()[0].geometry().center()
@@ -298,6 +298,22 @@ class Ui_DialogRunSettings(object):
 
         self.horizontalLayout_6.addWidget(self.spinBoxTimeDelay)
 
+        self.label_6 = QLabel(DialogRunSettings)
+        self.label_6.setObjectName(u"label_6")
+
+        self.horizontalLayout_6.addWidget(self.label_6)
+
+        self.spinBoxStepBudget = QSpinBox(DialogRunSettings)
+        self.spinBoxStepBudget.setObjectName(u"spinBoxStepBudget")
+        self.spinBoxStepBudget.setMinimumSize(QSize(150, 0))
+        self.spinBoxStepBudget.setFont(font2)
+        self.spinBoxStepBudget.setMinimum(0)
+        self.spinBoxStepBudget.setMaximum(1000)
+        self.spinBoxStepBudget.setSingleStep(1)
+        self.spinBoxStepBudget.setValue(16)
+
+        self.horizontalLayout_6.addWidget(self.spinBoxStepBudget)
+
         self.horizontalSpacer_5 = QSpacerItem(388, 20, QSizePolicy.Policy.Expanding, QSizePolicy.Policy.Minimum)
 
         self.horizontalLayout_6.addItem(self.horizontalSpacer_5)
@@ -349,6 +365,21 @@ class Ui_DialogRunSettings(object):
 
         self.horizontalLayout.addWidget(self.pushButtonResetParams)
 
+        self.label_7 = QLabel(DialogRunSettings)
+        self.label_7.setObjectName(u"label_7")
+        self.label_7.setFont(font2)
+
+        self.horizontalLayout.addWidget(self.label_7)
+
+        self.spinBoxReplications = QSpinBox(DialogRunSettings)
+        self.spinBoxReplications.setObjectName(u"spinBoxReplications")
+        self.spinBoxReplications.setFont(font2)
+        self.spinBoxReplications.setMinimum(1)
+        self.spinBoxReplications.setMaximum(10000)
+        self.spinBoxReplications.setValue(1)
+
+        self.horizontalLayout.addWidget(self.spinBoxReplications)
+
         self.horizontalSpacer = QSpacerItem(40, 20, QSizePolicy.Policy.Expanding, QSizePolicy.Policy.Minimum)
 
         self.horizontalLayout.addItem(self.horizontalSpacer)
@@ -444,12 +475,21 @@ class Ui_DialogRunSettings(object):
         self.radioButtonRefreshNoneText.setText(QCoreApplication.translate("DialogRunSettings", u"None During Run", None))
         self.label_4.setText(QCoreApplication.translate("DialogRunSettings", u"Real Time Per Step ", None))
         self.spinBoxTimeDelay.setSuffix(QCoreApplication.translate("DialogRunSettings", u" msec(s)", None))
+        self.label_6.setText(QCoreApplication.translate("DialogRunSettings", u"Run Budget Per Refresh ", None))
+#if QT_CONFIG(tooltip)
+        self.spinBoxStepBudget.setToolTip(QCoreApplication.translate("DialogRunSettings", u"When Real Time Per Step is 0, run as many 50 msec steps as fit in this much wall-clock time before letting the UI refresh (0 = one step per refresh). Not used when Real Time Per Step is above 0: each refresh then runs a single step.", None))
+#endif // QT_CONFIG(tooltip)
+        self.spinBoxStepBudget.setSuffix(QCoreApplication.translate("DialogRunSettings", u" msec(s)", None))
         self.pushButtonRunContinuously.setText(QCoreApplication.translate("DialogRunSettings", u"Run continuously at maximum rate without display or text refresh", None))
         self.label_3.setText(QCoreApplication.translate("DialogRunSettings", u"Device Parameter String", None))
 #if QT_CONFIG(whatsthis)
         self.pushButtonResetParams.setWhatsThis(QCoreApplication.translate("DialogRunSettings", u"<html><head/><body><p><span style=\" font-size:12pt;\">Reset the device parameter string to the device default.</span></p></body></html>", None))
 #endif // QT_CONFIG(whatsthis)
         self.pushButtonResetParams.setText(QCoreApplication.translate("DialogRunSettings", u"Reset", None))
+        self.label_7.setText(QCoreApplication.translate("DialogRunSettings", u"Replications", None))
+#if QT_CONFIG(tooltip)
+        self.spinBoxReplications.setToolTip(QCoreApplication.translate("DialogRunSettings", u"Number of seeded runs of each parameter permutation in a parallel run.", None))
+#endif // QT_CONFIG(tooltip)
 #if QT_CONFIG(whatsthis)
         self.pushButtonDeleteData.setWhatsThis(QCoreApplication.translate("DialogRunSettings", u"<html><head/><body><p><span style=\" font-size:12pt;\">If the current device exposes a method called </span><span style=\" font-size:12pt; font-weight:600;\">delete_data_file()</span><span style=\" font-size:12pt;\">, this button will trigger it. Otherwise, this button will not be shown.</span></p></body></html>", None))
 #endif // QT_CONFIG(whatsthis)
@@ -62,6 +62,7 @@ class AppConfig:
     text_editor: str = ""  # defaults to BUILT-IN editor
     config_file: str = ""
     show_full_error_trace: bool = False
+    output_disk_threshold_lines: int = 1_000_000  # Normal/Trace outputs longer than this are kept on disk (0 = never)
 
     # will hold temporary config data, will not be saved to config file
     current: dict = field(default_factory=dict)
@@ -163,6 +164,7 @@ class DeviceConfig:
     speech_text_gender: bool = False
 
     step_time_delay: int = 0
+    step_time_budget: int = 16  # msec of wall time to keep stepping per UI tick, only used when step_time_delay is 0
     setting_run_for_real_secs: int = 5
     setting_run_until_msecs: int = 600
     setting_run_cycles: int = 1
@@ -177,6 +179,20 @@ class DeviceConfig:
     describe_parameters: bool = False
     allow_device_images: bool = False
     allow_parallel_runs: bool = True
+    parallel_warm_workers: bool = True  # parallel workers reuse the loaded device/rules across permutations
+    parallel_spill_outputs: bool = True  # parallel workers write their output to disk instead of returning it in memory
+    parallel_compress_outputs: bool = False  # gzip spilled parallel worker output
+    parallel_capture_tail_lines: int = 1000  # Normal/Trace lines kept for all but the final parallel run (0 keeps all)
+    parallel_rule_files: bool = False  # several loaded rule files run as one parallel job set instead of one by one
+    parallel_resume_sweeps: bool = False  # parallel runs keep a sweep manifest and skip runs an interrupted sweep finished
+    parallel_result_cache: bool = False  # parallel runs reuse cached results of unchanged configurations
+    parallel_replications: int = 1  # seeded runs of each parameter permutation in a parallel run
+    parallel_data_format: str = "csv"  # merged data of parallel runs: "csv", "parquet" or "arrow"
+    parallel_legacy_csv: bool = True  # with parquet/arrow, also write data_output.csv
+    parallel_staging: str = "symlink"  # how device subfolders reach parallel runs: "symlink", or read-only "hardlink" or "copy"
+    parallel_max_wall_seconds: int = 0  # parallel runs taking longer than this are stopped and reported as failed (0 = no limit)
+    parallel_max_simulated_ms: int = 0  # ... or running past this much simulated time
+    parallel_max_rss_mb: int = 0  # ... or using more than this much memory
 
     device_config_file: str = ""
 
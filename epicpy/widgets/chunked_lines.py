@@ -0,0 +1,108 @@
+"""
+This file is part of the EPICpy source code. EPICpy is a tool for simulating
+human performance tasks using the EPIC computational cognitive architecture
+(David Kieras and David Meyer 1997a) using the Python programming language.
+Copyright (C) 2022-2026 Travis L. Seymour, PhD
+
+This program is free software: you can redistribute it and/or modify
+it under the terms of the GNU General Public License as published by
+the Free Software Foundation, either version 3 of the License, or
+(at your option) any later version.
+
+This program is distributed in the hope that it will be useful,
+but WITHOUT ANY WARRANTY; without even the implied warranty of
+MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+GNU General Public License for more details.
+
+You should have received a copy of the GNU General Public License
+along with this program.  If not, see <https://www.gnu.org/licenses/>.
+"""
+
+"""
+ChunkedLines - the line store behind MemLargeTextView.
+
+Lines are kept in fixed-size blocks, and every block but the last is full, so line i is
+always blocks[i // BLOCK_SIZE][i % BLOCK_SIZE]. Indexing is O(1) anywhere in the text (a deque
+is O(n) toward the middle), appending never copies the lines already stored (a single list
+occasionally copies all of them to grow), and slices only touch the blocks they span.
+"""
+
+from collections.abc import Iterable, Iterator, Sequence
+from itertools import islice
+
+BLOCK_SIZE = 4096
+
+
+class ChunkedLines(Sequence[str]):
+    """Append-only sequence of lines with O(1) random access."""
+
+    __slots__ = ("_blocks", "_len")
+
+    def __init__(self, lines: Iterable[str] = ()):
+        self._blocks: list[list[str]] = []
+        self._len = 0
+        self.extend(lines)
+
+    def __len__(self) -> int:
+        return self._len
+
+    def __getitem__(self, index):
+        if isinstance(index, slice):
+            return self._slice(*index.indices(self._len))
+        if index < 0:
+            index += self._len
+        if not 0 <= index < self._len:
+            raise IndexError("line index out of range")
+        block, offset = divmod(index, BLOCK_SIZE)
+        return self._blocks[block][offset]
+
+    def _slice(self, start: int, stop: int, step: int) -> list[str]:
+        if step != 1:
+            return [self[i] for i in range(start, stop, step)]
+        lines = []
+        while start < stop:
+            block, offset = divmod(start, BLOCK_SIZE)
+            take = min(stop - start, BLOCK_SIZE - offset)
+            lines.extend(self._blocks[block][offset : offset + take])
+            start += take
+        return lines
+
+    def __iter__(self) -> Iterator[str]:
+        for block in self._blocks:
+            yield from block
+
+    def append(self, line: str):
+        if not self._blocks or len(self._blocks[-1]) == BLOCK_SIZE:
+            self._blocks.append([])
+        self._blocks[-1].append(line)
+        self._len += 1
+
+    def extend(self, lines: Iterable[str]):
+        if lines is self:
+            lines = list(lines)
+        source = iter(lines)
+
+        # Top up the last block first, so that every block but the last stays full
+        if self._blocks and len(self._blocks[-1]) < BLOCK_SIZE:
+            last = self._blocks[-1]
+            before = len(last)
+            last.extend(islice(source, BLOCK_SIZE - before))
+            self._len += len(last) - before
+
+        while True:
+            block = list(islice(source, BLOCK_SIZE))
+            if not block:
+                break
+            self._blocks.append(block)
+            self._len += len(block)
+
+    def __iadd__(self, lines: Iterable[str]) -> "ChunkedLines":
+        self.extend(lines)
+        return self
+
+    def clear(self):
+        self._blocks = []
+        self._len = 0
+
+    def __repr__(self) -> str:
+        return f"ChunkedLines({self._len} lines)"
@@ -0,0 +1,262 @@
+"""
+This file is part of the EPICpy source code. EPICpy is a tool for simulating
+human performance tasks using the EPIC computational cognitive architecture
+(David Kieras and David Meyer 1997a) using the Python programming language.
+Copyright (C) 2022-2026 Travis L. Seymour, PhD
+
+This program is free software: you can redistribute it and/or modify
+it under the terms of the GNU General Public License as published by
+the Free Software Foundation, either version 3 of the License, or
+(at your option) any later version.
+
+This program is distributed in the hope that it will be useful,
+but WITHOUT ANY WARRANTY; without even the implied warranty of
+MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+GNU General Public License for more details.
+
+You should have received a copy of the GNU General Public License
+along with this program.  If not, see <https://www.gnu.org/licenses/>.
+"""
+
+"""
+FileBackedLines - a disk-backed line store for MemLargeTextView.
+
+Lines are appended to a temporary UTF-8 file, one per line, and only the byte offset of each
+line (8 bytes in an array('Q')) stays in memory. Lines are read back through an mmap of the
+file, so a view can hold traces of tens of millions of lines with a flat memory footprint.
+The file holds exactly what MemLargeTextView.save() would write, so saving is a file copy.
+
+FileBackedLines.from_file() reads an existing file the same way (read-only). Its lines are
+indexed as scan_line_offsets() finds them, so a huge file can be shown before it has all been read.
+"""
+
+import mmap
+import os
+import shutil
+import tempfile
+import weakref
+from array import array
+from collections.abc import Iterable, Iterator, Sequence
+from pathlib import Path
+from typing import Callable, Optional
+
+
+def _discard_file(file, path: Optional[str]):
+    file.close()
+    if path is None:
+        return  # not ours to delete
+    try:
+        os.remove(path)
+    except OSError:
+        pass
+
+
+def _decode(data: bytes, strip_cr: bool) -> str:
+    text = data.decode("utf-8", "replace")
+    if strip_cr and "\r" in text:
+        # Opened files may have Windows line endings, which (as in MemLargeTextView.write) aren't part of a line
+        text = "\n".join(line.rstrip("\r") for line in text.split("\n"))
+    return text
+
+
+def scan_line_offsets(
+    path: str | Path, cancelled: Optional[Callable[[], bool]] = None, chunk_bytes: int = 16 * 1024 * 1024
+) -> Iterator[tuple[array, int]]:
+    """
+    Byte offsets of the lines of a text file, yielded a chunk of the file at a time as (offsets, end),
+    where end is the byte offset just past the newline ending the last of them (see
+    FileBackedLines.add_offsets). Stops early once cancelled() is True.
+    """
+    import numpy as np
+
+    with open(path, "rb") as f:
+        position = 0  # file offset of the chunk
+        line_start = 0  # offset of the line that the next newline ends
+        while True:
+            if cancelled is not None and cancelled():
+                return
+            chunk = f.read(chunk_bytes)
+            if not chunk:
+                break
+            ends = np.flatnonzero(np.frombuffer(chunk, dtype=np.uint8) == 10).astype(np.uint64) + (position + 1)
+            position += len(chunk)
+            if not len(ends):
+                continue
+            offsets = array("Q", [line_start])
+            offsets.frombytes(ends[:-1].tobytes())
+            line_start = int(ends[-1])
+            yield offsets, line_start
+        if line_start < position:
+            # The last line has no newline; pretend it has one, so it ends (like every other line) one byte before its end
+            yield array("Q", [line_start]), position + 1
+
+
+class FileBackedLines(Sequence[str]):
+    """Append-only sequence of lines stored in a temporary file and read through mmap."""
+
+    def __init__(self, lines: Iterable[str] = (), directory: str | Path | None = None):
+        fd, self.path = tempfile.mkstemp(prefix="epicpy_output_", suffix=".txt", dir=directory)
+        self._file = os.fdopen(fd, "w+b")
+        self._offsets = array("Q")  # byte offset of each line
+        self._size = 0  # bytes written (some may still be in the write buffer)
+        self._map: mmap.mmap | None = None
+        self._mapped_size = 0
+        self._read_only = False
+        self._finalizer = weakref.finalize(self, _discard_file, self._file, self.path)
+        self.extend(lines)
+
+    @classmethod
+    def from_file(cls, path: str | Path) -> "FileBackedLines":
+        """
+        Read-only lines of an existing text file, which is left in place by close(). None of its
+        lines are indexed yet: pass them to add_offsets() as scan_line_offsets() finds them.
+        """
+        lines = cls.__new__(cls)
+        lines.path = str(path)
+        lines._file = open(path, "rb")
+        lines._offsets = array("Q")
+        lines._size = 0  # end of the indexed lines
+        lines._map = None
+        lines._mapped_size = 0
+        lines._read_only = True
+        lines._finalizer = weakref.finalize(lines, _discard_file, lines._file, None)
+        return lines
+
+    @property
+    def read_only(self) -> bool:
+        return self._read_only
+
+    def add_offsets(self, offsets: array, end: int):
+        """Index more lines of an opened file: their byte offsets and the offset just past the last of them."""
+        self._offsets.extend(offsets)
+        self._size = end
+
+    def __len__(self) -> int:
+        return len(self._offsets)
+
+    def _end(self, index: int) -> int:
+        """Byte offset just past the newline ending line index."""
+        return self._offsets[index + 1] if index + 1 < len(self._offsets) else self._size
+
+    def _mapped(self) -> mmap.mmap:
+        """The mmap of the file, remapped if lines were appended since it was made."""
+        if self._map is None or self._mapped_size < self._size:
+            self._file.flush()
+            if self._map is not None:
+                self._map.close()
+            self._map = mmap.mmap(self._file.fileno(), 0, access=mmap.ACCESS_READ)
+            self._mapped_size = self._size
+        return self._map
+
+    def _read(self, begin: int, end: int) -> str:
+        return _decode(self._mapped()[begin:end], self._read_only)
+
+    def __getitem__(self, index):
+        if isinstance(index, slice):
+            start, stop, step = index.indices(len(self._offsets))
+            if step != 1:
+                return [self[i] for i in range(start, stop, step)]
+            return [self._read(self._offsets[i], self._end(i) - 1) for i in range(start, stop)]
+        if index < 0:
+            index += len(self._offsets)
+        if not 0 <= index < len(self._offsets):
+            raise IndexError("line index out of range")
+        return self._read(self._offsets[index], self._end(index) - 1)
+
+    def __iter__(self) -> Iterator[str]:
+        for i in range(len(self._offsets)):
+            yield self[i]
+
+    def joined(self, start: int, stop: int) -> str:
+        """Lines start to stop joined with newlines, read from the file in one piece."""
+        if start >= stop:
+            return ""
+        return self._read(self._offsets[start], self._end(stop - 1) - 1)
+
+    def read_joined(self, ranges: list[tuple[int, int]]) -> Iterator[str]:
+        """
+        Lazily read joined(start, stop) for each (start, stop) range through a file handle of its
+        own, so another thread can read lines already written while this one appends more.
+        """
+        spans = [(self._offsets[start], self._end(stop - 1) - 1) for start, stop in ranges if start < stop]
+        self._file.flush()
+        path, strip_cr = self.path, self._read_only
+
+        def read():
+            with open(path, "rb") as f:
+                for begin, end in spans:
+                    f.seek(begin)
+                    yield _decode(f.read(end - begin), strip_cr)
+
+        return read()
+
+    def iter_file(self) -> Iterator[str]:
+        """
+        Lazily read every line in the file through a file handle of its own, including the lines of an
+        opened file that haven't been indexed yet.
+        """
+        self._file.flush()
+        path, strip_cr = self.path, self._read_only
+
+        def read():
+            with open(path, "rb") as f:
+                for data in f:
+                    yield _decode(data[:-1] if data.endswith(b"\n") else data, strip_cr)
+
+        return read()
+
+    def append(self, line: str):
+        self.extend((line,))
+
+    def _check_writable(self):
+        if self._read_only:
+            raise ValueError(f"lines opened from {self.path} are read-only")
+
+    def extend(self, lines: Iterable[str]):
+        self._check_writable()
+        if lines is self:
+            lines = list(lines)
+        self._file.seek(0, os.SEEK_END)
+        chunk = []
+        for line in lines:
+            data = line.encode("utf-8", "replace") + b"\n"
+            self._offsets.append(self._size)
+            self._size += len(data)
+            chunk.append(data)
+            if len(chunk) >= 4096:
+                self._file.write(b"".join(chunk))
+                chunk = []
+        if chunk:
+            self._file.write(b"".join(chunk))
+
+    def __iadd__(self, lines: Iterable[str]) -> "FileBackedLines":
+        self.extend(lines)
+        return self
+
+    def clear(self):
+        self._check_writable()
+        if self._map is not None:
+            self._map.close()  # a mapped file can't be truncated on Windows
+            self._map = None
+        self._file.seek(0)
+        self._file.truncate()
+        self._offsets = array("Q")
+        self._size = 0
+        self._mapped_size = 0
+
+    def save(self, path: str | Path):
+        """Write every line (each followed by a newline) to path, which is just a copy of the backing file."""
+        self._file.flush()
+        if Path(path).exists() and os.path.samefile(path, self.path):
+            return  # e.g., saving an opened file over itself
+        shutil.copyfile(self.path, path)
+
+    def close(self):
+        """Release the mmap and delete the backing file (unless it was opened with from_file)."""
+        if self._map is not None:
+            self._map.close()
+            self._map = None
+        self._finalizer()
+
+    def __repr__(self) -> str:
+        return f"FileBackedLines({len(self._offsets)} lines in {self.path})"
@@ -20,17 +20,22 @@ along with this program.  If not, see <https://www.gnu.org/licenses/>.
 
 from __future__ import annotations
 
-import bisect
 import re
+import threading
+import time
+import warnings
 from collections import deque
+from collections.abc import Iterator, Sequence
 from dataclasses import dataclass
+from functools import partial
 from pathlib import Path
-from typing import Callable, Optional
+from typing import Callable, Iterable, Optional
 
 from PySide6.QtCore import (
     QEvent,
     QPoint,
     Qt,
+    QThread,
     Signal,
 )
 from PySide6.QtGui import (
@@ -65,8 +70,12 @@ from PySide6.QtWidgets import (
     QWidget,
 )
 
+from epicpy.widgets.chunked_lines import ChunkedLines
+from epicpy.widgets.file_lines import FileBackedLines, scan_line_offsets
+from epicpy.widgets.search_index import MatchIndex, SearchIndex, find_all
+
 """
-MemLargeTextView - A text viewer backed by an in-memory deque.
+MemLargeTextView - A text viewer backed by an in-memory line store (see chunked_lines.py).
 """
 
 _MAX_SEARCH_HISTORY = 50
@@ -137,12 +146,18 @@ class SearchDialog(QDialog):
         button_layout = QHBoxLayout()
         self.find_next_btn = QPushButton("Find Next")
         self.find_prev_btn = QPushButton("Find Previous")
+        self.find_all_btn = QPushButton("Find All")
         self.close_btn = QPushButton("Close")
         button_layout.addWidget(self.find_prev_btn)
         button_layout.addWidget(self.find_next_btn)
+        button_layout.addWidget(self.find_all_btn)
         button_layout.addWidget(self.close_btn)
         layout.addLayout(button_layout)
 
+        # Match count (Find All) or position of the current match
+        self.status_label = QLabel("")
+        layout.addWidget(self.status_label)
+
         self.close_btn.clicked.connect(self.hide)
         line_edit = self.search_input.lineEdit()
         if line_edit:
@@ -180,6 +195,68 @@ class SearchDialog(QDialog):
     def is_regex(self) -> bool:
         return self.regex_mode.isChecked()
 
+    def set_status(self, text: str):
+        self.status_label.setText(text)
+
+
+class FindAllThread(QThread):
+    """Finds every match of a query in a snapshot of SearchIndex blocks, streaming them back as signals."""
+
+    matches_found = Signal(object, object)  # (array of start offsets, array of end offsets), in order
+    search_finished = Signal(bool)  # cancelled
+
+    def __init__(self, blocks: Iterable[tuple[int, str]], pattern: str | re.Pattern, lower: bool, parent=None):
+        super().__init__(parent)
+        self.blocks = blocks
+        self.pattern = pattern
+        self.lower = lower
+        self._cancel_event = threading.Event()
+
+    def cancel(self):
+        self._cancel_event.set()
+
+    def run(self):
+        starts, ends = None, None
+        last_emit = time.monotonic()
+        for block_starts, block_ends in find_all(self.blocks, self.pattern, self.lower, self._cancel_event.is_set):
+            if starts is None:
+                starts, ends = block_starts, block_ends
+            else:
+                starts.extend(block_starts)
+                ends.extend(block_ends)
+            # Send matches in batches, so a query matching most lines doesn't flood the GUI thread with signals
+            if time.monotonic() - last_emit > 0.1:
+                self.matches_found.emit(starts, ends)
+                starts, ends = None, None
+                last_emit = time.monotonic()
+        if starts is not None:
+            self.matches_found.emit(starts, ends)
+        self.search_finished.emit(self._cancel_event.is_set())
+
+
+class LineIndexThread(QThread):
+    """Finds where the lines of a file start (see scan_line_offsets), streaming them back as signals."""
+
+    lines_found = Signal(object, object)  # (array of line offsets, byte offset just past the last of those lines)
+    indexing_finished = Signal(bool)  # cancelled
+
+    def __init__(self, path: str, parent=None):
+        super().__init__(parent)
+        self.path = path
+        self.error: Optional[str] = None
+        self._cancel_event = threading.Event()
+
+    def cancel(self):
+        self._cancel_event.set()
+
+    def run(self):
+        try:
+            for offsets, end in scan_line_offsets(self.path, self._cancel_event.is_set):
+                self.lines_found.emit(offsets, end)
+        except OSError as e:
+            self.error = str(e)
+        self.indexing_finished.emit(self._cancel_event.is_set())
+
 
 class GoToLineDialog(QDialog):
     """Dialog to jump to a specific line."""
@@ -214,9 +291,12 @@ class GoToLineDialog(QDialog):
 
 class MemLargeTextView(QAbstractScrollArea):
     """
-    Text viewer backed by an in-memory deque.
+    Text viewer backed by an in-memory line store with O(1) access to any line.
+    Once it holds more than disk_threshold_lines lines (if not 0), they are moved to a file
+    and read back through mmap instead (see file_lines.py).
 
-    Supports write() to append text and load() to adopt an existing deque.
+    Supports write() to append text and load() to append existing lines (e.g., a deque), and
+    open_file() to show a saved output file without reading it into memory.
     Renders only visible lines for efficiency.
     """
 
@@ -227,6 +307,7 @@ class MemLargeTextView(QAbstractScrollArea):
         self,
         parent: Optional[QWidget] = None,
         commands: Optional[dict[str, Callable]] = None,
+        disk_threshold_lines: int = 0,
     ):
         super().__init__(parent)
 
@@ -236,7 +317,8 @@ class MemLargeTextView(QAbstractScrollArea):
         # Memory storage - double buffer system
         self._write_buffer: deque[str] = deque()  # Temp buffer where writes go
         self._partial_text: str = ""  # Buffer for text without trailing newline
-        self._lines: deque[str] = deque()  # Display buffer that paintEvent draws from
+        self._lines: ChunkedLines | FileBackedLines = ChunkedLines()  # Display buffer that paintEvent draws from
+        self._disk_threshold_lines = max(0, disk_threshold_lines)
 
         # Display settings
         # self._font = QFont("Monospace", 12)
@@ -271,9 +353,15 @@ class MemLargeTextView(QAbstractScrollArea):
         self._current_match_index = -1
         self._search_dialog: Optional[SearchDialog] = None
 
-        # Search cache for fast searching (joined text + char offsets)
-        self._search_text: Optional[str] = None  # Cached "\n".join(lines)
-        self._char_offsets: list[int] = []  # Character offset for start of each line
+        # Search index, extended with new lines on the next search (see search_index.py)
+        self._search_index = SearchIndex()
+
+        # Find All: every match of the last Find All query, and the thread still looking for more
+        self._match_index: Optional[MatchIndex] = None
+        self._find_all_thread: Optional[FindAllThread] = None
+
+        # Finds the lines of a file shown with open_file()
+        self._line_index_thread: Optional[LineIndexThread] = None
 
         # Horizontal scroll
         self._max_line_width = 0
@@ -303,6 +391,10 @@ class MemLargeTextView(QAbstractScrollArea):
         # Apply initial theme
         self.update_theme()
 
+        # Don't leave a Find All or line index thread running at exit
+        QApplication.instance().aboutToQuit.connect(self._cancel_find_all)
+        QApplication.instance().aboutToQuit.connect(self._cancel_line_indexing)
+
     def _setup_shortcuts(self):
         """
         Setup keyboard shortcuts.
@@ -416,11 +508,13 @@ class MemLargeTextView(QAbstractScrollArea):
     # Memory Loading / Writing
     # -------------------------------------------------------------------------
 
-    def load(self, lines: deque[str]):
+    def load(self, lines: Iterable[str]):
         """
-        Extend the widget's display buffer with lines from another deque.
-        The provided lines are appended to existing displayed content.
+        Extend the widget's display buffer with lines from a deque (or any other iterable).
+        The provided lines are appended to existing displayed content (or replace an opened file).
         """
+        if self.is_opened_file():
+            self._drop_lines()
         self._lines += lines
         self._on_content_changed()
 
@@ -459,29 +553,112 @@ class MemLargeTextView(QAbstractScrollArea):
         """
         Transfer all content from the write buffer to the display buffer
         and refresh the display. Flushes any partial text first.
+        Written text replaces an opened file (see open_file).
         """
         # First flush any partial text to write buffer
         self.flush()
 
         # Transfer write buffer to display buffer
         if self._write_buffer:
+            if self.is_opened_file():
+                self._drop_lines()
             self._lines += self._write_buffer
             self._write_buffer.clear()
 
         self._on_content_changed()
 
+    def set_disk_threshold(self, lines: int):
+        """Keep the display buffer on disk once it holds more than lines lines (0: always keep it in memory)."""
+        self._disk_threshold_lines = max(0, int(lines))
+        self._move_lines_to_disk_if_large()
+
+    def is_disk_backed(self) -> bool:
+        return isinstance(self._lines, FileBackedLines)
+
+    def is_opened_file(self) -> bool:
+        """Whether the view shows a file opened with open_file()."""
+        return self.is_disk_backed() and self._lines.read_only
+
+    def is_indexing(self) -> bool:
+        """Whether the lines of an opened file are still being found."""
+        return self._line_index_thread is not None
+
+    def open_file(self, file: str | Path) -> bool:
+        """
+        Show an existing text file (e.g., written by save() or by a headless run) instead of the current
+        content, without reading it into memory: lines are read back through mmap as needed, and the
+        index of where they start is built on a background thread, with lines showing up as they are
+        found. The file itself is never changed. Returns False if the file can't be opened.
+        """
+        self._write_buffer.clear()
+        self._partial_text = ""
+        self._drop_lines()
+        try:
+            file_lines = FileBackedLines.from_file(file)
+        except OSError:
+            self._on_content_changed()
+            return False
+        self._lines = file_lines
+        self._on_content_changed()
+
+        thread = LineIndexThread(file_lines.path, parent=self)
+        thread.lines_found.connect(partial(self._on_lines_found, file_lines))
+        thread.indexing_finished.connect(partial(self._on_indexing_finished, file_lines, thread))
+        self._line_index_thread = thread
+        thread.start()
+        return True
+
+    def _on_lines_found(self, file_lines: FileBackedLines, offsets, end: int):
+        if file_lines is not self._lines:
+            return  # from a file that has since been replaced
+        first_batch = len(file_lines) == 0
+        file_lines.add_offsets(offsets, end)
+        # Unlike _on_content_changed, keep the selection and scroll position while lines come in
+        self._update_line_number_width()
+        self._update_scrollbars()
+        self.viewport().update()
+        if first_batch:
+            self.content_changed.emit(len(self._lines))  # listeners get the rest once indexing finishes
+
+    def _on_indexing_finished(self, file_lines: FileBackedLines, thread: LineIndexThread, cancelled: bool):
+        thread.wait()
+        thread.deleteLater()
+        if self._line_index_thread is thread:
+            self._line_index_thread = None
+        if file_lines is not self._lines or cancelled:
+            return
+        if thread.error:
+            warnings.warn(f"Unable to read all of {file_lines.path}: {thread.error}")
+        self.content_changed.emit(len(self._lines))
+
+    def _cancel_line_indexing(self):
+        if self._line_index_thread is not None:
+            self._line_index_thread.cancel()
+            self._line_index_thread.wait()  # quick: the thread checks for cancellation between chunks of the file
+            self._line_index_thread = None
+
+    def _move_lines_to_disk_if_large(self):
+        if not self._disk_threshold_lines or self.is_disk_backed() or len(self._lines) <= self._disk_threshold_lines:
+            return
+        self._cancel_find_all()
+        try:
+            file_lines = FileBackedLines(self._lines)
+        except OSError as e:
+            warnings.warn(f"Unable to move {self.objectName() or 'output'} to disk, keeping it in memory: {e}")
+            self._disk_threshold_lines = 0
+            return
+        self._lines = file_lines
+        self._search_index.clear()  # re-indexed from the file on the next search
+
     def _on_content_changed(self):
         """Handle content changes - update display."""
+        self._move_lines_to_disk_if_large()
         self._selection = None
         self._search_matches = []
         self._current_match_index = -1
         self._max_line_width = 0
         self._horizontal_offset = 0
 
-        # Invalidate search cache
-        self._search_text = None
-        self._char_offsets = []
-
         self._update_line_number_width()
         self._update_scrollbars()
         self.viewport().update()
@@ -494,9 +671,21 @@ class MemLargeTextView(QAbstractScrollArea):
         """
         self._write_buffer.clear()
         self._partial_text = ""
-        self._lines.clear()
+        self._drop_lines()
         self._on_content_changed()
 
+    def _drop_lines(self):
+        """Empty the display buffer, closing its file (and deleting it, unless it was opened) if it has one."""
+        self._cancel_line_indexing()
+        self._cancel_find_all()
+        if self.is_disk_backed():
+            self._lines.close()
+            self._lines = ChunkedLines()
+        else:
+            self._lines.clear()
+        self._search_index.clear()
+        self._match_index = None
+
     def save(self, file: str | Path) -> bool:
         """
         Save all text to the specified file.
@@ -504,6 +693,9 @@ class MemLargeTextView(QAbstractScrollArea):
         """
         try:
             path = Path(file) if isinstance(file, str) else file
+            if self.is_disk_backed():
+                self._lines.save(path)  # the backing file already holds exactly this
+                return True
             with open(path, "w", encoding="utf-8") as f:
                 f.writelines(f"{line}\n" for line in self._lines)
             return True
@@ -514,14 +706,21 @@ class MemLargeTextView(QAbstractScrollArea):
         return len(self._lines)
 
     @property
-    def lines(self) -> deque[str]:
+    def lines(self) -> Sequence[str]:
         return self._lines
 
+    def iter_lines(self) -> Iterator[str]:
+        """
+        Every line, in order. Unlike lines, this includes the lines of an opened file that haven't
+        been indexed yet, which are read straight from the file.
+        """
+        if self.is_indexing():
+            return self._lines.iter_file()
+        return iter(self._lines)
+
     def get_text(self) -> str:
         """
         Return all content as a single string."""
-        if self._search_text is not None:
-            return self._search_text
         return "\n".join(self._lines)
 
     # -------------------------------------------------------------------------
@@ -536,10 +735,7 @@ class MemLargeTextView(QAbstractScrollArea):
 
     def _get_lines_range(self, start_line: int, count: int) -> list[str]:
         """Get multiple lines."""
-        lines = []
-        for i in range(start_line, min(start_line + count, len(self._lines))):
-            lines.append(self._lines[i])
-        return lines
+        return self._lines[max(0, start_line) : start_line + count]
 
     # -------------------------------------------------------------------------
     # Scrolling
@@ -721,10 +917,16 @@ class MemLargeTextView(QAbstractScrollArea):
         painter.fillRect(x1, y, x2 - x1, self._line_height, self._selection_bg)
 
     def _draw_search_highlights_for_line(self, painter: QPainter, line_idx: int, line_text: str, y: int, text_x: int):
-        for match_line, start_col, end_col in self._search_matches:
-            if match_line != line_idx:
-                continue
+        matches = [(start_col, end_col) for match_line, start_col, end_col in self._search_matches if match_line == line_idx]
+
+        # Every Find All match on this line
+        if self._match_index is not None and line_idx < min(self._match_index.covered_lines, self._search_index.line_count):
+            line_start = self._search_index.offset(line_idx, 0)
+            line_end = line_start + len(line_text)
+            for start, end in self._match_index.between(line_start, line_end + 1):
+                matches.append((start - line_start, min(end, line_end) - line_start))
 
+        for start_col, end_col in matches:
             x1 = text_x + self._font_metrics.horizontalAdvance(line_text[:start_col])
             x2 = text_x + self._font_metrics.horizontalAdvance(line_text[:end_col])
             painter.fillRect(x1, y, x2 - x1, self._line_height, self._search_highlight)
@@ -858,6 +1060,7 @@ class MemLargeTextView(QAbstractScrollArea):
             self._search_dialog = SearchDialog(self)
             self._search_dialog.find_next_btn.clicked.connect(self.find_next)
             self._search_dialog.find_prev_btn.clicked.connect(self.find_previous)
+            self._search_dialog.find_all_btn.clicked.connect(self.find_all)
         self._search_dialog.show()
         self._search_dialog.search_input.setFocus()
         line_edit = self._search_dialog.search_input.lineEdit()
@@ -897,66 +1100,42 @@ class MemLargeTextView(QAbstractScrollArea):
         self._progress_bar.show()
         QApplication.processEvents()
 
-    def _ensure_search_cache(self):
+    def _update_search_index(self):
         """
-        Build search cache if not already built. Shows progress bar.
+        Bring the search index up to date with the display buffer. Only lines added since the
+        last search need indexing; a progress bar is shown if there are many of them.
         """
-        if self._search_text is not None:
-            return  # Already cached
-
-        line_count = len(self._lines)
-        if line_count == 0:
-            self._search_text = ""
-            self._char_offsets = []
+        pending = self._search_index.pending(self._lines)
+        if not pending:
             return
 
-        # Show progress bar for large content
-        show_progress = line_count > 10000
+        show_progress = pending > 10000
         if show_progress:
             self._show_search_progress_bar()
 
-        # Build character offset index
-        self._char_offsets = []
-        offset = 0
-        update_interval = max(line_count // 100, 10000)  # Update every 1% or 10K lines
-        last_update = 0
-
-        for i, line in enumerate(self._lines):
-            self._char_offsets.append(offset)
-            offset += len(line) + 1  # +1 for newline
-
-            # Update progress bar periodically
-            if show_progress and i - last_update >= update_interval:
-                progress = int((i / line_count) * 90)  # Reserve 10% for join
-                self._progress_bar.setValue(progress)
-                QApplication.processEvents()
-                last_update = i
-
-        # Show "Finalizing..." phase
-        if show_progress:
-            self._progress_bar.setValue(90)
-            self._progress_bar.setFormat("Joining text...")
+        def show_progress_value(fraction: float):
+            self._progress_bar.setValue(int(fraction * 100))
             QApplication.processEvents()
 
-        # Join all lines into a single string
-        self._search_text = "\n".join(self._lines)
+        self._search_index.update(self._lines, show_progress_value if show_progress else None)
 
-        # Done
         if show_progress:
             self._progress_bar.hide()
 
-    def _char_offset_to_line_col(self, char_offset: int) -> tuple[int, int]:
+    def _search_pattern(self, search_text: str) -> Optional[tuple[str | re.Pattern, bool]]:
         """
-        Convert character offset in joined text to (line_idx, col).
+        The query of the search dialog as (pattern, lower): a compiled regex, or a literal string
+        that is lowercased (and matched against lowercase text) unless the search is case sensitive.
+        None for an invalid regex.
         """
-        if not self._char_offsets:
-            return 0, 0
-
-        line_idx = bisect.bisect_right(self._char_offsets, char_offset) - 1
-        line_idx = max(0, min(line_idx, len(self._lines) - 1))
-        col = char_offset - self._char_offsets[line_idx]
-
-        return line_idx, col
+        case_sensitive = self._search_dialog.is_case_sensitive() if self._search_dialog else False
+        is_regex = self._search_dialog.is_regex() if self._search_dialog else False
+        if is_regex:
+            try:
+                return re.compile(search_text, 0 if case_sensitive else re.IGNORECASE), False
+            except re.error:
+                return None  # Invalid regex
+        return (search_text, False) if case_sensitive else (search_text.lower(), True)
 
     def _do_search(self, search_text: str, forward: bool = True):
         line_count = len(self._lines)
@@ -967,94 +1146,129 @@ class MemLargeTextView(QAbstractScrollArea):
         if self._search_dialog:
             self._search_dialog.add_to_history(search_text)
 
-        # Ensure search cache is built
-        self._ensure_search_cache()
+        # Index any lines added since the last search
+        self._update_search_index()
 
-        if self._search_text is None:
+        query = self._search_pattern(search_text)
+        if query is None:
             return
-
-        case_sensitive = self._search_dialog.is_case_sensitive() if self._search_dialog else False
-        is_regex = self._search_dialog.is_regex() if self._search_dialog else False
+        pattern, lower = query
 
         # Determine starting character offset
+        index = self._search_index
         if self._selection:
             sel = self._selection.normalized()
             if forward:
                 # Start after current selection
-                start_char = self._char_offsets[sel.end_line] + sel.end_col
+                start_char = index.offset(sel.end_line, sel.end_col)
             else:
                 # Start before current selection
-                start_char = self._char_offsets[sel.start_line] + sel.start_col
+                start_char = index.offset(sel.start_line, sel.start_col)
         else:
             # Start from first visible line
             first_line = self._first_visible_line()
-            start_char = self._char_offsets[first_line] if first_line < line_count else 0
+            start_char = index.offset(first_line, 0) if first_line < line_count else 0
+
+        # After a Find All of this query, next/previous are binary searches over its matches;
+        # lines added since then are searched directly (and Find All is extended to cover them)
+        matches = self._match_index if self._match_index and self._match_index.is_query(pattern, lower) else None
+        found = None
+        if matches is not None and matches.complete and matches.covered_lines == index.line_count:
+            number = matches.find(start_char, forward)
+            if number is not None:
+                found = matches.starts[number], matches.ends[number] - matches.starts[number]
+                if self._search_dialog:
+                    self._search_dialog.set_status(f"Match {number + 1:,} of {len(matches):,}")
+        else:
+            found = index.find(pattern, start_char, forward=forward, lower=lower)
+            if matches is not None and matches.complete:
+                self._start_find_all(matches)
 
-        # Prepare search
-        text_to_search = self._search_text
-        if not case_sensitive and not is_regex:
-            text_to_search = self._search_text.lower()
-            search_text = search_text.lower()
+        if found is None:
+            if self._search_dialog:
+                self._search_dialog.set_status("No matches")
+            return
 
-        found_char = -1
-        match_len = len(search_text)
+        found_char, match_len = found
 
-        if is_regex:
-            try:
-                flags = 0 if case_sensitive else re.IGNORECASE
-                pattern = re.compile(search_text, flags)
-            except re.error:
-                return  # Invalid regex
+        # Convert character offset to line/column
+        found_line, found_start = index.line_col(found_char)
+        found_end = found_start + match_len
 
-            if forward:
-                # Search from start_char to end, then wrap to beginning
-                match = pattern.search(self._search_text, start_char)
-                if match is None and start_char > 0:
-                    match = pattern.search(self._search_text, 0, start_char)
-                if match:
-                    found_char = match.start()
-                    match_len = match.end() - match.start()
-            else:
-                # Search backward: find last match before start_char
-                # Then wrap to find last match after start_char
-                last_match = None
-                for m in pattern.finditer(self._search_text, 0, start_char):
-                    last_match = m
-                if last_match is None:
-                    # Wrap: find last match after start_char
-                    for m in pattern.finditer(self._search_text, start_char):
-                        last_match = m
-                if last_match:
-                    found_char = last_match.start()
-                    match_len = last_match.end() - last_match.start()
-        else:
-            # Literal search
-            if forward:
-                found_char = text_to_search.find(search_text, start_char)
-                if found_char == -1 and start_char > 0:
-                    # Wrap around
-                    found_char = text_to_search.find(search_text, 0, start_char)
-            else:
-                # Backward search
-                found_char = text_to_search.rfind(search_text, 0, start_char)
-                if found_char == -1:
-                    # Wrap around
-                    found_char = text_to_search.rfind(search_text, start_char)
-
-        if found_char >= 0:
-            # Convert character offset to line/column
-            found_line, found_start = self._char_offset_to_line_col(found_char)
-            found_end = found_start + match_len
-
-            # Select the found text
-            self._selection = Selection(found_line, found_start, found_line, found_end)
-            self.scroll_to_line(found_line + 1)
-
-            # Update search highlights
-            self._search_matches = [(found_line, found_start, found_end)]
-            self.viewport().update()
+        # Select the found text
+        self._selection = Selection(found_line, found_start, found_line, found_end)
+        self.scroll_to_line(found_line + 1)
+
+        # Update search highlights
+        self._search_matches = [(found_line, found_start, found_end)]
+        self.viewport().update()
+
+    def find_all(self):
+        """Find (and highlight) every occurrence of the search text, counting them on a background thread."""
+        if not self._search_dialog:
+            return
+
+        search_text = self._search_dialog.get_search_text()
+        if not search_text or len(self._lines) == 0:
+            return
+        self._search_dialog.add_to_history(search_text)
+
+        query = self._search_pattern(search_text)
+        if query is None:
+            self._search_dialog.set_status("Invalid regular expression")
+            return
+
+        self._update_search_index()
+        self._cancel_find_all()
+        self._match_index = MatchIndex(*query)
+        self._start_find_all(self._match_index)
+
+    def _start_find_all(self, matches: MatchIndex):
+        """Search the lines that matches doesn't cover yet, from the start of the index block holding the first of them."""
+        first_line = matches.covered_lines
+        matches.truncate(self._search_index.block_start_of_line(first_line))
+        matches.covered_lines = self._search_index.line_count
+        matches.complete = False
+
+        thread = FindAllThread(self._search_index.blocks_from_line(first_line), matches.pattern, matches.lower, parent=self)
+        thread.matches_found.connect(partial(self._on_find_all_matches, matches))
+        thread.search_finished.connect(partial(self._on_find_all_finished, matches, thread))
+        self._find_all_thread = thread
+        if self._search_dialog:
+            self._search_dialog.set_status("Searching...")
+        thread.start()
+
+    def _on_find_all_matches(self, matches: MatchIndex, starts, ends):
+        if matches is not self._match_index:
+            return  # from a query that has since been replaced
+        matches.add(starts, ends)
+        if self._search_dialog:
+            self._search_dialog.set_status(f"Searching... {len(matches):,} matches so far")
+        self.viewport().update()
+
+    def _on_find_all_finished(self, matches: MatchIndex, thread: FindAllThread, cancelled: bool):
+        thread.wait()
+        thread.deleteLater()
+        if self._find_all_thread is thread:
+            self._find_all_thread = None
+        if matches is not self._match_index or cancelled:
+            return
+        matches.complete = True
+        if self._search_dialog:
+            self._search_dialog.set_status(f"{len(matches):,} matches" if len(matches) != 1 else "1 match")
+        self.viewport().update()
+
+    def _cancel_find_all(self):
+        if self._find_all_thread is not None:
+            self._find_all_thread.cancel()
+            self._find_all_thread.wait()  # quick: the thread checks for cancellation between index blocks
+            self._find_all_thread = None
 
     def clear_search(self):
+        self._cancel_find_all()
+        self._match_index = None
+        if self._search_dialog:
+            self._search_dialog.set_status("")
         self._search_matches = []
         self._current_match_index = -1
         self.viewport().update()
@@ -1251,6 +1465,7 @@ if __name__ == "__main__":
             self.viewer = MemLargeTextView(
                 self,
                 commands={
+                    "Open large_output.txt": self._open_file,
                     "Read large_output.txt": self._read_file,
                     "Load text into widget": self._load_into_widget,
                     "Quit": self.close,
@@ -1266,9 +1481,23 @@ if __name__ == "__main__":
 
             # Add some initial content
             self.viewer.write("Right-click to access commands.\n")
+            self.viewer.write("0. 'Open large_output.txt' - shows the file lazily, indexing it in the background\n")
             self.viewer.write("1. 'Read large_output.txt' - reads file into memory\n")
             self.viewer.write("2. 'Load text into widget' - loads the deque into the viewer\n")
 
+        def _open_file(self):
+            """Show large_output.txt with open_file(), without reading it into memory."""
+            file_path = Path(__file__).parent / "large_output.txt"
+            start_time = time.perf_counter()
+            if not self.viewer.open_file(file_path):
+                self.viewer.write(f"Unable to open {file_path}\n")
+                self.viewer.update_display()
+                return
+            elapsed = time.perf_counter() - start_time
+            print(f"Opened {file_path.name} in {elapsed:.3f} seconds (lines are still being indexed)")
+            self.setWindowTitle(f"MemLargeTextView Test - {file_path.name} opened in {elapsed:.3f}s")
+            self.viewer.disable_commands(["Load text into widget"])
+
         def _read_file(self):
             """Read large_output.txt into self._file_deque."""
             file_path = Path(__file__).parent / "large_output.txt"
@@ -0,0 +1,111 @@
+"""
+This file is part of the EPICpy source code. EPICpy is a tool for simulating
+human performance tasks using the EPIC computational cognitive architecture
+(David Kieras and David Meyer 1997a) using the Python programming language.
+Copyright (C) 2022-2026 Travis L. Seymour, PhD
+
+This program is free software: you can redistribute it and/or modify
+it under the terms of the GNU General Public License as published by
+the Free Software Foundation, either version 3 of the License, or
+(at your option) any later version.
+
+This program is distributed in the hope that it will be useful,
+but WITHOUT ANY WARRANTY; without even the implied warranty of
+MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+GNU General Public License for more details.
+
+You should have received a copy of the GNU General Public License
+along with this program.  If not, see <https://www.gnu.org/licenses/>.
+"""
+
+"""
+ParallelProgress - A compact status bar widget showing parallel sweep progress, ETA, and a cancel button.
+"""
+
+import timeit
+from typing import Optional
+
+from qtpy.QtCore import Signal
+from qtpy.QtWidgets import QHBoxLayout, QLabel, QProgressBar, QPushButton, QWidget
+
+
+class ParallelProgress(QWidget):
+    """Progress bar + ETA label + Cancel button for parallel runs. Hidden while idle."""
+
+    cancel_requested = Signal()
+
+    def __init__(self, parent: Optional[QWidget] = None):
+        super().__init__(parent)
+
+        self._total: int = 0
+        self._done: int = 0
+        self._failed: int = 0
+        self._start_time: float = 0.0
+
+        layout = QHBoxLayout(self)
+        layout.setContentsMargins(0, 0, 0, 0)
+
+        self._progress_bar = QProgressBar(self)
+        self._progress_bar.setMinimumWidth(200)
+        self._progress_bar.setTextVisible(True)
+        layout.addWidget(self._progress_bar)
+
+        self._eta_label = QLabel(self)
+        layout.addWidget(self._eta_label)
+
+        self._cancel_button = QPushButton("Cancel", self)
+        self._cancel_button.clicked.connect(self._on_cancel_clicked)
+        layout.addWidget(self._cancel_button)
+
+        self.hide()
+
+    def start(self, total: int):
+        """Reset and show the widget for a sweep of `total` runs."""
+        self._total = total
+        self._done = 0
+        self._failed = 0
+        self._start_time = timeit.default_timer()
+        self._progress_bar.setRange(0, max(1, total))
+        self._progress_bar.setValue(0)
+        self._progress_bar.setFormat(f"0/{total} runs")
+        self._eta_label.setText("ETA: --")
+        self._cancel_button.setEnabled(True)
+        self._cancel_button.setText("Cancel")
+        self.show()
+
+    def advance(self, success: bool = True):
+        """Record one completed run and update the ETA estimate."""
+        self._done += 1
+        if not success:
+            self._failed += 1
+        self._progress_bar.setValue(self._done)
+        failed = f", {self._failed} failed" if self._failed else ""
+        self._progress_bar.setFormat(f"{self._done}/{self._total} runs{failed}")
+
+        elapsed = timeit.default_timer() - self._start_time
+        remaining = max(0, self._total - self._done)
+        if remaining:
+            # Average wall time per completed run already reflects the pool's concurrency
+            eta = elapsed / self._done * remaining
+            self._eta_label.setText(f"ETA: {self.format_seconds(eta)}")
+        else:
+            self._eta_label.setText(f"Done in {self.format_seconds(elapsed)}")
+
+    def finish(self):
+        """Hide the widget once the sweep is over."""
+        self.hide()
+
+    @staticmethod
+    def format_seconds(seconds: float) -> str:
+        minutes, secs = divmod(int(round(seconds)), 60)
+        hours, minutes = divmod(minutes, 60)
+        if hours:
+            return f"{hours}h {minutes:02d}m {secs:02d}s"
+        if minutes:
+            return f"{minutes}m {secs:02d}s"
+        return f"{secs}s"
+
+    def _on_cancel_clicked(self):
+        self._cancel_button.setEnabled(False)
+        self._cancel_button.setText("Cancelling...")
+        self.cancel_requested.emit()
@@ -0,0 +1,313 @@
+"""
+This file is part of the EPICpy source code. EPICpy is a tool for simulating
+human performance tasks using the EPIC computational cognitive architecture
+(David Kieras and David Meyer 1997a) using the Python programming language.
+Copyright (C) 2022-2026 Travis L. Seymour, PhD
+
+This program is free software: you can redistribute it and/or modify
+it under the terms of the GNU General Public License as published by
+the Free Software Foundation, either version 3 of the License, or
+(at your option) any later version.
+
+This program is distributed in the hope that it will be useful,
+but WITHOUT ANY WARRANTY; without even the implied warranty of
+MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+GNU General Public License for more details.
+
+You should have received a copy of the GNU General Public License
+along with this program.  If not, see <https://www.gnu.org/licenses/>.
+"""
+
+"""
+SearchIndex - incremental search index over the append-only lines of MemLargeTextView.
+
+Offsets refer to the text as if every line were joined with "\\n", but that text is never
+built in one piece: it is kept as blocks of BLOCK_LINES joined lines, plus the offset of every
+line. Appending lines only joins the new lines (and re-joins the last block if it wasn't
+full), so searching a live trace doesn't re-index everything that was already there.
+For disk-backed lines (see file_lines.py) only the offsets are kept, and block texts are read
+back from the file when searched, keeping the most recently used CACHED_BLOCKS of them.
+
+Matches never span two blocks, which only matters for patterns that match a newline.
+
+MatchIndex holds every match of one query, found off the GUI thread by find_all() over a
+snapshot of the blocks (see SearchIndex.blocks_from_line), so next/previous become binary searches.
+"""
+
+import bisect
+import re
+from array import array
+from collections import OrderedDict
+from collections.abc import Sequence
+from typing import Callable, Iterable, Iterator, Optional
+
+from epicpy.widgets.file_lines import FileBackedLines
+
+BLOCK_LINES = 4096
+CACHED_BLOCKS = 64
+
+
+def _matches(text: str, pattern: str | re.Pattern, start: int = 0, end: Optional[int] = None) -> Iterator[tuple[int, int]]:
+    """(position, length) of the matches of pattern in text[start:end]."""
+    end = len(text) if end is None else end
+    if isinstance(pattern, re.Pattern):
+        for match in pattern.finditer(text, start, end):
+            yield match.start(), match.end() - match.start()
+    elif pattern:
+        found = text.find(pattern, start, end)
+        while found != -1:
+            yield found, len(pattern)
+            found = text.find(pattern, found + len(pattern), end)
+
+
+class SearchIndex:
+    """Joined-text blocks and per-line character offsets of a growing sequence of lines."""
+
+    def __init__(self):
+        self._blocks: list[Optional[str]] = []  # each holds BLOCK_LINES lines joined with "\n" (the last may hold fewer)
+        self._lower_blocks: list[Optional[str]] = []  # lowercase copies, made when first needed
+        self._file_lines: Optional[FileBackedLines] = None  # where block texts are read from, if not kept in _blocks
+        self._block_cache: OrderedDict[tuple[int, bool], str] = OrderedDict()  # (block, lower) -> text, for _file_lines
+        self._block_starts: list[int] = []  # character offset of each block
+        self._line_offsets = array("Q")  # character offset of each indexed line
+        self._text_length = 0  # length of the indexed text, including the newline after every line
+
+    @property
+    def line_count(self) -> int:
+        return len(self._line_offsets)
+
+    def clear(self):
+        self._blocks = []
+        self._lower_blocks = []
+        self._file_lines = None
+        self._block_cache.clear()
+        self._block_starts = []
+        self._line_offsets = array("Q")
+        self._text_length = 0
+
+    def pending(self, lines: Sequence[str]) -> int:
+        """How many lines update() would have to index."""
+        if len(lines) < self.line_count:
+            return len(lines)
+        return len(lines) - self.line_count
+
+    def update(self, lines: Sequence[str], progress: Optional[Callable[[float], None]] = None):
+        """
+        Index lines that were appended since the last update. If lines got shorter, it was
+        replaced rather than appended to, so everything is indexed again.
+        progress (if given) is called with the fraction done after every block.
+        """
+        file_lines = lines if isinstance(lines, FileBackedLines) else None
+        if len(lines) < self.line_count or file_lines is not self._file_lines:
+            self.clear()
+        self._file_lines = file_lines
+
+        # Re-join the last block if it wasn't full, so that every block but the last stays full
+        if self._blocks and self.line_count % BLOCK_LINES:
+            first_line = self.line_count - self.line_count % BLOCK_LINES
+            self._text_length = self._line_offsets[first_line]
+            del self._line_offsets[first_line:]
+            self._blocks.pop()
+            self._lower_blocks.pop()
+            self._block_starts.pop()
+            self._block_cache.pop((len(self._blocks), False), None)
+            self._block_cache.pop((len(self._blocks), True), None)
+
+        total = len(lines) - self.line_count
+        first_new = self.line_count
+        while self.line_count < len(lines):
+            block_lines = lines[self.line_count : self.line_count + BLOCK_LINES]
+            self._block_starts.append(self._text_length)
+            offset = self._text_length
+            for line in block_lines:
+                self._line_offsets.append(offset)
+                offset += len(line) + 1  # +1 for newline
+            self._text_length = offset
+            self._blocks.append(None if file_lines is not None else "\n".join(block_lines))
+            self._lower_blocks.append(None)
+            if progress is not None and total:
+                progress((self.line_count - first_new) / total)
+
+    def offset(self, line: int, col: int) -> int:
+        """Character offset of (line, col)."""
+        if not self._line_offsets:
+            return 0
+        line = max(0, min(line, self.line_count - 1))
+        return self._line_offsets[line] + col
+
+    def line_col(self, offset: int) -> tuple[int, int]:
+        """(line, col) of a character offset."""
+        if not self._line_offsets:
+            return 0, 0
+        line = max(0, bisect.bisect_right(self._line_offsets, offset) - 1)
+        return line, offset - self._line_offsets[line]
+
+    def _block_lines(self, block: int) -> tuple[int, int]:
+        """(first line, end line) of block."""
+        return block * BLOCK_LINES, min((block + 1) * BLOCK_LINES, self.line_count)
+
+    def _block_text(self, block: int, lower: bool) -> str:
+        if self._file_lines is not None:
+            return self._cached_block_text(block, lower)
+        if not lower:
+            return self._blocks[block]
+        if self._lower_blocks[block] is None:
+            self._lower_blocks[block] = self._blocks[block].lower()
+        return self._lower_blocks[block]
+
+    def _cached_block_text(self, block: int, lower: bool) -> str:
+        key = (block, lower)
+        if key in self._block_cache:
+            self._block_cache.move_to_end(key)
+            return self._block_cache[key]
+        text = self._file_lines.joined(*self._block_lines(block))
+        if lower:
+            text = text.lower()
+        self._block_cache[key] = text
+        if len(self._block_cache) > CACHED_BLOCKS:
+            self._block_cache.popitem(last=False)
+        return text
+
+    def block_start_of_line(self, line: int) -> int:
+        """Character offset of the block holding line."""
+        block = min(line // BLOCK_LINES, len(self._blocks))
+        return self._block_starts[block] if block < len(self._blocks) else self._text_length
+
+    def blocks_from_line(self, line: int) -> Iterable[tuple[int, str]]:
+        """
+        (offset, text) of the blocks from the one holding line to the end. Block texts are never
+        changed in place, so this is a snapshot that another thread can search (see find_all).
+        """
+        first = min(line // BLOCK_LINES, len(self._blocks))
+        if self._file_lines is not None:
+            # Read lazily (by whichever thread searches them) instead of holding every block in memory
+            ranges = [self._block_lines(block) for block in range(first, len(self._blocks))]
+            return zip(self._block_starts[first:], self._file_lines.read_joined(ranges))
+        return list(zip(self._block_starts[first:], self._blocks[first:]))
+
+    def _block_of(self, offset: int) -> int:
+        return max(0, bisect.bisect_right(self._block_starts, offset) - 1)
+
+    def _matches_in_block(
+        self, block: int, pattern: str | re.Pattern, lower: bool, start: int = 0, end: Optional[int] = None
+    ) -> Iterator[tuple[int, int]]:
+        """(offset, length) of the matches in block, between the block-relative positions start and end."""
+        base = self._block_starts[block]
+        for position, length in _matches(self._block_text(block, lower), pattern, start, end):
+            yield base + position, length
+
+    def _first_match(self, block: int, pattern, lower: bool, start: int = 0, end: Optional[int] = None):
+        return next(self._matches_in_block(block, pattern, lower, start, end), None)
+
+    def _last_match(self, block: int, pattern, lower: bool, start: int = 0, end: Optional[int] = None):
+        if isinstance(pattern, re.Pattern):
+            last = None
+            for last in self._matches_in_block(block, pattern, lower, start, end):
+                pass
+            return last
+        text = self._block_text(block, lower)
+        found = text.rfind(pattern, start, len(text) if end is None else end) if pattern else -1
+        return None if found == -1 else (self._block_starts[block] + found, len(pattern))
+
+    def find(self, pattern: str | re.Pattern, start: int, forward: bool = True, lower: bool = False) -> Optional[tuple[int, int]]:
+        """
+        The (offset, length) of the next match of pattern (a literal string or compiled regex) after
+        start, or the previous one before it, wrapping around the end of the text. With lower=True,
+        literal patterns are matched against lowercase text (so pass a lowercase pattern).
+        """
+        if not self._blocks:
+            return None
+        block = self._block_of(start)
+        local = start - self._block_starts[block]
+        count = len(self._blocks)
+
+        if forward:
+            hit = self._first_match(block, pattern, lower, local)
+            for other in range(block + 1, count):
+                if hit is not None:
+                    break
+                hit = self._first_match(other, pattern, lower)
+            for other in range(0, block + 1):
+                if hit is not None:
+                    break
+                hit = self._first_match(other, pattern, lower, 0, local if other == block else None)
+        else:
+            hit = self._last_match(block, pattern, lower, 0, local)
+            for other in range(block - 1, -1, -1):
+                if hit is not None:
+                    break
+                hit = self._last_match(other, pattern, lower)
+            for other in range(count - 1, block - 1, -1):
+                if hit is not None:
+                    break
+                hit = self._last_match(other, pattern, lower, local if other == block else 0)
+        return hit
+
+
+def find_all(
+    blocks: Iterable[tuple[int, str]],
+    pattern: str | re.Pattern,
+    lower: bool = False,
+    cancelled: Optional[Callable[[], bool]] = None,
+) -> Iterator[tuple[array, array]]:
+    """
+    Every non-empty match of pattern in blocks (see SearchIndex.blocks_from_line), yielded a block
+    at a time as arrays of start and end offsets, in order. Stops early once cancelled() is True.
+    """
+    for base, text in blocks:
+        if cancelled is not None and cancelled():
+            return
+        starts, ends = array("Q"), array("Q")
+        for position, length in _matches(text.lower() if lower else text, pattern):
+            if length:
+                starts.append(base + position)
+                ends.append(base + position + length)
+        if starts:
+            yield starts, ends
+
+
+class MatchIndex:
+    """Sorted start and end offsets of every match of one query, filled in by find_all()."""
+
+    def __init__(self, pattern: str | re.Pattern, lower: bool):
+        self.pattern = pattern
+        self.lower = lower
+        self.starts = array("Q")
+        self.ends = array("Q")
+        self.covered_lines = 0  # lines of the text that have been (or are being) searched
+        self.complete = False  # whether the search of covered_lines has finished
+
+    def __len__(self) -> int:
+        return len(self.starts)
+
+    def is_query(self, pattern: str | re.Pattern, lower: bool) -> bool:
+        return self.pattern == pattern and self.lower == lower
+
+    def add(self, starts: array, ends: array):
+        self.starts.extend(starts)
+        self.ends.extend(ends)
+
+    def truncate(self, offset: int):
+        """Forget the matches that start at or after offset (e.g., before searching that part again)."""
+        keep = bisect.bisect_left(self.starts, offset)
+        del self.starts[keep:]
+        del self.ends[keep:]
+
+    def between(self, start: int, end: int) -> Iterator[tuple[int, int]]:
+        """(start, end) offsets of the matches that start in [start, end)."""
+        i = bisect.bisect_left(self.starts, start)
+        while i < len(self.starts) and self.starts[i] < end:
+            yield self.starts[i], self.ends[i]
+            i += 1
+
+    def find(self, offset: int, forward: bool = True) -> Optional[int]:
+        """
+        Number of the first match starting at or after offset, or of the last one starting before
+        it, wrapping around the end of the text; None if there are no matches.
+        """
+        if not self.starts:
+            return None
+        i = bisect.bisect_left(self.starts, offset)
+        if forward:
+            return i if i < len(self.starts) else 0
+        return i - 1 if i > 0 else len(self.starts) - 1
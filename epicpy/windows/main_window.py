@@ -23,6 +23,7 @@ import importlib.metadata
 import os
 import platform
 import re
+import sqlite3
 import subprocess
 import sys
 import tempfile
@@ -61,14 +62,26 @@ from epicpy.dialogs.snd_text_settings_window import SoundTextSettingsWin
 from epicpy.dialogs.trace_settings_window import TraceSettingsWin
 from epicpy.epic.epic_simulation import Simulation
 from epicpy.epic.parallel_simulation import (
+    CapturePolicy,
+    JobLimits,
     OutputSettings,
+    SimulationConfig,
     SimulationResult,
-    create_sim_configs_from_permutations,
+    create_sim_configs_from_run_infos,
     expand_permutations,
     has_permutations,
-    run_parallel_simulations,
 )
+from epicpy.epic.parallel_simulation_thread import ParallelSimulationThread
+from epicpy.epic.result_cache import CACHE_DIR_NAME, ResultCache
 from epicpy.epic.run_info import RunInfo
+from epicpy.epic.runtime_history import HISTORY_FILE_NAME, RuntimeHistory
+from epicpy.epic.simulation_script import (
+    SimulationScriptError,
+    create_sim_configs_from_script,
+    load_simulation_script,
+    script_sweep_dir,
+)
+from epicpy.epic.sweep_manifest import SWEEP_DIR_NAME, sweep_base_seed
 from epicpy.tools.process_viewer.process_viewer import ProcessViewerWindow
 from epicpy.tools.rule_flow.rule_flow import RuleFlowWindow
 from epicpy.utils import config, fitness
@@ -88,6 +101,7 @@ from epicpy.views.epicpy_visual_view import EPICVisualView
 from epicpy.views.visual_view_window import VisualViewWin
 from epicpy.widgets.custom_text_edit import CustomQTextEdit
 from epicpy.widgets.mem_large_text_view import MemLargeTextView
+from epicpy.widgets.parallel_progress import ParallelProgress
 from epicpy.widgets.stats_web_view import StatsWebView
 from epicpy.windows import main_window_menu
 from epicpy.windows.app_style import set_dark_style, set_light_style
@@ -129,6 +143,14 @@ class MainWin(LayoutMixin, QMainWindow):
 
         self.statusBar().showMessage("Run Status: UNREADY")
 
+        # parallel sweep progress (lives in the status bar, hidden unless a sweep is running)
+        self.parallel_thread: ParallelSimulationThread | None = None
+        self.parallel_runs_label_rules = False  # name the rule file of each run in parallel run reports
+        self.run_state_before_parallel = UNREADY
+        self.parallel_progress = ParallelProgress(self)
+        self.parallel_progress.cancel_requested.connect(self.cancel_parallel_run)
+        self.statusBar().addPermanentWidget(self.parallel_progress)
+
         self.context = "Main"
 
         self.run_state = UNREADY
@@ -177,7 +199,7 @@ class MainWin(LayoutMixin, QMainWindow):
         self.default_middle_custom_settings: dict = {}
 
         # add central widget and setup
-        self.normalTextOutput = MemLargeTextView(self)
+        self.normalTextOutput = MemLargeTextView(self, disk_threshold_lines=config.app_cfg.output_disk_threshold_lines)
         self.normalTextOutput.setObjectName("NormalOutputWindow")
 
         # Attach relevant output tees to this window
@@ -193,7 +215,7 @@ class MainWin(LayoutMixin, QMainWindow):
 
         # to avoid having to load any epic stuff in trace_window.py, we go ahead and
         # connect Trace_out now
-        self.traceTextOutput = MemLargeTextView(self)
+        self.traceTextOutput = MemLargeTextView(self, disk_threshold_lines=config.app_cfg.output_disk_threshold_lines)
         self.traceTextOutput.setObjectName("TraceOutputWindow")
 
         # Attach relevant output tees to this window
@@ -279,6 +301,8 @@ class MainWin(LayoutMixin, QMainWindow):
         self.actionLoad_Auditory_Encoder: QAction
         self.actionUnload_Visual_Encoder: QAction
         self.actionUnload_Auditory_Encoder: QAction
+        self.actionOpen_Normal_Output: QAction
+        self.actionOpen_Trace_Output: QAction
         self.actionExport_Normal_Output: QAction
         self.actionExport_Trace_Output: QAction
         self.actionExport_Stats_Output: QAction
@@ -591,6 +615,21 @@ class MainWin(LayoutMixin, QMainWindow):
                 self.actionAllow_Parallel_Runs.blockSignals(True)
                 self.actionAllow_Parallel_Runs.setChecked(config.device_cfg.allow_parallel_runs)  # type: ignore[attr-defined]
                 self.actionAllow_Parallel_Runs.blockSignals(False)
+                self.actionReuse_Parallel_Workers.blockSignals(True)
+                self.actionReuse_Parallel_Workers.setChecked(config.device_cfg.parallel_warm_workers)
+                self.actionReuse_Parallel_Workers.blockSignals(False)
+                self.actionParallel_Rule_Files.blockSignals(True)
+                self.actionParallel_Rule_Files.setChecked(config.device_cfg.parallel_rule_files)
+                self.actionParallel_Rule_Files.blockSignals(False)
+                self.actionResume_Parallel_Sweeps.blockSignals(True)
+                self.actionResume_Parallel_Sweeps.setChecked(config.device_cfg.parallel_resume_sweeps)
+                self.actionResume_Parallel_Sweeps.blockSignals(False)
+                self.actionUse_Parallel_Result_Cache.blockSignals(True)
+                self.actionUse_Parallel_Result_Cache.setChecked(config.device_cfg.parallel_result_cache)
+                self.actionUse_Parallel_Result_Cache.blockSignals(False)
+                self.actionSave_Parallel_Data_As_Parquet.blockSignals(True)
+                self.actionSave_Parallel_Data_As_Parquet.setChecked(config.device_cfg.parallel_data_format == "parquet")
+                self.actionSave_Parallel_Data_As_Parquet.blockSignals(False)
 
                 # Track this device in recent devices list
                 self._add_recent_device(device_file)
@@ -658,19 +697,27 @@ class MainWin(LayoutMixin, QMainWindow):
         Normal_out(emoji_box(f"RULE FILE: {rule_name}", line="thick") + "\n")
 
         # Determine the parameter string to use
+        if config.device_cfg.device_params:
+            default_param_string = config.device_cfg.device_params
+        else:
+            default_param_string = self.simulation.device.get_parameter_string()
         if self.simulation.rule_files[self.simulation.current_rule_index].parameter_string:
             param_string = self.simulation.rule_files[self.simulation.current_rule_index].parameter_string
-        elif config.device_cfg.device_params:
-            param_string = config.device_cfg.device_params
         else:
-            param_string = self.simulation.device.get_parameter_string()
+            param_string = default_param_string
 
-        # Check for permutations in parameter string
+        # Check for permutations in parameter string, or several rule files to run as one job set.
         # Use the checkbox state directly as the source of truth for the parallel decision,
         # rather than config.device_cfg.allow_parallel_runs which can get out of sync.
+        # Otherwise several rule files run one after another, as they always have.
         allow_parallel = parallel and self.actionAllow_Parallel_Runs.isChecked()
-        if allow_parallel and has_permutations(param_string):
-            self._run_parallel(param_string)
+        replicated = int(config.device_cfg.parallel_replications) > 1
+        several_rules = len(self.simulation.rule_files) > 1 and self.actionParallel_Rule_Files.isChecked()
+        if allow_parallel and several_rules:
+            self._run_parallel(self.simulation.rule_files, default_param_string)
+            return
+        if allow_parallel and (has_permutations(param_string) or replicated):
+            self._run_parallel([self.simulation.rule_files[self.simulation.current_rule_index]], default_param_string)
             return
 
         # Sequential execution (normal serial run)
@@ -682,41 +729,183 @@ class MainWin(LayoutMixin, QMainWindow):
         self.simulation.device.set_parameter_string(param_string)
         self.simulation.run()
 
-    def _run_parallel(self, param_string: str) -> list[SimulationResult] | None:
+    def _run_parallel(self, run_infos: list[RunInfo], param_string: str):
         """
-        Run all parameter permutations in parallel using separate processes.
-        Parameter string are indicated with [option1|option2] syntax.
+        Run all parameter permutations of every rule file in run_infos in parallel using separate processes.
+        Parameter string are indicated with [option1|option2] syntax; rule files (or script entries)
+        without their own parameter string use param_string.
+        The sweep runs on a background thread; results arrive via _on_parallel_result
+        and _on_parallel_finished so the UI stays responsive (and cancellable) throughout.
         """
-        rule_file = self.simulation.rule_files[self.simulation.current_rule_index].rule_file
         device_file = config.app_cfg.last_device_file
 
-        # Create configurations for each permutation
-        sim_configs = create_sim_configs_from_permutations(
+        # Replications reuse the sweep's stored base seed, so resumed sweeps and the result cache find finished runs
+        replications = int(config.device_cfg.parallel_replications)
+        base_seed = sweep_base_seed(Path(device_file).parent / SWEEP_DIR_NAME) if replications > 1 else None
+
+        # Create configurations for each rule file x permutation
+        sim_configs = create_sim_configs_from_run_infos(
+            run_infos=run_infos,
             device_file=device_file,
-            rule_file=rule_file,
             base_param_string=param_string,
             output_settings=OutputSettings.from_device_config(config.device_cfg),
             run_command=config.device_cfg.run_command,
             run_command_value=int(config.device_cfg.run_command_value),
             visual_encoder_file=config.device_cfg.visual_encoder,
             auditory_encoder_file=config.device_cfg.auditory_encoder,
+            spill_outputs=config.device_cfg.parallel_spill_outputs,
+            compress_outputs=config.device_cfg.parallel_compress_outputs,
+            replications=replications,
+            base_seed=base_seed,
+            limits=self._parallel_limits(),
         )
 
+        self.parallel_runs_label_rules = len(run_infos) > 1
+        self._start_parallel_run(sim_configs, device_folder=Path(device_file).parent)
+
+    def run_simulation_script(self):
+        """
+        Choose a simulation script (a TOML or JSON batch of device, rule file and parameter jobs,
+        see epic/simulation_script.py) and run all of its jobs as one parallel job set.
+        """
+        if self.parallel_run_active() or self.run_state == RUNNING:
+            Info_out(hcolor("WARNING: Wait for the current run to finish before starting a simulation script.\n", "gold"))
+            return
+
+        start_dir = Path(config.app_cfg.last_script_file).parent if config.app_cfg.last_script_file else Path.home()
+        script_file, _ = QFileDialog.getOpenFileName(
+            self,
+            "Choose an EPICpy Simulation Script",
+            str(start_dir),
+            "Simulation Scripts (*.toml *.json)",
+        )
+        if not script_file:
+            return
+
+        try:
+            script = load_simulation_script(script_file)
+        except SimulationScriptError as e:
+            Info_out(hcolor(f"ERROR: Unable to load simulation script: {e}\n", "red"))
+            return
+        config.app_cfg.last_script_file = str(script.path)
+
+        # Each device's runs use that device's own output and trace settings (the loaded device's current ones)
+        loaded_device = Path(config.device_cfg.device_file).resolve() if config.device_cfg.device_file else None
+        output_settings = {
+            device: (
+                OutputSettings.from_device_config(config.device_cfg)
+                if Path(device).resolve() == loaded_device
+                else OutputSettings.from_saved_device_config(device)
+            )
+            for device in script.device_files()
+        }
+        sim_configs = create_sim_configs_from_script(
+            script,
+            output_settings=output_settings[script.jobs[0].device_file],
+            spill_outputs=config.device_cfg.parallel_spill_outputs,
+            compress_outputs=config.device_cfg.parallel_compress_outputs,
+            limits=self._parallel_limits(),
+        )
+        for cfg in sim_configs:
+            cfg.output_settings = output_settings[cfg.device_file]
+
+        self.parallel_runs_label_rules = True
+        Info_out(hcolor(f"Simulation script {script.path.name}: {len(script.jobs)} job(s)\n", bold=True))
+        # Like device sweeps, scripts only keep a manifest when they can be resumed
+        sweep_dir = script_sweep_dir(script) if self.actionResume_Parallel_Sweeps.isChecked() else None
+        self._start_parallel_run(sim_configs, device_folder=None, sweep_dir=sweep_dir, merge_by_device=True)
+
+    @staticmethod
+    def _parallel_limits() -> JobLimits:
+        return JobLimits(
+            wall_seconds=config.device_cfg.parallel_max_wall_seconds,
+            simulated_ms=config.device_cfg.parallel_max_simulated_ms,
+            rss_mb=config.device_cfg.parallel_max_rss_mb,
+        )
+
+    def _start_parallel_run(
+        self,
+        sim_configs: list[SimulationConfig],
+        device_folder: Path | None,
+        sweep_dir: Path | None = None,
+        merge_by_device: bool = False,
+    ):
+        # Only the final run's output is shown in full afterwards, so earlier runs just keep a tail
+        tail_lines = int(config.device_cfg.parallel_capture_tail_lines)
+        if tail_lines > 0:
+            for cfg in sim_configs[:-1]:
+                cfg.output_capture = {
+                    name: CapturePolicy(mode="tail", tail_lines=tail_lines) for name in ("Normal_out", "Trace_out")
+                }
+
+        # The last sweep's output may be shown straight from its spilled files, which this sweep deletes
+        for view in (self.normalTextOutput, self.traceTextOutput):
+            if view.is_opened_file():
+                view.clear()
+
         Info_out(hcolor(f"Running {len(sim_configs)} parameter permutations in parallel:\n", bold=True))
         for i, cfg in enumerate(sim_configs, 1):
-            Info_out(f"  {i}. {cfg.parameter_string}\n")
+            replication = f" (replication {cfg.replication + 1}, seed {cfg.seed})" if cfg.seed is not None else ""
+            Info_out(f"  {i}. {self._parallel_run_label(cfg)}{replication}\n")
         Info_out(hcolor("Please wait...\n", bold=True))
 
-        QApplication.processEvents()  # Force UI update before blocking call
-
         # Run all permutations in parallel **WARNING: Will Temporarily Re-Route All Output_tees to memory**
-        # TODO: Consider running this in a background thread to avoid blocking the UI
-        device_folder = Path(device_file).parent
-        results = run_parallel_simulations(
+        self.parallel_thread = ParallelSimulationThread(
             sim_configs=sim_configs,
             max_workers=min(len(sim_configs), os.cpu_count() or 4),
             device_folder=device_folder,
+            warm_workers=self.actionReuse_Parallel_Workers.isChecked(),
+            resume=self.actionResume_Parallel_Sweeps.isChecked(),
+            result_cache=self._parallel_result_cache() if self.actionUse_Parallel_Result_Cache.isChecked() else None,
+            runtime_history=self._parallel_runtime_history(),
+            data_format=config.device_cfg.parallel_data_format,
+            legacy_csv=config.device_cfg.parallel_legacy_csv,
+            staging=config.device_cfg.parallel_staging,
+            merge_by_device=merge_by_device,
+            sweep_dir=sweep_dir,
+            parent=self,
         )
+        self.parallel_thread.result_ready.connect(self._on_parallel_result)
+        self.parallel_thread.sweep_finished.connect(self._on_parallel_finished)
+
+        self.parallel_progress.start(len(sim_configs))
+        self.run_state_before_parallel = self.run_state
+        self.run_state = RUNNING
+        self.update_ui_status()
+        self.parallel_thread.start()
+
+    def _parallel_run_label(self, sim_config: SimulationConfig) -> str:
+        if self.parallel_runs_label_rules:
+            return f"{Path(sim_config.rule_file).name}: {sim_config.parameter_string}"
+        return sim_config.parameter_string
+
+    def parallel_run_active(self) -> bool:
+        return self.parallel_thread is not None and self.parallel_thread.isRunning()
+
+    def cancel_parallel_run(self):
+        if self.parallel_run_active():
+            Info_out(hcolor("Cancelling parallel run...\n", "gold"))
+            self.parallel_thread.cancel()
+
+    def _on_parallel_result(self, result: SimulationResult):
+        self.parallel_progress.advance(result.success)
+        status = hcolor("DONE", "green", paragraph=False) if result.success else hcolor("FAILED", "red", paragraph=False)
+        if result.resumed:
+            note = " (completed by an earlier run)"
+        elif result.cached:
+            note = " (cached)"
+        else:
+            note = ""
+        Info_out(f"  [{status}] {self._parallel_run_label(result.sim_config)}{note}\n")
+
+    def _on_parallel_finished(self, results: list[SimulationResult], cancelled: bool, error_message: str):
+        thread = self.parallel_thread
+        self.parallel_thread = None
+        if thread is not None:
+            thread.wait()
+            thread.deleteLater()
+        self.parallel_progress.finish()
+        self.run_state = self.run_state_before_parallel  # scripts can run without a device loaded
 
         # Restore default Output_tee routing
         for ot in (Normal_out, Debug_out, Device_out, Exception_out, PPS_out):
@@ -728,26 +917,35 @@ class MainWin(LayoutMixin, QMainWindow):
         Trace_out.clear_py_streams()
         Trace_out.add_py_stream(self.traceTextOutput)
 
+        if error_message:
+            Info_out(hcolor(f"ERROR: Parallel run failed: {error_message}\n", "red"))
+
         # move cached output_tee contents where they belong
         if results:
             self._emit_outputs_from_parallel_run(results=tuple(results))
 
         # Report results
-        Info_out("\nParallel execution complete. Results:\n")
+        Info_out(f"\nParallel execution {'cancelled' if cancelled else 'complete'}. Results:\n")
         for result in results:
             status = hcolor("SUCCESS", "green", paragraph=False) if result.success else hcolor("FAILED", "red", paragraph=False)
-            Info_out(f"  [{status}] {result.sim_config.parameter_string}")
+            Info_out(f"  [{status}] {self._parallel_run_label(result.sim_config)}")
             if result.success:
                 Info_out(f" ➡️ Simulated time: {result.simulated_time_ms}ms, Wall time: {result.run_time_seconds:.2f}s")
             else:
                 Info_out(f" ➡️ Error: {result.error_message}\n")
+                if result.output_tail:
+                    Info_out(f"     Last {len(result.output_tail)} lines of output:\n")
+                    Info_out("".join(f"       {line}\n" for line in result.output_tail))
 
         # this one is special, don't restore until the above is done
         Info_out.clear_py_streams()
         Info_out.add_py_stream(self.infoTextOutput)
-        Info_out("\nParallel Run Finished!\n")
+        Info_out("\nParallel Run Cancelled!\n" if cancelled else "\nParallel Run Finished!\n")
+        self.update_ui_status()
 
         # show updated graph
+        if not self.simulation.has_device():
+            return
         try:
             html = self.simulation.device.show_output_stats()
             self.stats_win.setHtml(html)
@@ -765,25 +963,50 @@ class MainWin(LayoutMixin, QMainWindow):
     def _emit_outputs_from_parallel_run(
         self, results: tuple[SimulationResult, ...], mode: Literal["All Runs", "Last Run"] = "Last Run"
     ):
+        """
+        Show the Normal and Trace output of the last run (or of all runs). A single run's output spilled to an
+        uncompressed file is shown straight from that file (see MemLargeTextView.open_file) instead of the
+        views' earlier content; other output is appended in blocks, so the views can move it to disk as it grows.
+        """
         _mode = mode if mode in ["All Runs", "Last Run"] else "Last Run"
-        from collections import deque
-        from itertools import chain
+        from itertools import chain, islice
 
         if _mode == "All Runs":
-            start = 0  # All output
+            runs = results  # All output
         else:
-            start = -1  # Output from last run only
-
-        self.normalTextOutput.load(deque(chain.from_iterable(result.outputs["Normal_out"] for result in results[start:])))
-        self.traceTextOutput.load(deque(chain.from_iterable(result.outputs["Trace_out"] for result in results[start:])))
+            # Output from last run only, preferring the last one whose output was captured in full
+            full_runs = [
+                result
+                for result in results
+                if not result.resumed and result.sim_config.capture_policy("Normal_out").mode == "full"
+            ]
+            runs = (full_runs or results)[-1:]
+
+        for name, view in (("Normal_out", self.normalTextOutput), ("Trace_out", self.traceTextOutput)):
+            if len(runs) == 1 and name not in runs[0].outputs:
+                file = runs[0].output_files.get(name, "")
+                if file and not file.endswith(".gz") and view.open_file(file):
+                    continue
+            lines = chain.from_iterable(result.iter_output(name) for result in runs)
+            while True:
+                block = list(islice(lines, 100_000))
+                if not block:
+                    break
+                view.load(block)
 
     def run_next_cycle(self):
         self.simulation.run_next_cycle()
 
     def pause_simulation(self):
+        if self.parallel_run_active():
+            Info_out(hcolor("WARNING: Parallel runs cannot be paused, use Stop to cancel.\n", "gold"))
+            return
         self.simulation.pause_simulation()
 
     def halt_simulation(self):
+        if self.parallel_run_active():
+            self.cancel_parallel_run()
+            return
         self.simulation.halt_simulation(reason="user_stop", force=True)
 
     # ^^^^^^^^^^^^^^^^^^^^^^^^^^^^^^^^^^^^^^^^^
@@ -948,6 +1171,9 @@ class MainWin(LayoutMixin, QMainWindow):
             win.set_changed()
 
     def stop_simulation(self):
+        if self.parallel_run_active():
+            self.cancel_parallel_run()
+            return
         if isinstance(self.simulation, Simulation):
             self.simulation.halt_simulation(reason="user_stop")
 
@@ -992,7 +1218,10 @@ class MainWin(LayoutMixin, QMainWindow):
         debug_print("---------------------")
 
         debug_print("1. Stopping simulation...")
-        if self.run_state == RUNNING:
+        if self.parallel_run_active():
+            self.parallel_thread.cancel()
+            self.parallel_thread.wait()
+        elif self.run_state == RUNNING:
             self.halt_simulation()
 
         debug_print("2. ---")
@@ -1217,6 +1446,9 @@ class MainWin(LayoutMixin, QMainWindow):
         self.actionRun_One_Step.setEnabled(False)
 
         self.actionLoad_Device.setEnabled(False)
+        self.actionRun_Simulation_Script.setEnabled(False)
+        self.actionOpen_Normal_Output.setEnabled(False)
+        self.actionOpen_Trace_Output.setEnabled(False)
         self.actionLoad_Visual_Encoder.setEnabled(False)
         self.actionLoad_Auditory_Encoder.setEnabled(False)
         self.actionUnload_Visual_Encoder.setEnabled(False)
@@ -1261,6 +1493,9 @@ class MainWin(LayoutMixin, QMainWindow):
         self.actionRun_One_Step.setEnabled(True)
 
         self.actionLoad_Device.setEnabled(True)
+        self.actionRun_Simulation_Script.setEnabled(True)
+        self.actionOpen_Normal_Output.setEnabled(True)
+        self.actionOpen_Trace_Output.setEnabled(True)
         self.actionCompile_Rules.setEnabled(True)
         self.actionRecompile_Rules.setEnabled(has_rules)
         self.actionLoad_Visual_Encoder.setEnabled(has_device)
@@ -1307,6 +1542,9 @@ class MainWin(LayoutMixin, QMainWindow):
         self.actionRun_One_Step.setEnabled(runnable)
 
         self.actionLoad_Device.setEnabled(True)
+        self.actionRun_Simulation_Script.setEnabled(True)
+        self.actionOpen_Normal_Output.setEnabled(True)
+        self.actionOpen_Trace_Output.setEnabled(True)
         self.actionCompile_Rules.setEnabled(True)
         self.actionRecompile_Rules.setEnabled(has_rules)
         self.actionLoad_Visual_Encoder.setEnabled(has_device)
@@ -1367,6 +1605,45 @@ class MainWin(LayoutMixin, QMainWindow):
         """Toggle the allow_parallel_runs setting."""
         config.device_cfg.allow_parallel_runs = checked
 
+    def toggle_parallel_warm_workers(self, checked: bool):
+        """Toggle the parallel_warm_workers setting."""
+        config.device_cfg.parallel_warm_workers = checked
+
+    def toggle_parallel_rule_files(self, checked: bool):
+        """Toggle the parallel_rule_files setting."""
+        config.device_cfg.parallel_rule_files = checked
+
+    def toggle_parallel_resume_sweeps(self, checked: bool):
+        """Toggle the parallel_resume_sweeps setting."""
+        config.device_cfg.parallel_resume_sweeps = checked
+
+    def toggle_parallel_result_cache(self, checked: bool):
+        """Toggle the parallel_result_cache setting."""
+        config.device_cfg.parallel_result_cache = checked
+
+    def toggle_parallel_data_parquet(self, checked: bool):
+        """Switch the merged data of parallel runs between data_output.parquet (plus the CSV) and data_output.csv."""
+        config.device_cfg.parallel_data_format = "parquet" if checked else "csv"
+
+    @staticmethod
+    def _parallel_result_cache() -> ResultCache:
+        return ResultCache(config.get_config_dir() / CACHE_DIR_NAME)
+
+    @staticmethod
+    def _parallel_runtime_history() -> RuntimeHistory | None:
+        try:
+            return RuntimeHistory(config.get_config_dir() / HISTORY_FILE_NAME)
+        except sqlite3.Error as e:
+            log.warning(f"Unable to open the parallel run time history, runs will start in permutation order: {e}")
+            return None
+
+    def clear_parallel_result_cache(self):
+        try:
+            removed = self._parallel_result_cache().clear()
+            Info_out(f"Removed {removed} cached parallel run result(s).\n")
+        except OSError as e:
+            Info_out(hcolor(f"ERROR: Unable to clear the parallel result cache: {e}\n", "red"))
+
     def show_run_settings(self):
         if not self.simulation or not self.simulation.has_device():
             Info_out(hcolor("WARNING: Unable to open run settings, load a device first.\n", "gold"))
@@ -1679,6 +1956,37 @@ class MainWin(LayoutMixin, QMainWindow):
                     )
                 )
 
+    def open_output_file(self, name: str):
+        """
+        Show a saved Normal or Trace output file (e.g., from a headless run) in its output window, so
+        RuleFlow or the Process Viewer can be used on it. Huge files are read lazily (see MemLargeTextView.open_file).
+        """
+        if self.parallel_run_active() or self.run_state == RUNNING:
+            Info_out(hcolor(f"WARNING: Wait for the current run to finish before opening a {name} output file.\n", "gold"))
+            return
+
+        view = self.normalTextOutput if name == "Normal" else self.traceTextOutput
+        start_file = config.device_cfg.normal_out_file if name == "Normal" else config.device_cfg.trace_out_file
+        if start_file and Path(start_file).parent.is_dir():
+            start_dir = Path(start_file).parent
+        elif Path(config.device_cfg.device_file).parent.is_dir():
+            start_dir = Path(config.device_cfg.device_file).parent
+        else:
+            start_dir = Path.home()
+        out_file, _ = QFileDialog.getOpenFileName(
+            self,
+            f"Open {name} Output File",
+            str(start_dir),
+            "Text files (*.txt);;All Files (*)",
+        )
+        if not out_file:
+            return
+
+        if view.open_file(out_file):
+            Info_out(f"{name} Output window now shows {out_file}\n")
+        else:
+            Info_out(hcolor(f"ERROR: Unable to open {name} output file '{out_file}'.\n", "red"))
+
     def delete_datafile(self):
         if self.simulation and self.simulation.has_device() and self.simulation.has_model():
             if hasattr(self.simulation.device, "delete_data_file"):
@@ -1840,11 +2148,11 @@ class MainWin(LayoutMixin, QMainWindow):
     def _update_ruleflow_tool_enabled(self, _line_count: int = 0):
         """Enable RuleFlow tool only when normalTextOutput contains cycle data."""
         # Check if any line matches the pattern \d+:Cycle
-        has_cycle_data = any(re.match(r"\d+:Cycle", line) for line in self.normalTextOutput.lines)
+        has_cycle_data = any(re.match(r"\d+:Cycle", line) for line in self.normalTextOutput.iter_lines())
         self.actionRuleFlowTool.setEnabled(has_cycle_data)
 
     def _update_process_viewer_tool_enabled(self, _line_count: int = 0):
         """Enable Process Viewer tool only when traceTextOutput contains Human processor data."""
         # Check if any line matches the pattern \d+:Human
-        has_human_data = any(re.match(r"\d+:Human", line) for line in self.traceTextOutput.lines)
+        has_human_data = any(re.match(r"\d+:Human", line) for line in self.traceTextOutput.iter_lines())
         self.actionProcessViewerTool.setEnabled(has_human_data)
@@ -75,6 +75,13 @@ def setup_menu(window):
     file_menu.addAction(window.actionRun_Simulation_Script)
     file_menu.addSeparator()
 
+    window.actionOpen_Normal_Output = QAction("Open Normal Output File", window)
+    file_menu.addAction(window.actionOpen_Normal_Output)
+
+    window.actionOpen_Trace_Output = QAction("Open Trace Output File", window)
+    file_menu.addAction(window.actionOpen_Trace_Output)
+    file_menu.addSeparator()
+
     window.actionExport_Normal_Output = QAction("Export Normal Output", window)
     window.actionExport_Normal_Output.setEnabled(False)
     file_menu.addAction(window.actionExport_Normal_Output)
@@ -131,6 +138,34 @@ def setup_menu(window):
     window.actionAllow_Parallel_Runs.setCheckable(True)
     window.actionAllow_Parallel_Runs.setChecked(config.device_cfg.allow_parallel_runs)
     run_menu.addAction(window.actionAllow_Parallel_Runs)
+
+    window.actionReuse_Parallel_Workers = QAction("Reuse Loaded Device In Parallel Runs", window)
+    window.actionReuse_Parallel_Workers.setCheckable(True)
+    window.actionReuse_Parallel_Workers.setChecked(config.device_cfg.parallel_warm_workers)
+    run_menu.addAction(window.actionReuse_Parallel_Workers)
+
+    window.actionParallel_Rule_Files = QAction("Run Several Rule Files In Parallel", window)
+    window.actionParallel_Rule_Files.setCheckable(True)
+    window.actionParallel_Rule_Files.setChecked(config.device_cfg.parallel_rule_files)
+    run_menu.addAction(window.actionParallel_Rule_Files)
+
+    window.actionResume_Parallel_Sweeps = QAction("Make Parallel Runs Resumable", window)
+    window.actionResume_Parallel_Sweeps.setCheckable(True)
+    window.actionResume_Parallel_Sweeps.setChecked(config.device_cfg.parallel_resume_sweeps)
+    run_menu.addAction(window.actionResume_Parallel_Sweeps)
+
+    window.actionUse_Parallel_Result_Cache = QAction("Reuse Cached Results In Parallel Runs", window)
+    window.actionUse_Parallel_Result_Cache.setCheckable(True)
+    window.actionUse_Parallel_Result_Cache.setChecked(config.device_cfg.parallel_result_cache)
+    run_menu.addAction(window.actionUse_Parallel_Result_Cache)
+
+    window.actionSave_Parallel_Data_As_Parquet = QAction("Save Parallel Run Data As Parquet", window)
+    window.actionSave_Parallel_Data_As_Parquet.setCheckable(True)
+    window.actionSave_Parallel_Data_As_Parquet.setChecked(config.device_cfg.parallel_data_format == "parquet")
+    run_menu.addAction(window.actionSave_Parallel_Data_As_Parquet)
+
+    window.actionClear_Parallel_Result_Cache = QAction("Clear Parallel Result Cache", window)
+    run_menu.addAction(window.actionClear_Parallel_Result_Cache)
     run_menu.addSeparator()
 
     window.actionRun_Settings = QAction("Run Settings", window)
@@ -239,6 +274,12 @@ def setup_menu_connections(window):
 
     # Run menu actions
     window.actionAllow_Parallel_Runs.toggled.connect(window.toggle_allow_parallel_runs)
+    window.actionReuse_Parallel_Workers.toggled.connect(window.toggle_parallel_warm_workers)
+    window.actionParallel_Rule_Files.toggled.connect(window.toggle_parallel_rule_files)
+    window.actionResume_Parallel_Sweeps.toggled.connect(window.toggle_parallel_resume_sweeps)
+    window.actionUse_Parallel_Result_Cache.toggled.connect(window.toggle_parallel_result_cache)
+    window.actionSave_Parallel_Data_As_Parquet.toggled.connect(window.toggle_parallel_data_parquet)
+    window.actionClear_Parallel_Result_Cache.triggered.connect(window.clear_parallel_result_cache)
     window.actionRun_Settings.triggered.connect(window.show_run_settings)
 
     window.actionRun_Normal.triggered.connect(lambda _: window.run_normal())
@@ -250,7 +291,9 @@ def setup_menu_connections(window):
     window.actionPause.triggered.connect(window.pause_simulation)
     window.actionPause.setShortcut("Ctrl+Alt+P")
     window.actionDelete_Datafile.triggered.connect(window.delete_datafile)
-    window.actionRun_Simulation_Script.setVisible(False)
+    window.actionRun_Simulation_Script.triggered.connect(window.run_simulation_script)
+    window.actionOpen_Normal_Output.triggered.connect(partial(window.open_output_file, name="Normal"))
+    window.actionOpen_Trace_Output.triggered.connect(partial(window.open_output_file, name="Trace"))
 
     # Help menu actions
     window.actionAbout.triggered.connect(window.about_dialog)
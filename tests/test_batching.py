@@ -0,0 +1,75 @@
+import multiprocessing
+import time
+
+import pytest
+
+import epicpy.epic.parallel_simulation as parallel_simulation
+from epicpy.epic.parallel_simulation import OutputSettings, SimulationConfig, SimulationResult
+from epicpy.epic.runtime_history import RuntimeHistory
+
+fork_only = pytest.mark.skipif(
+    multiprocessing.get_start_method() != "fork", reason="pool workers only see the patched runner when forked"
+)
+
+
+def _slow_run(sim_config: SimulationConfig) -> SimulationResult:
+    time.sleep(0.2)
+    return SimulationResult(sim_config=sim_config, success=True)
+
+
+@fork_only
+def test_batched_runs_are_reported_one_by_one(monkeypatch):
+    monkeypatch.setattr(parallel_simulation, "run_single_simulation", _slow_run)
+    sim_configs = [
+        SimulationConfig(
+            device_file="device.py", rule_file="rules.prs", parameter_string=str(i), output_settings=OutputSettings()
+        )
+        for i in range(4)
+    ]
+    reported = []
+
+    results = parallel_simulation._run_pooled_simulations(
+        sim_configs, 1, lambda result: reported.append(time.monotonic()), None, False, batch_size=4
+    )
+
+    assert sorted(r.sim_config.parameter_string for r in results) == ["0", "1", "2", "3"]
+    assert all(r.success for r in results)
+    assert reported[-1] - reported[0] > 0.4  # not all at once when the batch ends
+
+
+def _history_of_runs(tmp_path, count: int, run_time: float) -> tuple[RuntimeHistory, list[SimulationConfig]]:
+    history = RuntimeHistory(tmp_path / "history.sqlite")
+    sim_configs = [
+        SimulationConfig(
+            device_file="device.py", rule_file="rules.prs", parameter_string=str(i), output_settings=OutputSettings()
+        )
+        for i in range(count)
+    ]
+    for sim_config in sim_configs:
+        history.record(SimulationResult(sim_config=sim_config, success=True, run_time_seconds=run_time))
+    return history, sim_configs
+
+
+def test_runs_without_history_are_not_batched(tmp_path):
+    history = RuntimeHistory(tmp_path / "history.sqlite")
+    sim_configs = [
+        SimulationConfig(
+            device_file="device.py", rule_file="rules.prs", parameter_string="Easy", output_settings=OutputSettings()
+        )
+    ] * 50
+
+    assert history.batch_size(sim_configs, max_workers=2) == 1
+
+
+@pytest.mark.parametrize(
+    "run_time, expected",
+    [
+        (5.0, 1),  # long runs: one per task
+        (0.25, 4),  # about BATCH_TARGET_SECONDS per task
+        (0.001, 13),  # tiny runs: capped so each of the 2 workers still gets MIN_TASKS_PER_WORKER tasks
+    ],
+)
+def test_batch_size_follows_the_known_run_times(tmp_path, run_time, expected):
+    history, sim_configs = _history_of_runs(tmp_path, 100, run_time)
+
+    assert history.batch_size(sim_configs, max_workers=2) == expected
@@ -0,0 +1,43 @@
+import pytest
+
+import epicpy.widgets.chunked_lines as chunked_lines
+from epicpy.widgets.chunked_lines import ChunkedLines
+
+
+@pytest.fixture(autouse=True)
+def small_blocks(monkeypatch):
+    monkeypatch.setattr(chunked_lines, "BLOCK_SIZE", 4)
+
+
+def test_lines_index_and_slice_like_a_list():
+    expected = [f"line {i}" for i in range(11)]
+    lines = ChunkedLines(expected[:3])
+    lines.append(expected[3])
+    lines.extend(expected[4:9])
+    lines += expected[9:]
+
+    assert len(lines) == len(expected)
+    assert list(lines) == expected
+    assert [lines[i] for i in range(-11, 11)] == [expected[i] for i in range(-11, 11)]
+    for piece in (slice(2, 9), slice(3, 4), slice(0, 11), slice(-5, None), slice(1, 10, 3), slice(9, 2, -2), slice(6, 6)):
+        assert lines[piece] == expected[piece], piece
+    with pytest.raises(IndexError):
+        lines[11]
+
+
+def test_every_block_but_the_last_stays_full():
+    lines = ChunkedLines(["a", "b", "c"])
+    lines.extend(["d", "e"])
+    lines.append("f")
+    lines.extend(lines)
+
+    assert [len(block) for block in lines._blocks] == [4, 4, 4]
+    assert list(lines) == list("abcdef" * 2)
+
+
+def test_clear_starts_over():
+    lines = ChunkedLines(["a", "b", "c", "d", "e"])
+    lines.clear()
+    lines.append("f")
+
+    assert list(lines) == ["f"] and lines[-1] == "f"
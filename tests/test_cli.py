@@ -0,0 +1,63 @@
+import json
+
+import pytest
+
+import epicpy.epic.parallel_simulation as parallel_simulation
+from epicpy.cli import build_parser, do_run
+from epicpy.epic.parallel_simulation import SimulationConfig, SimulationResult
+
+
+@pytest.fixture
+def device_folder(tmp_path):
+    (tmp_path / "choice_device.py").write_text("# device\n")
+    (tmp_path / "easy.prs").write_text("// rules\n")
+    (tmp_path / "hard.prs").write_text("// rules\n")
+    device_config = {"device_params": "[Easy|Hard]", "run_command": "run_for", "run_command_value": 500, "trace_visual": True}
+    (tmp_path / "choice_device_config.json").write_text(json.dumps(device_config))
+    return tmp_path
+
+
+def _run(device_folder, monkeypatch, *options: str, fail: str = "") -> tuple[int, list[SimulationConfig]]:
+    """do_run on the device folder's rule files, with runs that only record their configs."""
+    ran = []
+
+    def run_single_simulation(sim_config: SimulationConfig) -> SimulationResult:
+        ran.append(sim_config)
+        success = sim_config.parameter_string != fail
+        return SimulationResult(sim_config=sim_config, success=success, outputs={"Normal_out": [sim_config.parameter_string]})
+
+    monkeypatch.setattr(parallel_simulation, "run_single_simulation", run_single_simulation)
+    rules = [str(device_folder / "easy.prs"), str(device_folder / "hard.prs")]
+    args = build_parser().parse_args(["run", str(device_folder / "choice_device.py"), *rules, "--keep-order", *options])
+    return do_run(args), ran
+
+
+def test_run_uses_the_device_config_for_every_rule_file(device_folder, monkeypatch):
+    status, ran = _run(device_folder, monkeypatch, "--normal-out", str(device_folder / "normal.txt"))
+
+    assert status == 0
+    assert [(cfg.rule_file.rsplit("/", 1)[-1], cfg.parameter_string) for cfg in ran] == [
+        ("easy.prs", "Easy"),
+        ("easy.prs", "Hard"),
+        ("hard.prs", "Easy"),
+        ("hard.prs", "Hard"),
+    ]
+    assert all(cfg.run_command == "run_for" and cfg.run_command_value == 500 for cfg in ran)
+    assert all(cfg.output_settings.trace_visual for cfg in ran)
+    assert (device_folder / "normal.txt").read_text() == "Easy\nHard\nEasy\nHard\n"
+
+
+def test_command_line_options_override_the_device_config(device_folder, monkeypatch):
+    status, ran = _run(device_folder, monkeypatch, "--params", "Mixed", "--run-value", "900", "--no-trace")
+
+    assert status == 0
+    assert [cfg.parameter_string for cfg in ran] == ["Mixed", "Mixed"]
+    assert all(cfg.run_command_value == 900 and not cfg.output_settings.trace_visual for cfg in ran)
+
+
+def test_run_fails_when_a_run_fails_or_a_file_is_missing(device_folder, monkeypatch):
+    assert _run(device_folder, monkeypatch, fail="Hard")[0] == 1
+
+    (device_folder / "hard.prs").unlink()
+    status, ran = _run(device_folder, monkeypatch)
+    assert status == 2 and not ran
@@ -0,0 +1,63 @@
+import csv
+
+import pytest
+
+from epicpy.epic.parallel_simulation import (
+    OutputSettings,
+    SimulationResult,
+    create_sim_configs_from_permutations,
+    merge_data_files,
+    merge_data_files_columnar,
+)
+
+
+def _replicated_results(tmp_path) -> list[SimulationResult]:
+    sim_configs = create_sim_configs_from_permutations(
+        device_file=str(tmp_path / "device.py"),
+        rule_file=str(tmp_path / "rules.prs"),
+        base_param_string="[Easy|Hard]",
+        output_settings=OutputSettings(),
+        replications=2,
+        base_seed=7,
+    )
+    results = []
+    for i, cfg in enumerate(sim_configs):
+        data_file = tmp_path / f"run_{i}.csv"
+        data_file.write_text(f"trial,rt\n1,{300 + i}\n")
+        results.append(SimulationResult(sim_config=cfg, success=True, data_file=str(data_file)))
+    return results
+
+
+def _expected_tags(results: list[SimulationResult]) -> list[dict]:
+    return [
+        {
+            "parameter_string": r.sim_config.parameter_string,
+            "condition": r.sim_config.condition,
+            "replication": r.sim_config.replication,
+            "seed": r.sim_config.seed,
+        }
+        for r in results
+    ]
+
+
+def test_merged_csv_tags_rows_with_the_condition_index(tmp_path):
+    results = _replicated_results(tmp_path)
+
+    merge_data_files(results, tmp_path / "data_output.csv")
+
+    with open(tmp_path / "data_output.csv", newline="") as f:
+        rows = list(csv.DictReader(f))
+    assert list(rows[0]) == ["trial", "rt", "parameter_string", "condition", "replication", "seed"]
+    tags = [{name: row[name] for name in ("parameter_string", "condition", "replication", "seed")} for row in rows]
+    assert tags == [{name: str(value) for name, value in row.items()} for row in _expected_tags(results)]
+
+
+def test_columnar_merge_has_the_same_tag_columns_as_csv(tmp_path):
+    pl = pytest.importorskip("polars")
+    results = _replicated_results(tmp_path)
+
+    merge_data_files_columnar(results, tmp_path / "data_output.parquet")
+
+    frame = pl.read_parquet(tmp_path / "data_output.parquet")
+    assert frame.columns == ["trial", "rt", "parameter_string", "condition", "replication", "seed"]
+    assert frame.select("parameter_string", "condition", "replication", "seed").to_dicts() == _expected_tags(results)
@@ -0,0 +1,92 @@
+import os
+
+import pytest
+
+import epicpy.widgets.search_index as search_index
+from epicpy.widgets.file_lines import FileBackedLines, scan_line_offsets
+from epicpy.widgets.search_index import SearchIndex
+
+LINES = ["alpha", "", "gamma ü", "delta", "epsilon beta", "zeta"]
+
+
+@pytest.fixture
+def file_lines(tmp_path):
+    lines = FileBackedLines(LINES[:2], directory=tmp_path)
+    yield lines
+    lines.close()
+
+
+def test_lines_are_read_back_from_the_file(file_lines):
+    first = file_lines[0]  # maps the file before more lines are appended
+    file_lines.append(LINES[2])
+    file_lines += LINES[3:]
+
+    assert first == "alpha"
+    assert len(file_lines) == len(LINES) and list(file_lines) == LINES
+    assert [file_lines[i] for i in range(-6, 6)] == [LINES[i] for i in range(-6, 6)]
+    for piece in (slice(1, 4), slice(None, None, 2), slice(5, 0, -2), slice(3, 3)):
+        assert file_lines[piece] == LINES[piece], piece
+    assert file_lines.joined(1, 4) == "\n".join(LINES[1:4])
+    assert list(file_lines.read_joined([(0, 2), (4, 6)])) == ["alpha\n", "epsilon beta\nzeta"]
+    with pytest.raises(IndexError):
+        file_lines[6]
+
+
+def test_save_writes_one_line_per_line(file_lines, tmp_path):
+    file_lines.extend(LINES[2:])
+    file_lines.save(tmp_path / "saved.txt")
+
+    assert (tmp_path / "saved.txt").read_text(encoding="utf-8") == "".join(f"{line}\n" for line in LINES)
+
+
+def test_clear_and_close(file_lines):
+    file_lines.clear()
+    file_lines.append("again")
+
+    assert list(file_lines) == ["again"]
+    file_lines.close()
+    assert not os.path.exists(file_lines.path)
+
+
+def test_search_index_reads_file_backed_blocks(file_lines, monkeypatch):
+    monkeypatch.setattr(search_index, "BLOCK_LINES", 4)
+    index = SearchIndex()
+    index.update(file_lines)
+    file_lines.extend(LINES[2:])
+    index.update(file_lines)
+
+    text = "\n".join(LINES)
+    assert index._blocks == [None, None]  # only the offsets stay in memory
+    assert index.find("beta", 0) == (text.index("beta"), 4)
+    # matches never span two blocks, so the "a\n" ending the first block (delta) is skipped
+    assert index.find("a\n", index.offset(4, 0), forward=False) == (text.index("a\n"), 2)
+    assert index.line_col(index.find("zeta", 0)[0]) == (5, 0)
+
+
+def test_opened_file_is_indexed_as_it_is_scanned(tmp_path):
+    pytest.importorskip("numpy")
+    path = tmp_path / "trace.txt"
+    path.write_bytes("alpha\r\n\r\ngamma ü\r\ndelta\r\nepsilon beta\r\nzeta".encode("utf-8"))
+    lines = FileBackedLines.from_file(path)
+    chunks = scan_line_offsets(path, chunk_bytes=8)
+
+    lines.add_offsets(*next(chunks))
+    assert 0 < len(lines) < len(LINES) and lines[0] == "alpha"
+    assert list(lines.iter_file()) == LINES  # not yet indexed lines too
+    for offsets, end in chunks:
+        lines.add_offsets(offsets, end)
+
+    assert list(lines) == LINES
+    with pytest.raises(ValueError):
+        lines.append("more")
+    lines.close()
+    assert path.is_file()  # an opened file is left in place
+
+
+def test_scan_stops_once_cancelled(tmp_path):
+    pytest.importorskip("numpy")
+    path = tmp_path / "trace.txt"
+    path.write_text("a\nb\nc\nd\n")
+
+    assert len(list(scan_line_offsets(path, cancelled=lambda: True))) == 0
+    assert [list(offsets) for offsets, _ in scan_line_offsets(path, chunk_bytes=4)] == [[0, 2], [4, 6]]
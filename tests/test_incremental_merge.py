@@ -0,0 +1,49 @@
+import json
+
+import pytest
+
+from epicpy.epic.parallel_simulation import (
+    PARTIAL_MERGE_MARKER,
+    IncrementalDataMerge,
+    OutputSettings,
+    SimulationResult,
+    create_sim_configs_from_permutations,
+)
+
+
+def _run_result(tmp_path, rows: str) -> SimulationResult:
+    (sim_config,) = create_sim_configs_from_permutations(
+        device_file=str(tmp_path / "device.py"),
+        rule_file=str(tmp_path / "rules.prs"),
+        base_param_string="Easy",
+        output_settings=OutputSettings(),
+    )
+    data_file = tmp_path / "run_data.csv"
+    data_file.write_text(rows)
+    return SimulationResult(sim_config=sim_config, success=True, data_file=str(data_file))
+
+
+def test_merge_leaves_a_partial_file_it_did_not_write_alone(tmp_path):
+    (tmp_path / "data_output.partial.csv").write_text("mine\n")
+
+    with pytest.warns(UserWarning, match="data_output.partial1.csv"):
+        merge = IncrementalDataMerge(tmp_path)
+    merge.add(_run_result(tmp_path, "trial,rt\n1,350\n"))
+    merge.finish()
+
+    assert (tmp_path / "data_output.partial.csv").read_text() == "mine\n"
+    assert (tmp_path / "data_output.csv").read_text() == "trial,rt\n1,350\n"
+    assert not (tmp_path / "data_output.partial1.csv").exists()
+    assert not (tmp_path / PARTIAL_MERGE_MARKER).exists()
+
+
+def test_merge_clears_the_leftovers_of_a_crashed_sweep(tmp_path):
+    IncrementalDataMerge(tmp_path).add(_run_result(tmp_path, "trial,rt\n1,350\n"))
+    (tmp_path / "data_output.parts").mkdir()  # as a parquet or arrow sweep would have
+    assert json.loads((tmp_path / PARTIAL_MERGE_MARKER).read_text())["parts"] == "data_output.parts"
+
+    IncrementalDataMerge(tmp_path)
+
+    assert not (tmp_path / "data_output.partial.csv").exists()
+    assert not (tmp_path / "data_output.parts").exists()
+    assert (tmp_path / PARTIAL_MERGE_MARKER).exists()  # until the new merge is finished
@@ -0,0 +1,63 @@
+import csv
+
+import pytest
+
+from epicpy.epic.parallel_simulation import (
+    OutputSettings,
+    SimulationResult,
+    create_sim_configs_from_permutations,
+    merge_data_files,
+    merge_data_files_columnar,
+)
+
+
+def _results(tmp_path, *data: str) -> list[SimulationResult]:
+    levels = "|".join(f"L{i}" for i in range(len(data)))
+    sim_configs = create_sim_configs_from_permutations(
+        device_file=str(tmp_path / "device.py"),
+        rule_file=str(tmp_path / "rules.prs"),
+        base_param_string=f"[{levels}]",
+        output_settings=OutputSettings(),
+    )
+    results = []
+    for i, (cfg, rows) in enumerate(zip(sim_configs, data)):
+        data_file = tmp_path / f"run_{i}.csv"
+        data_file.write_text(rows)
+        results.append(SimulationResult(sim_config=cfg, success=True, data_file=str(data_file)))
+    return results
+
+
+def _read_csv(path) -> list[dict]:
+    with open(path, newline="") as f:
+        return list(csv.DictReader(f))
+
+
+def test_merge_appends_rows_under_one_header(tmp_path):
+    results = _results(tmp_path, "trial,rt\n1,350\n\n", "trial,rt\n1,410\n2,390\n")
+
+    assert merge_data_files(results, tmp_path / "data_output.csv") == 3
+    assert (tmp_path / "data_output.csv").read_text() == "trial,rt\n1,350\n1,410\n2,390\n"
+
+
+def test_merge_takes_the_union_of_mismatched_columns(tmp_path):
+    results = _results(tmp_path, "trial,rt\n1,350\n", "trial,correct,rt\n1,yes,410\n")
+
+    with pytest.warns(UserWarning, match="different columns"):
+        assert merge_data_files(results, tmp_path / "data_output.csv") == 2
+
+    rows = _read_csv(tmp_path / "data_output.csv")
+    assert list(rows[0]) == ["trial", "rt", "correct"]
+    assert rows == [{"trial": "1", "rt": "350", "correct": ""}, {"trial": "1", "rt": "410", "correct": "yes"}]
+
+
+def test_columnar_merge_takes_the_union_of_mismatched_columns(tmp_path):
+    pl = pytest.importorskip("polars")
+    results = _results(tmp_path, "trial,rt\n1,350\n", "trial,correct,rt\n1,yes,410.5\n")
+
+    with pytest.warns(UserWarning, match="different columns"):
+        assert merge_data_files_columnar(results, tmp_path / "data_output.parquet") == 2
+
+    merged = pl.read_parquet(tmp_path / "data_output.parquet")
+    assert set(merged.columns) == {"trial", "rt", "correct"}
+    assert merged.sort("rt")["rt"].to_list() == [350.0, 410.5]
+    assert merged.sort("rt")["correct"].to_list() == [None, "yes"]
@@ -0,0 +1,87 @@
+import os
+import stat
+
+import pytest
+
+from epicpy.epic.parallel_simulation import (
+    OutputSettings,
+    _load_encoder,
+    create_sim_configs_from_permutations,
+    device_temp_dir,
+    stage_device_folders,
+)
+
+
+@pytest.mark.parametrize("mode", ["symlink", "hardlink", "copy"])
+def test_devices_with_the_same_folder_name_are_staged_apart(tmp_path, mode):
+    sim_configs = []
+    for name in ("first", "second"):
+        stimuli = tmp_path / name / "stimuli"
+        stimuli.mkdir(parents=True)
+        (stimuli / "words.txt").write_text(f"{name} words")
+        sim_configs += create_sim_configs_from_permutations(
+            device_file=str(tmp_path / name / "device.py"),
+            rule_file=str(tmp_path / name / "rules.prs"),
+            base_param_string="[Easy|Hard]",
+            output_settings=OutputSettings(),
+        )
+    temp_dir = tmp_path / "temp"
+
+    stage_device_folders(sim_configs, temp_dir, mode)
+
+    first_dir = device_temp_dir(temp_dir, tmp_path / "first")
+    second_dir = device_temp_dir(temp_dir, tmp_path / "second")
+    assert first_dir != second_dir
+    assert (first_dir / "stimuli" / "words.txt").read_text() == "first words"
+    assert (second_dir / "stimuli" / "words.txt").read_text() == "second words"
+    if mode == "symlink":
+        assert (first_dir / "stimuli").is_symlink()
+
+
+def test_encoder_can_import_its_sibling_modules(tmp_path):
+    (tmp_path / "encoder_helpers.py").write_text("GAIN = 2\n")
+    encoder_file = tmp_path / "gain_encoder.py"
+    encoder_file.write_text(
+        "from encoder_helpers import GAIN\n\n\n"
+        "class VisualEncoder:\n"
+        "    def __init__(self, name):\n"
+        "        self.gain = GAIN\n"
+    )
+
+    encoder, status = _load_encoder(str(encoder_file), "Visual", print)
+
+    assert encoder.gain == 2, status
+
+
+def test_encoder_that_fails_to_load_warns(tmp_path):
+    encoder_file = tmp_path / "broken_encoder.py"
+    encoder_file.write_text("raise RuntimeError('broken')\n")
+
+    with pytest.warns(UserWarning, match="using the null encoder"):
+        _encoder, status = _load_encoder(str(encoder_file), "Auditory", print)
+
+    assert "FAILED" in status
+
+
+def test_hardlink_staging_never_links_a_writable_file(tmp_path):
+    stimuli = tmp_path / "device" / "stimuli"
+    stimuli.mkdir(parents=True)
+    (stimuli / "writable.txt").write_text("writable")
+    (stimuli / "read_only.txt").write_text("read only")
+    os.chmod(stimuli / "read_only.txt", stat.S_IREAD)
+    sim_configs = create_sim_configs_from_permutations(
+        device_file=str(tmp_path / "device" / "device.py"),
+        rule_file=str(tmp_path / "device" / "rules.prs"),
+        base_param_string="",
+        output_settings=OutputSettings(),
+    )
+    temp_dir = tmp_path / "temp"
+
+    stage_device_folders(sim_configs, temp_dir, "hardlink")
+
+    staged = device_temp_dir(temp_dir, tmp_path / "device") / "stimuli"
+    assert not os.path.samefile(staged / "writable.txt", stimuli / "writable.txt")
+    assert os.path.samefile(staged / "read_only.txt", stimuli / "read_only.txt")
+    for name in ("writable.txt", "read_only.txt"):
+        assert not os.stat(staged / name).st_mode & (stat.S_IWUSR | stat.S_IWGRP | stat.S_IWOTH)
+    assert os.stat(stimuli / "writable.txt").st_mode & stat.S_IWUSR
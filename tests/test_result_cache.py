@@ -0,0 +1,61 @@
+import os
+
+from epicpy.epic.parallel_simulation import OutputSettings, SimulationResult, create_sim_configs_from_permutations
+from epicpy.epic.result_cache import ResultCache
+
+
+def _finished_run(tmp_path, level: str, rows: str = "trial,rt\n1,350\n") -> SimulationResult:
+    (tmp_path / "device.py").write_text("# device\n")
+    (tmp_path / "rules.prs").write_text("// rules\n")
+    (sim_config,) = create_sim_configs_from_permutations(
+        device_file=str(tmp_path / "device.py"),
+        rule_file=str(tmp_path / "rules.prs"),
+        base_param_string=level,
+        output_settings=OutputSettings(),
+    )
+    data_file = tmp_path / f"run_{level}.csv"
+    data_file.write_text(rows)
+    return SimulationResult(sim_config=sim_config, success=True, data_file=str(data_file), run_time_seconds=1.5)
+
+
+def test_cached_run_is_found_until_its_rules_change(tmp_path):
+    cache = ResultCache(tmp_path / "cache")
+    result = _finished_run(tmp_path, "Easy")
+
+    assert cache.lookup(result.sim_config) is None
+    assert cache.store(result)
+
+    hit = cache.lookup(result.sim_config)
+    assert hit and hit.entry["run_time_seconds"] == 1.5
+    assert open(hit.data_file).read() == "trial,rt\n1,350\n"
+
+    (tmp_path / "rules.prs").write_text("// edited rules\n")
+    assert cache.lookup(result.sim_config) is None
+
+
+def test_failed_runs_are_not_cached(tmp_path):
+    cache = ResultCache(tmp_path / "cache")
+    result = _finished_run(tmp_path, "Easy")
+    result.success = False
+
+    assert not cache.store(result)
+    assert cache.lookup(result.sim_config) is None
+
+
+def test_cache_evicts_the_least_recently_used_run(tmp_path):
+    rows = "trial,rt\n" + "1,350\n" * 100
+    easy, hard, mixed = (_finished_run(tmp_path, level, rows) for level in ("Easy", "Hard", "Mixed"))
+    cache = ResultCache(tmp_path / "cache", max_bytes=10**9)
+    cache.store(easy)
+    cache.store(hard)
+    # give the entries distinct, known use times, then use the older one again
+    for age, result in ((200, easy), (100, hard)):
+        result_file = tmp_path / "cache" / cache.key(result.sim_config) / "result.json"
+        os.utime(result_file, (result_file.stat().st_mtime - age,) * 2)
+    assert cache.lookup(easy.sim_config)
+
+    cache.max_bytes = cache.size_bytes() + 100  # room for two entries, give or take a few bytes of result.json
+    cache.store(mixed)
+
+    assert cache.lookup(hard.sim_config) is None
+    assert cache.lookup(easy.sim_config) and cache.lookup(mixed.sim_config)
@@ -0,0 +1,106 @@
+import multiprocessing
+import time
+
+import pytest
+
+import epicpy.epic.parallel_simulation as parallel_simulation
+from epicpy.epic.parallel_simulation import (
+    OutputSettings,
+    SimulationConfig,
+    SimulationResult,
+    create_sim_configs_from_run_infos,
+    merge_data_files,
+)
+from epicpy.epic.run_info import RunInfo
+
+fork_only = pytest.mark.skipif(
+    multiprocessing.get_start_method() != "fork", reason="pool workers only see the patched runner when forked"
+)
+
+
+def test_job_set_covers_every_rule_file_and_permutation_in_order():
+    run_infos = [
+        RunInfo(rule_file="first.prs"),
+        RunInfo(rule_file="second.prs", parameter_string="[Slow|Fast]", after=(0,)),
+    ]
+
+    sim_configs = create_sim_configs_from_run_infos(run_infos, "device.py", "[Easy|Hard]", OutputSettings())
+
+    assert [(cfg.job, cfg.rule_file, cfg.parameter_string, cfg.after) for cfg in sim_configs] == [
+        (0, "first.prs", "Easy", ()),
+        (0, "first.prs", "Hard", ()),
+        (1, "second.prs", "Slow", (0,)),
+        (1, "second.prs", "Fast", (0,)),
+    ]
+    assert all(cfg.device_file == "device.py" for cfg in sim_configs)
+
+
+def test_replications_share_their_seeds_across_rule_files():
+    run_infos = [RunInfo(rule_file="first.prs"), RunInfo(rule_file="second.prs")]
+
+    sim_configs = create_sim_configs_from_run_infos(run_infos, "device.py", "[Easy|Hard]", OutputSettings(), replications=2)
+
+    seeds = [{(cfg.parameter_string, cfg.replication): cfg.seed for cfg in sim_configs if cfg.job == job} for job in (0, 1)]
+    assert len(set(seeds[0].values())) == 4
+    assert seeds[0] == seeds[1]
+
+
+def test_clear_data_drops_only_the_earlier_data_of_its_device():
+    run_infos = [
+        RunInfo(rule_file="a.prs"),
+        RunInfo(rule_file="b.prs", device_file="other.py"),
+        RunInfo(rule_file="c.prs", clear_data=True),
+        RunInfo(rule_file="d.prs"),
+    ]
+
+    sim_configs = create_sim_configs_from_run_infos(run_infos, "device.py", "Easy", OutputSettings())
+
+    assert [(cfg.rule_file, cfg.keep_data) for cfg in sim_configs] == [
+        ("a.prs", False),
+        ("b.prs", True),
+        ("c.prs", True),
+        ("d.prs", True),
+    ]
+
+
+def test_merge_leaves_out_data_a_later_job_cleared(tmp_path):
+    run_infos = [RunInfo(rule_file="a.prs"), RunInfo(rule_file="b.prs", clear_data=True)]
+    sim_configs = create_sim_configs_from_run_infos(run_infos, str(tmp_path / "device.py"), "Easy", OutputSettings())
+    results = []
+    for i, cfg in enumerate(sim_configs):
+        data_file = tmp_path / f"run_{i}.csv"
+        data_file.write_text(f"trial,rt\n1,{350 + i}\n")
+        results.append(SimulationResult(sim_config=cfg, success=True, data_file=str(data_file)))
+
+    merge_data_files(results, tmp_path / "data_output.csv")
+
+    assert (tmp_path / "data_output.csv").read_text() == "trial,rt\n1,351\n"
+
+
+def _timed_run(sim_config: SimulationConfig) -> SimulationResult:
+    started = time.monotonic()
+    time.sleep(0.2)
+    success = sim_config.rule_file != "broken.prs"
+    # carry the start and finish times back in the result's timing fields
+    return SimulationResult(sim_config=sim_config, success=success, run_time_seconds=started, simulated_time_ms=time.monotonic())
+
+
+@fork_only
+def test_runs_wait_for_the_jobs_they_come_after(monkeypatch):
+    monkeypatch.setattr(parallel_simulation, "run_single_simulation", _timed_run)
+    run_infos = [
+        RunInfo(rule_file="first.prs"),
+        RunInfo(rule_file="broken.prs"),
+        RunInfo(rule_file="second.prs", after=(0,)),
+        RunInfo(rule_file="never.prs", after=(1,)),
+    ]
+    sim_configs = create_sim_configs_from_run_infos(run_infos, "device.py", "[Easy|Hard]", OutputSettings())
+
+    results = parallel_simulation._run_pooled_simulations(sim_configs, 4, None, None, False)
+
+    by_rule: dict[str, list[SimulationResult]] = {}
+    for result in results:
+        by_rule.setdefault(result.sim_config.rule_file, []).append(result)
+    first_finished = max(r.simulated_time_ms for r in by_rule["first.prs"])  # finish times, see _timed_run
+    assert all(r.success and r.run_time_seconds >= first_finished for r in by_rule["second.prs"])
+    assert all(not r.success and r.error_message.startswith("Skipped") for r in by_rule["never.prs"])
@@ -0,0 +1,35 @@
+from epicpy.epic.parallel_simulation import OutputSettings, SimulationResult, create_sim_configs_from_permutations
+from epicpy.epic.runtime_history import RuntimeHistory
+
+
+def _sweep_configs(tmp_path, levels: str):
+    return create_sim_configs_from_permutations(
+        device_file=str(tmp_path / "device.py"),
+        rule_file=str(tmp_path / "rules.prs"),
+        base_param_string=f"[{levels}]",
+        output_settings=OutputSettings(),
+    )
+
+
+def _record(history: RuntimeHistory, sim_config, *seconds: float):
+    for run_time in seconds:
+        history.record(SimulationResult(sim_config=sim_config, success=True, run_time_seconds=run_time))
+
+
+def test_without_history_the_order_is_unchanged(tmp_path):
+    history = RuntimeHistory(tmp_path / "history.sqlite")
+    sim_configs = _sweep_configs(tmp_path, "A|B|C")
+
+    assert history.longest_first(sim_configs) == sim_configs
+
+
+def test_longest_runs_start_first(tmp_path):
+    history = RuntimeHistory(tmp_path / "history.sqlite")
+    a, b, c, d = _sweep_configs(tmp_path, "A|B|C|D")
+    _record(history, a, 1.0)
+    _record(history, b, 2.0, 10.0)  # running mean of 6s
+    _record(history, c, 3.0)
+
+    assert history.expected_seconds([a, b, c, d]) == [1.0, 6.0, 3.0, None]
+    # D has never run, so it is placed as if it took the median known time (3s), after C
+    assert [cfg.parameter_string for cfg in history.longest_first([a, b, c, d])] == ["B", "C", "D", "A"]
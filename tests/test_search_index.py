@@ -0,0 +1,88 @@
+import re
+
+import pytest
+
+import epicpy.widgets.search_index as search_index
+from epicpy.widgets.chunked_lines import ChunkedLines
+from epicpy.widgets.search_index import MatchIndex, SearchIndex, find_all
+
+LINES = ["alpha", "Beta gamma", "", "delta beta", "epsilon", "zeta BETA", "eta", "theta beta"]
+
+
+@pytest.fixture(autouse=True)
+def small_blocks(monkeypatch):
+    monkeypatch.setattr(search_index, "BLOCK_LINES", 3)
+
+
+def _indexed(lines) -> SearchIndex:
+    index = SearchIndex()
+    index.update(lines)
+    return index
+
+
+def _found(text: str, found: tuple[int, int]) -> str:
+    offset, length = found
+    return text[offset : offset + length]
+
+
+def test_appended_lines_are_indexed_as_if_all_were_new():
+    lines = ChunkedLines(LINES[:4])
+    index = _indexed(lines)
+    progress = []
+    lines.extend(LINES[4:])
+
+    assert index.pending(lines) == 4
+    index.update(lines, progress.append)
+
+    fresh = _indexed(LINES)
+    assert index.pending(lines) == 0
+    assert index._blocks == fresh._blocks == ["alpha\nBeta gamma\n", "delta beta\nepsilon\nzeta BETA", "eta\ntheta beta"]
+    assert index._line_offsets == fresh._line_offsets and index._block_starts == fresh._block_starts
+    assert progress[-1] == 1.0
+
+
+def test_shorter_lines_are_indexed_from_scratch():
+    index = _indexed(LINES)
+    index.update(LINES[:2])
+
+    assert index.line_count == 2 and index._blocks == ["alpha\nBeta gamma"]
+
+
+def test_offsets_and_line_columns_round_trip():
+    index = _indexed(LINES)
+    text = "\n".join(LINES) + "\n"
+
+    for line, content in enumerate(LINES):
+        for col in range(len(content) + 1):
+            offset = index.offset(line, col)
+            assert text[offset : offset + 1] == (content + "\n")[col : col + 1]
+            assert index.line_col(offset) == (line, col)
+
+
+def test_find_wraps_around_in_both_directions():
+    index = _indexed(LINES)
+    text = "\n".join(LINES)
+    last_beta = text.rindex("beta")
+
+    assert index.find("beta", index.offset(3, 3)) == (index.offset(3, 6), 4)
+    assert index.find("beta", index.offset(3, 7)) == (last_beta, 4)  # BETA only matches with lower=True
+    assert index.find("beta", last_beta + 1) == (text.index("beta"), 4)  # wrapped to the start
+    assert index.find("beta", index.offset(0, 2), forward=False) == (last_beta, 4)  # wrapped to the end
+    assert _found(text, index.find("beta", 0, lower=True)) == "Beta"
+    assert _found(text.lower(), index.find(re.compile(r"b\w+ g"), 0, lower=True)) == "beta g"
+    assert index.find("missing", 0) is None
+    assert SearchIndex().find("beta", 0) is None
+
+
+def test_match_index_holds_every_match():
+    index = _indexed(LINES)
+    text = "\n".join(LINES)
+    matches = MatchIndex("beta", lower=True)
+    for starts, ends in find_all(index.blocks_from_line(0), "beta", lower=True):
+        matches.add(starts, ends)
+
+    assert [text[start:end] for start, end in matches.between(0, len(text))] == ["Beta", "beta", "BETA", "beta"]
+    assert matches.find(index.offset(3, 0)) == 1
+    assert matches.find(len(text)) == 0  # wrapped
+    matches.truncate(index.offset(5, 0))
+    assert len(matches) == 2
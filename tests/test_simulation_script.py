@@ -0,0 +1,53 @@
+from epicpy.epic.parallel_simulation import OutputSettings
+from epicpy.epic.simulation_script import create_sim_configs_from_script, load_simulation_script
+
+
+def _write_script(tmp_path, text: str):
+    (tmp_path / "device.py").write_text("")
+    for rule in ("a", "b", "c"):
+        (tmp_path / f"{rule}.prs").write_text("")
+    script_file = tmp_path / "script.toml"
+    script_file.write_text(text)
+    return load_simulation_script(script_file)
+
+
+def test_job_with_several_rules_keeps_its_own_data_when_clearing(tmp_path):
+    script = _write_script(
+        tmp_path,
+        """
+        [defaults]
+        device = "device.py"
+        params = "[Easy|Hard]"
+
+        [[jobs]]
+        name = "first"
+        rule = "a.prs"
+
+        [[jobs]]
+        name = "second"
+        rules = ["b.prs", "c.prs"]
+        after = ["first"]
+        clear_data = true
+        """,
+    )
+
+    sim_configs = create_sim_configs_from_script(script, OutputSettings())
+
+    kept = {(cfg.rule_file[-5:], cfg.parameter_string): cfg.keep_data for cfg in sim_configs}
+    assert kept == {
+        ("a.prs", "Easy"): False,
+        ("a.prs", "Hard"): False,
+        ("b.prs", "Easy"): True,
+        ("b.prs", "Hard"): True,
+        ("c.prs", "Easy"): True,
+        ("c.prs", "Hard"): True,
+    }
+
+
+def test_saved_device_output_settings(tmp_path):
+    (tmp_path / "my_device_config.json").write_text('{"trace_visual": true, "trace_device": false, "font_size": 12}')
+
+    settings = OutputSettings.from_saved_device_config(tmp_path / "my_device.py")
+
+    assert settings.trace_visual and not settings.trace_device
+    assert OutputSettings.from_saved_device_config(tmp_path / "other_device.py") == OutputSettings()
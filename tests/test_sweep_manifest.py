@@ -0,0 +1,90 @@
+from pathlib import Path
+
+from epicpy.epic.parallel_simulation import (
+    OutputSettings,
+    SimulationResult,
+    create_sim_configs_from_permutations,
+    run_parallel_simulations,
+)
+from epicpy.epic.sweep_manifest import SWEEP_DIR_NAME, SweepManifest, sweep_base_seed, sweep_job_hash
+
+
+def _replicated_sweep_job_hashes(sweep_dir) -> list[str]:
+    """Build the configs of a replicated sweep without a seed of its own, as the GUI and CLI do."""
+    sim_configs = create_sim_configs_from_permutations(
+        device_file="choice/choice_device.py",
+        rule_file="choice/rules/choice.prs",
+        base_param_string="[Easy|Hard] 10",
+        output_settings=OutputSettings(),
+        replications=3,
+        base_seed=sweep_base_seed(sweep_dir),
+    )
+    return [sweep_job_hash(cfg) for cfg in sim_configs]
+
+
+def test_replicated_sweep_builds_the_same_jobs_twice(tmp_path):
+    first = _replicated_sweep_job_hashes(tmp_path)
+    second = _replicated_sweep_job_hashes(tmp_path)
+
+    assert len(set(first)) == 6
+    assert first == second
+
+
+def test_base_seed_outlives_a_new_sweep(tmp_path):
+    first = _replicated_sweep_job_hashes(tmp_path)
+    SweepManifest(tmp_path, resume=False)  # a sweep that isn't resumed starts a fresh manifest
+
+    assert _replicated_sweep_job_hashes(tmp_path) == first
+
+
+def test_sweep_without_resume_keeps_no_manifest_in_the_device_folder(tmp_path):
+    run_parallel_simulations([], device_folder=tmp_path)
+
+    assert not (tmp_path / SWEEP_DIR_NAME).exists()
+
+
+def test_resumable_sweep_keeps_its_manifest_in_the_device_folder(tmp_path):
+    run_parallel_simulations([], device_folder=tmp_path, resume=True)
+
+    assert (tmp_path / SWEEP_DIR_NAME).is_dir()
+
+
+def _sweep_result(tmp_path, level: str, success: bool = True) -> SimulationResult:
+    (sim_config,) = create_sim_configs_from_permutations(
+        device_file=str(tmp_path / "device.py"),
+        rule_file=str(tmp_path / "rules.prs"),
+        base_param_string=level,
+        output_settings=OutputSettings(),
+    )
+    data_file = tmp_path / f"run_{level}.csv"
+    data_file.write_text("trial,rt\n1,350\n")
+    return SimulationResult(sim_config=sim_config, success=success, data_file=str(data_file))
+
+
+def test_resumed_sweep_skips_only_the_jobs_that_finished(tmp_path):
+    sweep_dir = tmp_path / SWEEP_DIR_NAME
+    manifest = SweepManifest(sweep_dir)
+    easy, hard = _sweep_result(tmp_path, "Easy"), _sweep_result(tmp_path, "Hard", success=False)
+    manifest.record(easy)
+    manifest.record(hard)
+    with open(manifest.path, "a", encoding="utf-8") as f:
+        f.write('{"job": "cut short by a cra')
+
+    resumed = SweepManifest(sweep_dir, resume=True)
+
+    entry = resumed.completed(easy.sim_config)
+    assert entry and Path(entry["data_file"]).parent == sweep_dir
+    assert resumed.completed(hard.sim_config) is None
+    Path(entry["data_file"]).unlink()
+    assert resumed.completed(easy.sim_config) is None  # its stored data is gone, so it runs again
+
+
+def test_record_after_a_truncated_line_starts_a_new_one(tmp_path):
+    manifest = SweepManifest(tmp_path)
+    with open(manifest.path, "a", encoding="utf-8") as f:
+        f.write('{"job": "cut short')
+    result = _sweep_result(tmp_path, "Easy")
+
+    manifest.record(result)
+
+    assert SweepManifest(tmp_path, resume=True).completed(result.sim_config)